@@ -16,6 +16,7 @@ from .resy_client.api_access import build_resy_client
 from .resy_client.errors import ResyApiError, ResyAuthError, ResyInvalidCredentialsError
 from .resy_client.models import AuthRequestBody, ResyConfig
 from .sentry_utils import with_sentry_trace
+from .utils import invalidate_credentials
 from .response_schemas import (
     success_response,
     error_response,
@@ -78,7 +79,7 @@ def authenticate_with_resy(email: str, password: str) -> dict:
         raise Exception("Invalid Resy login") from e
 
 @on_request(cors=CorsOptions(cors_origins="*", cors_methods=["POST"]))
-@with_sentry_trace
+@with_sentry_trace(read_body=True)
 def start_resy_onboarding(req: Request):
     """
     HTTP Cloud Function to authenticate and store Resy credentials
@@ -152,6 +153,7 @@ def start_resy_onboarding(req: Request):
 
         try:
             doc_ref.set(credentials)
+            invalidate_credentials(firebase_uid)
             logger.info("[ONBOARDING] Firestore write initiated for user %s", firebase_uid)
 
             # Verify the write succeeded by reading it back
@@ -277,6 +279,7 @@ def resy_account(req: Request):
                 'paymentMethodId': payment_method_id,
                 'updatedAt': gc_firestore.SERVER_TIMESTAMP
             })
+            invalidate_credentials(firebase_uid)
             
             logger.info("Updated payment method for Firebase user %s to %s", firebase_uid, payment_method_id)
             return success_response(
@@ -289,6 +292,7 @@ def resy_account(req: Request):
         if req.method == 'DELETE':
             # Delete credentials
             doc_ref.delete()
+            invalidate_credentials(firebase_uid)
             logger.info("Deleted Resy credentials for Firebase user %s", firebase_uid)
             return success_response(DisconnectData(message='Resy account disconnected'))
 
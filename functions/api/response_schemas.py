@@ -4,6 +4,8 @@ Using Pydantic models ensures compile-time validation of response structures.
 """
 from typing import Any, Dict, Generic, Optional, TypeVar
 
+import orjson
+from flask import Response
 from pydantic import BaseModel, Field, model_validator
 
 from .resy_client.models import PaymentMethod
@@ -382,3 +384,19 @@ def error_response(error: str, status_code: int = 500) -> tuple[Dict[str, Any],
     """
     response = ApiResponse(success=False, error=error)
     return response.model_dump(exclude_none=True), status_code
+
+
+def json_response(payload: Dict[str, Any], status_code: int = 200) -> Response:
+    """
+    Serialize a response dict with orjson into a ready-made Flask Response.
+
+    Returning bytes skips Flask's default JSON provider on the hot path.
+
+    Args:
+        payload: Response dict (typically from success_response/error_response)
+        status_code: HTTP status code (default 200)
+
+    Returns:
+        Flask Response with an application/json body
+    """
+    return Response(orjson.dumps(payload), status=status_code, mimetype="application/json")
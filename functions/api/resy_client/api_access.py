@@ -1,6 +1,7 @@
 import logging
 from typing import Dict, List, Optional
 
+import orjson
 from pydantic import ValidationError
 
 from .constants import ResyEndpoints
@@ -33,8 +34,9 @@ logger.setLevel("INFO")
 def _parse_json_or_raise(resp, model_class, endpoint: str):
     """Parse response JSON into Pydantic model; on ValidationError raise ResyApiError with body."""
     try:
-        data = resp.json()
-    except ValueError as e:
+        # orjson parses the raw bytes directly (faster than resp.json() on large search payloads)
+        data = orjson.loads(resp.content)
+    except orjson.JSONDecodeError as e:
         raise ResyApiError(
             f"Invalid JSON from {endpoint}: {e}",
             status_code=resp.status_code,
@@ -76,7 +78,7 @@ class ResyApiAccess:
             params={"query": query},
             timeout=REQUEST_TIMEOUT,
         )
-        data = resp.json()
+        data = orjson.loads(resp.content)
         results = []
         if "search" in data and "hits" in data["search"]:
             for hit in data["search"]["hits"]:
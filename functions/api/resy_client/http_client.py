@@ -4,11 +4,15 @@ Single point for request execution, error normalization, and logging.
 """
 
 import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import sentry_sdk
 import requests
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
 
 from .constants import RESY_BASE_URL
 from .errors import (
@@ -31,10 +35,28 @@ REDACT_KEYS = frozenset({"password", "email", "token", "book_token", "struct_pay
 # Max chars of response body to log on error
 ERROR_BODY_TRUNCATE = 500
 
+# Connection pool shared by every client session. Headers are per-user, so each
+# client still gets its own Session, but they all mount this adapter and reuse
+# warm keep-alive connections to api.resy.com instead of handshaking per client.
+# pool_maxsize covers the widest availability fan-out (10 workers) with headroom.
+# Pooling only: retries stay with the manager and _retry_resy, which already
+# handle ResyTransientError/RateLimitError, so nothing sleeps hidden in urllib3.
+_SHARED_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=0,
+)
+
+# Advertise every encoding urllib3 can decode (gzip/deflate, plus br when the
+# brotli package is installed). Search hit arrays compress very well, and
+# requests decompresses transparently before resp.content is read.
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
 
 def _build_session(config: ResyConfig) -> Session:
     """Build a requests.Session with Resy headers. Token may be empty for auth-only."""
     session = Session()
+    session.mount("https://", _SHARED_ADAPTER)
     token = config.token or ""
     headers = {
         "Authorization": config.get_authorization(),
@@ -45,6 +67,7 @@ def _build_session(config: ResyConfig) -> Session:
         "Referer": "https://resy.com/",
         "Referrer": "https://resy.com/",
         "Accept": "application/json, text/plain, */*",
+        "Accept-Encoding": ACCEPT_ENCODING,
         "User-Agent": (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -54,6 +77,23 @@ def _build_session(config: ResyConfig) -> Session:
     return session
 
 
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delay-seconds or an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
 def _redact_for_log(obj: dict | None) -> dict | None:
     """Return a copy of obj with sensitive values redacted for logging."""
     if obj is None:
@@ -93,6 +133,16 @@ class ResyHttpClient:
         session = _build_session(config)
         return cls(session)
 
+    def warm_up(self, timeout: tuple[int, int] = REQUEST_TIMEOUT) -> None:
+        """
+        Open a pooled connection to Resy (TCP + TLS) ahead of a time-critical call.
+        Best-effort: failures are logged and ignored; the real request will reconnect.
+        """
+        try:
+            self.session.head(RESY_BASE_URL, timeout=timeout)
+        except requests.RequestException as e:
+            logger.debug("Resy warm-up request failed: %s", e)
+
     def get(
         self,
         endpoint: str,
@@ -185,15 +235,14 @@ class ResyHttpClient:
                 raise
 
             span.set_tag("http.status_code", resp.status_code)
-            resp_body_preview = resp.text
-            if not resp.ok and resp_body_preview:
-                resp_body_preview = _truncate(resp_body_preview)
+            # Only decode the body for logging when it's an error; success bodies aren't logged
+            resp_body_preview = _truncate(resp.text) if not resp.ok else "(success)"
             logger.info(
                 "Resy response %s %s status=%s body=%s",
                 method,
                 endpoint,
                 resp.status_code,
-                resp_body_preview if not resp.ok else "(success)",
+                resp_body_preview,
             )
             span.set_status("ok" if resp.ok else "internal_error")
             return resp
@@ -254,15 +303,14 @@ class ResyHttpClient:
             span.set_tag("http.status_code", resp.status_code)
 
             # Log response (truncate body on error)
-            resp_body_preview = resp.text
-            if not resp.ok and resp_body_preview:
-                resp_body_preview = _truncate(resp_body_preview)
+            # Only decode the body for logging when it's an error; success bodies aren't logged
+            resp_body_preview = _truncate(resp.text) if not resp.ok else "(success)"
             logger.info(
                 "Resy response %s %s status=%s body=%s",
                 method,
                 endpoint,
                 resp.status_code,
-                resp_body_preview if not resp.ok else "(success)",
+                resp_body_preview,
             )
 
             if resp.ok:
@@ -276,7 +324,7 @@ class ResyHttpClient:
 
             if status == 429:
                 retry_after_header = resp.headers.get("Retry-After")
-                retry_after = float(retry_after_header) if retry_after_header else None
+                retry_after = _parse_retry_after(retry_after_header)
                 logger.warning(
                     "Resy rate limit (429) %s Retry-After=%s",
                     endpoint,
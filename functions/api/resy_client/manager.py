@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import time
 
 import logging
@@ -18,6 +18,7 @@ from .constants import (
     SECONDS_TO_WAIT_BETWEEN_RETRIES,
 )
 from .models import (
+    FindRequestBody,
     ResyConfig,
     ReservationRequest,
     TimedReservationRequest,
@@ -39,6 +40,11 @@ RATE_LIMIT_BASE_WAIT = .05  # Start with 50ms wait
 RATE_LIMIT_MAX_WAIT = 4.0   # Cap at 4 seconds (to not waste snipe window)
 RATE_LIMIT_MULTIPLIER = 2.0  # Double wait time each consecutive rate limit
 
+# Long-lived pool for parallel slot booking. Reused across retries (up to N_RETRIES per
+# snipe) instead of spinning up threads per attempt, and returning the winner never
+# waits on the other in-flight bookings to finish.
+_BOOKING_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="resy-book")
+
 
 class ResyManager:
     @classmethod
@@ -81,15 +87,15 @@ class ResyManager:
             raise NoSlotsError("No Slots Found")
 
         logger.info("Found %s slots", len(slots))
-        logger.info(slots)
+        logger.debug("Slots: %s", slots)
 
         selected_slot = self.selector.select(slots, reservation_request)
 
-        logger.info(selected_slot)
+        logger.debug("Selected slot: %s", selected_slot)
         details_request = build_get_slot_details_body(
             reservation_request, selected_slot
         )
-        logger.info(details_request)
+        logger.debug("Details request: %s", details_request)
         logger.info("Getting booking token for slot %s", selected_slot.date.start)
         token = self.api_access.get_booking_token(details_request)
         logger.info("Got booking token: %s", token)
@@ -132,12 +138,18 @@ class ResyManager:
         booking_request = build_book_request_body(token, self.config)
         return self.api_access.book_slot(booking_request)
 
-    def make_reservation_parallel(self, reservation_request: ReservationRequest, n_slots: int = 3) -> str:
+    def make_reservation_parallel(
+        self,
+        reservation_request: ReservationRequest,
+        n_slots: int = 3,
+        find_body: FindRequestBody | None = None,
+    ) -> str:
         """
         Find slots, then attempt to book top N candidates in parallel.
         First successful booking wins; others are abandoned.
+        Pass a prebuilt find_body to skip rebuilding it on every retry.
         """
-        body = build_find_request_body(reservation_request)
+        body = find_body or build_find_request_body(reservation_request)
         slots = self.api_access.find_booking_slots(body)
 
         if len(slots) == 0:
@@ -148,30 +160,38 @@ class ResyManager:
 
         # Get top N candidates
         top_slots = self.selector.select_top_n(slots, reservation_request, n=n_slots)
-        logger.info("Selected top %s slots for parallel booking: %s", len(top_slots), [s.date.start for s in top_slots])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Selected top %s slots for parallel booking: %s", len(top_slots), [s.date.start for s in top_slots]
+            )
 
         errors = []
 
-        # Use ThreadPoolExecutor to book in parallel
-        with ThreadPoolExecutor(max_workers=n_slots) as executor:
-            future_to_slot = {
-                executor.submit(self._try_book_slot, slot, reservation_request): slot
-                for slot in top_slots
-            }
-
-            for future in as_completed(future_to_slot):
+        # Book in parallel on the shared pool; network IO overlaps across the threads
+        future_to_slot = {
+            _BOOKING_EXECUTOR.submit(self._try_book_slot, slot, reservation_request): slot
+            for slot in top_slots
+        }
+
+        pending = set(future_to_slot)
+        while pending:
+            # Wake on each completion; the first success wins and the rest are abandoned
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
                 slot = future_to_slot[future]
                 try:
                     resy_token = future.result()
-                    logger.info("Successfully booked slot at %s!", slot.date.start)
-                    # Cancel remaining futures (best effort - they may already be running)
-                    for f in future_to_slot:
-                        f.cancel()
-                    return resy_token
                 except Exception as e:  # pylint: disable=broad-exception-caught
                     # Intentionally catching all exceptions from parallel futures
                     logger.warning("Failed to book slot at %s: %s", slot.date.start, e)
                     errors.append(e)
+                    continue
+                logger.info("Successfully booked slot at %s!", slot.date.start)
+                # Cancel attempts that haven't started; in-flight requests can't be
+                # interrupted, but nothing waits on them
+                for f in pending:
+                    f.cancel()
+                return resy_token
 
         # All attempts failed
         raise SlotTakenError(f"All {len(top_slots)} parallel booking attempts failed: {errors}")
@@ -188,19 +208,17 @@ class ResyManager:
 
             except NoSlotsError as e:
                 logger.info(
-                    "no slots (%s), retrying; currently %s",
+                    "no slots (%s), retrying",
                     str(e),
-                    datetime.now().isoformat(),
                 )
 
             except SlotTakenError:
                 if not self.config.retry_on_taken_slot:
                     raise
                 logger.info(
-                    "slot taken (attempt %s/%s), retrying; currently %s",
+                    "slot taken (attempt %s/%s), retrying",
                     attempt + 1,
                     self.retry_config.n_retries,
-                    datetime.now().isoformat(),
                 )
 
             except ResyTransientError as transient_err:
@@ -221,11 +239,10 @@ class ResyManager:
                 wait_time = rate_err.retry_after if rate_err.retry_after else rate_limit_wait
                 wait_time = min(wait_time, RATE_LIMIT_MAX_WAIT)
                 logger.warning(
-                    "Rate limited (attempt %s/%s), waiting %s s before retry; currently %s",
+                    "Rate limited (attempt %s/%s), waiting %s s before retry",
                     attempt + 1,
                     self.retry_config.n_retries,
                     wait_time,
-                    datetime.now().isoformat(),
                 )
                 time.sleep(wait_time)
                 rate_limit_wait = min(rate_limit_wait * RATE_LIMIT_MULTIPLIER, RATE_LIMIT_MAX_WAIT)
@@ -233,12 +250,11 @@ class ResyManager:
 
             except (Timeout, RequestsConnectionError) as net_err:
                 logger.warning(
-                    "Network error (attempt %s/%s): %s - %s, retrying; currently %s",
+                    "Network error (attempt %s/%s): %s - %s, retrying",
                     attempt + 1,
                     self.retry_config.n_retries,
                     type(net_err).__name__,
                     str(net_err),
-                    datetime.now().isoformat(),
                 )
 
         raise ExhaustedRetriesError(
@@ -252,26 +268,26 @@ class ResyManager:
         Like make_reservation_with_retries but uses parallel booking for each attempt.
         """
         rate_limit_wait = RATE_LIMIT_BASE_WAIT
+        # The /find request is the same on every attempt; validate it once
+        find_body = build_find_request_body(reservation_request)
 
         for attempt in range(self.retry_config.n_retries):
             try:
-                return self.make_reservation_parallel(reservation_request, n_slots=n_slots)
+                return self.make_reservation_parallel(reservation_request, n_slots=n_slots, find_body=find_body)
 
             except NoSlotsError as e:
                 logger.info(
-                    "no slots (%s), retrying; currently %s",
+                    "no slots (%s), retrying",
                     str(e),
-                    datetime.now().isoformat(),
                 )
 
             except SlotTakenError:
                 if not self.config.retry_on_taken_slot:
                     raise
                 logger.info(
-                    "all parallel slots taken (attempt %s/%s), retrying; currently %s",
+                    "all parallel slots taken (attempt %s/%s), retrying",
                     attempt + 1,
                     self.retry_config.n_retries,
-                    datetime.now().isoformat(),
                 )
 
             except ResyTransientError as transient_err:
@@ -293,11 +309,10 @@ class ResyManager:
                 wait_time = rate_err.retry_after if rate_err.retry_after else rate_limit_wait
                 wait_time = min(wait_time, RATE_LIMIT_MAX_WAIT)
                 logger.warning(
-                    "Rate limited (attempt %s/%s), waiting %s s before retry; currently %s",
+                    "Rate limited (attempt %s/%s), waiting %s s before retry",
                     attempt + 1,
                     self.retry_config.n_retries,
                     wait_time,
-                    datetime.now().isoformat(),
                 )
                 time.sleep(wait_time)
                 rate_limit_wait = min(rate_limit_wait * RATE_LIMIT_MULTIPLIER, RATE_LIMIT_MAX_WAIT)
@@ -305,12 +320,11 @@ class ResyManager:
 
             except (Timeout, RequestsConnectionError) as net_err:
                 logger.warning(
-                    "Network error (attempt %s/%s): %s - %s, retrying; currently %s",
+                    "Network error (attempt %s/%s): %s - %s, retrying",
                     attempt + 1,
                     self.retry_config.n_retries,
                     type(net_err).__name__,
                     str(net_err),
-                    datetime.now().isoformat(),
                 )
 
         raise ExhaustedRetriesError(
@@ -51,6 +51,16 @@ class TestResyHttpClientBuild:
         client = ResyHttpClient.build(resy_config)
         assert "Mozilla" in client.session.headers["User-Agent"]
         assert "Chrome" in client.session.headers["User-Agent"]
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+
+    def test_build_shares_connection_pool(self, resy_config):
+        """Separate clients should mount the same HTTPS adapter so connections are reused."""
+        first = ResyHttpClient.build(resy_config)
+        second = ResyHttpClient.build(resy_config)
+        assert first.session is not second.session
+        assert first.session.get_adapter("https://api.resy.com") is second.session.get_adapter(
+            "https://api.resy.com"
+        )
 
 
 class TestResyApiAccessBuild:
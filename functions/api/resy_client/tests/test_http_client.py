@@ -61,6 +61,22 @@ def test_get_429_raises_rate_limit_error(resy_config):
     assert "Too Many Requests" in (exc_info.value.response_body or "")
 
 
+@responses.activate
+def test_get_429_parses_http_date_retry_after(resy_config):
+    """Retry-After given as an HTTP-date is converted to a non-negative delay."""
+    responses.add(
+        responses.GET,
+        "https://api.resy.com/3/venue",
+        body="Too Many Requests",
+        status=429,
+        headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+    )
+    client = ResyHttpClient.build(resy_config)
+    with pytest.raises(RateLimitError) as exc_info:
+        client.get("/3/venue", params={"id": "123"})
+    assert exc_info.value.retry_after == 0.0
+
+
 @responses.activate
 def test_get_401_raises_auth_error(resy_config):
     """GET with 401 raises ResyAuthError."""
@@ -5,13 +5,19 @@ Handles creating Cloud Scheduler jobs for reservation sniping
 
 import os
 import json
+import queue
+import threading
+import time
 import datetime as dt
+import functools
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from zoneinfo import ZoneInfo
 
 from firebase_functions.https_fn import on_request, Request
 from firebase_functions.options import CorsOptions
 from firebase_admin import firestore
+from google.api_core.exceptions import NotFound
 
 from .sentry_utils import with_sentry_trace
 from .constants import (
@@ -21,11 +27,11 @@ from .constants import (
 from .response_schemas import (
     success_response,
     error_response,
+    json_response,
     JobCreatedData,
     JobUpdatedData,
     JobCancelledData,
 )
-from google.cloud.scheduler_v1 import CloudSchedulerClient, HttpMethod
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -36,6 +42,20 @@ LOCATION_ID = os.environ.get("LOCATION_ID", "us-central1")
 SNIPER_URL = os.environ.get("SNIPER_URL", "https://run-snipe-hypomglm7a-uc.a.run.app")
 DISCOVERY_SNIPER_URL = os.environ.get("DISCOVERY_SNIPER_URL", "https://us-central1-resybot-bd2db.cloudfunctions.net/run_discovery_snipe")
 
+# Coalescing window for concurrent create_snipe calls in one instance
+CREATE_BATCH_MAX_SIZE = 20
+CREATE_BATCH_MAX_WAIT_SECONDS = 0.05
+CREATE_BATCH_FLUSH_WORKERS = 4
+
+# Keep the Scheduler gRPC channel warm between invocations so a recycled
+# connection doesn't put a TLS handshake on the request path
+_GRPC_KEEPALIVE_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.keepalive_permit_without_calls", 1),
+]
+
 _db = None
 _scheduler_client = None
 
@@ -48,17 +68,70 @@ def get_db():
     return _db
 
 
+# google.cloud.scheduler_v1 is imported on first use: loading its proto
+# descriptors and gRPC stubs is a noticeable chunk of cold-start time
+
+def _create_keepalive_channel(*args, options=(), **kwargs):
+    """Channel factory for the Scheduler transport that layers keepalive onto its default options."""
+    from google.cloud.scheduler_v1.services.cloud_scheduler.transports import CloudSchedulerGrpcTransport
+
+    return CloudSchedulerGrpcTransport.create_channel(
+        *args, options=[*options, *_GRPC_KEEPALIVE_OPTIONS], **kwargs
+    )
+
+
 def get_scheduler_client():
     """Lazily get Cloud Scheduler client."""
     global _scheduler_client
     if _scheduler_client is None:
-        _scheduler_client = CloudSchedulerClient()
+        from google.cloud.scheduler_v1 import CloudSchedulerClient
+        from google.cloud.scheduler_v1.services.cloud_scheduler.transports import CloudSchedulerGrpcTransport
+
+        transport = CloudSchedulerGrpcTransport(channel=_create_keepalive_channel)
+        _scheduler_client = CloudSchedulerClient(transport=transport)
     return _scheduler_client
 
 
-def _create_scheduler_job(job_id: str, target_dt: dt.datetime, timezone: str = "America/New_York") -> dt.datetime:
+@functools.lru_cache(maxsize=None)
+def _http_target_template() -> dict:
+    """Static portion of every Cloud Scheduler HTTP target; per-job fields are patched in."""
+    from google.cloud.scheduler_v1 import HttpMethod
+
+    return {
+        "http_method": HttpMethod.POST,
+        "headers": {"Content-Type": "application/json"},
+    }
+
+
+def _build_scheduler_job(job_name: str, cron: str, timezone: str, uri: str, body: bytes) -> dict:
+    """Fill the shared HTTP target template with the per-job name, schedule, and body."""
+    return {
+        "name": job_name,
+        "schedule": cron,
+        "time_zone": timezone,
+        "http_target": {**_http_target_template(), "uri": uri, "body": body},
+    }
+
+
+def _scheduler_body(job_id: str, user_id: str = None) -> bytes:
+    """
+    JSON body Cloud Scheduler POSTs to the sniper. userId is included so the
+    sniper can fetch credentials concurrently with the job doc.
+    """
+    payload = {"jobId": job_id}
+    if user_id:
+        payload["userId"] = user_id
+    return json.dumps(payload).encode("utf-8")
+
+
+def _create_scheduler_job(
+    job_id: str,
+    target_dt: dt.datetime,
+    timezone: str = "America/New_York",
+    user_id: str = None,
+) -> dt.datetime:
     """
-    Create a Cloud Scheduler job that will POST {jobId} to run_snipe
+    Create a Cloud Scheduler job that will POST {jobId, userId} to run_snipe
     at the correct minute for target_dt.
 
     NOTE: Cloud Scheduler only supports minute-level cron, so we:
@@ -70,6 +143,7 @@ def _create_scheduler_job(job_id: str, target_dt: dt.datetime, timezone: str = "
         job_id: Unique identifier for the job
         target_dt: Target datetime for the snipe (in the specified timezone)
         timezone: IANA timezone string (e.g., "America/New_York", "America/Los_Angeles")
+        user_id: Owner of the job; lets run_snipe load credentials alongside the job doc
     
     Returns:
         The scheduled run time (datetime) from Cloud Scheduler
@@ -100,19 +174,10 @@ def _create_scheduler_job(job_id: str, target_dt: dt.datetime, timezone: str = "
     year = schedule_dt.year
     cron = f"{minute} {hour} {day} {month} *"
 
-    body = json.dumps({"jobId": job_id}).encode("utf-8")
+    body = _scheduler_body(job_id, user_id)
 
-    job = {
-        "name": job_name,
-        "schedule": cron,
-        "time_zone": timezone,  # Use the city's timezone
-        "http_target": {
-            "uri": SNIPER_URL,
-            "http_method": HttpMethod.POST,
-            "headers": {"Content-Type": "application/json"},
-            "body": body,
-        },
-    }
+    # Use the city's timezone
+    job = _build_scheduler_job(job_name, cron, timezone, SNIPER_URL, body)
 
     logger.info(f"[_create_scheduler_job] Creating job {job_id} with cron '{cron}' in timezone '{timezone}'")
     logger.info(f"[_create_scheduler_job] Expected to run on {year}-{month:02d}-{day:02d} at {hour:02d}:{minute:02d}")
@@ -163,9 +228,9 @@ def _delete_scheduler_job(job_id: str, is_discovery: bool = False):
     try:
         get_scheduler_client().delete_job(request={"name": job_name})
         logger.info("[_delete_scheduler_job] Deleted scheduler job: %s", job_name)
-    except Exception as e:
-        # Job might not exist, log but don't fail
-        logger.warning("[_delete_scheduler_job] Failed to delete scheduler job %s: %s", job_name, e)
+    except NotFound:
+        # Job already ran or was removed; nothing to delete
+        logger.info("[_delete_scheduler_job] Scheduler job already gone: %s", job_name)
 
 
 def _create_discovery_scheduler_job(
@@ -173,9 +238,10 @@ def _create_discovery_scheduler_job(
     target_dt: dt.datetime,
     timezone: str,
     window_before_minutes: int,
+    user_id: str = None,
 ) -> dt.datetime:
     """
-    Create a Cloud Scheduler job that POSTs {jobId} to run_discovery_snipe
+    Create a Cloud Scheduler job that POSTs {jobId, userId} to run_discovery_snipe
     at (target_dt - window_before_minutes) so the function starts at window start.
     """
     if not DISCOVERY_SNIPER_URL:
@@ -197,19 +263,9 @@ def _create_discovery_scheduler_job(
     day = schedule_dt.day
     month = schedule_dt.month
     cron = f"{minute} {hour} {day} {month} *"
-    body = json.dumps({"jobId": job_id}).encode("utf-8")
+    body = _scheduler_body(job_id, user_id)
 
-    job = {
-        "name": job_name,
-        "schedule": cron,
-        "time_zone": timezone,
-        "http_target": {
-            "uri": DISCOVERY_SNIPER_URL,
-            "http_method": HttpMethod.POST,
-            "headers": {"Content-Type": "application/json"},
-            "body": body,
-        },
-    }
+    job = _build_scheduler_job(job_name, cron, timezone, DISCOVERY_SNIPER_URL, body)
 
     logger.info(
         "[_create_discovery_scheduler_job] Creating discovery job %s at %s",
@@ -235,8 +291,116 @@ def _create_discovery_scheduler_job(
     return schedule_dt
 
 
+class _CreateSnipeBatcher:
+    """
+    Coalesce concurrent create_snipe calls into one Firestore batch commit.
+
+    Requests are buffered for up to CREATE_BATCH_MAX_WAIT_SECONDS (or until
+    CREATE_BATCH_MAX_SIZE are queued). The Cloud Scheduler jobs are created
+    concurrently while the job docs are written with a single WriteBatch, so
+    the flush takes max(commit, create_job) rather than their sum. Flushes
+    run on their own pool so the worker keeps collecting the next batch.
+    Each caller blocks on its own Future for the scheduled run time.
+    """
+
+    def __init__(self, max_size: int = CREATE_BATCH_MAX_SIZE, max_wait: float = CREATE_BATCH_MAX_WAIT_SECONDS):
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._flush_executor = ThreadPoolExecutor(
+            max_workers=CREATE_BATCH_FLUSH_WORKERS, thread_name_prefix="create-snipe-flush"
+        )
+
+    def submit(self, job_ref, job_data: dict, schedule_fn, cleanup_fn) -> Future:
+        """
+        Queue a job doc write plus its scheduler call; resolves to schedule_fn's result.
+
+        cleanup_fn is called to remove the scheduler job if the doc write fails.
+        """
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((job_ref, job_data, schedule_fn, cleanup_fn, future))
+        return future
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="create-snipe-batcher", daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            items = [self._queue.get()]
+            try:
+                deadline = time.monotonic() + self.max_wait
+                while len(items) < self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        items.append(self._queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                self._flush_executor.submit(self._flush, items)
+            except Exception as e:
+                # Never leave a collected caller waiting on a batch that won't run
+                self._fail(items, e)
+
+    def _flush(self, items: list):
+        try:
+            self._flush_batch(items)
+        except Exception as e:
+            self._fail(items, e)
+
+    @staticmethod
+    def _fail(items: list, error: Exception):
+        logger.error("[create_snipe] Batch flush failed: %s", error)
+        for *_, future in items:
+            if not future.done():
+                future.set_exception(error)
+
+    def _flush_batch(self, items: list):
+        with ThreadPoolExecutor(max_workers=len(items)) as executor:
+            scheduled = [executor.submit(schedule_fn) for _, _, schedule_fn, _, _ in items]
+
+            commit_error = None
+            try:
+                batch = get_db().batch()
+                for job_ref, job_data, _, _, _ in items:
+                    batch.set(job_ref, job_data)
+                batch.commit()
+                logger.info("[create_snipe] Committed %d job doc(s) in one batch", len(items))
+            except Exception as e:
+                commit_error = e
+
+            for (job_ref, _, _, cleanup_fn, future), schedule_future in zip(items, scheduled):
+                schedule_error = schedule_future.exception()
+                if commit_error is None and schedule_error is None:
+                    future.set_result(schedule_future.result())
+                    continue
+                if commit_error is not None and schedule_error is None:
+                    # Doc never landed; don't leave an orphaned scheduler job behind
+                    self._cleanup(cleanup_fn, "remove scheduler job after commit error")
+                elif commit_error is None:
+                    # No scheduler job, so don't leave a pending doc that will never run
+                    self._cleanup(job_ref.delete, "delete job doc after scheduler error")
+                future.set_exception(commit_error or schedule_error)
+
+    @staticmethod
+    def _cleanup(cleanup_fn, action: str):
+        try:
+            cleanup_fn()
+        except Exception as e:
+            logger.error("[create_snipe] Failed to %s: %s", action, e)
+
+
+_create_snipe_batcher = _CreateSnipeBatcher()
+
+
 @on_request(cors=CorsOptions(cors_origins="*", cors_methods=["POST"]))
-@with_sentry_trace
+@with_sentry_trace(read_body=True)
 def create_snipe(req: Request):
     """
     HTTP endpoint your frontend calls to schedule a snipe.
@@ -272,7 +436,7 @@ def create_snipe(req: Request):
         ]
         missing = [f for f in required_fields if f not in data]
         if missing:
-            return {"error": f"Missing fields: {', '.join(missing)}"}, 400
+            return json_response(*error_response(f"Missing fields: {', '.join(missing)}", 400))
 
         # Reservation date (when you actually want to eat there)
         date_str = data["date"]  # "YYYY-MM-DD"
@@ -294,14 +458,14 @@ def create_snipe(req: Request):
             tz_info = ZoneInfo(timezone)
 
         # Parse drop date string -> target datetime in the specified timezone
-        drop_year, drop_month, drop_day = map(int, drop_date_str.split("-"))
+        drop_date = dt.date.fromisoformat(drop_date_str)
         target_dt = dt.datetime(
-            drop_year, drop_month, drop_day, drop_hour, drop_minute,
+            drop_date.year, drop_date.month, drop_date.day, drop_hour, drop_minute,
             tzinfo=tz_info
         )
         
         # Extensive logging for debugging timezone issues
-        logger.info(f"[create_snipe] Parsed drop date: year={drop_year}, month={drop_month}, day={drop_day}")
+        logger.info(f"[create_snipe] Parsed drop date: {drop_date.isoformat()}")
         logger.info(f"[create_snipe] Drop time: {drop_hour}:{drop_minute:02d}")
         logger.info(f"[create_snipe] Using timezone: {timezone}")
         logger.info(f"[create_snipe] target_dt = {target_dt.isoformat()}")
@@ -313,9 +477,11 @@ def create_snipe(req: Request):
         
         if target_dt <= now_in_tz:
             logger.warning(f"[create_snipe] Rejected: target_dt ({target_dt.isoformat()}) <= now ({now_in_tz.isoformat()})")
-            return {
-                "error": f"Drop time must be in the future. Got {target_dt.isoformat()}, current time is {now_in_tz.isoformat()}"
-            }, 400
+            return json_response(*error_response(
+                f"Drop time must be in the future. Got {target_dt.isoformat()}, "
+                f"current time is {now_in_tz.isoformat()}",
+                400,
+            ))
         
         logger.info(f"[create_snipe] Validation passed: target is in the future")
 
@@ -346,6 +512,7 @@ def create_snipe(req: Request):
             "dropMinute": drop_minute,
             # Job/meta
             "status": "pending",
+            "targetTime": target_dt,
             "targetTimeIso": target_dt.isoformat(),
             "timezone": timezone,
             "createdAt": firestore.SERVER_TIMESTAMP,
@@ -359,41 +526,46 @@ def create_snipe(req: Request):
             "windowAfterMinutes": window_after,
         }
 
-        job_ref.set(job_data)
+        if discovery_mode:
+            schedule_fn = functools.partial(
+                _create_discovery_scheduler_job,
+                job_id,
+                target_dt,
+                timezone,
+                window_before,
+                user_id=job_data["userId"],
+            )
+        else:
+            schedule_fn = functools.partial(
+                _create_scheduler_job, job_id, target_dt, timezone, user_id=job_data["userId"]
+            )
+        cleanup_fn = functools.partial(_delete_scheduler_job, job_id, is_discovery=discovery_mode)
 
         try:
-            if discovery_mode:
-                scheduled_time = _create_discovery_scheduler_job(
-                    job_id, target_dt, timezone, window_before
-                )
-                logger.info(
-                    "[create_snipe] Successfully scheduled discovery job %s for %s",
-                    job_id,
-                    scheduled_time.isoformat(),
-                )
-            else:
-                scheduled_time = _create_scheduler_job(job_id, target_dt, timezone)
-                logger.info(
-                    "[create_snipe] Successfully scheduled job %s for %s",
-                    job_id,
-                    scheduled_time.isoformat(),
-                )
+            # Job doc is written in a shared batch while its scheduler job is created
+            # The batcher always resolves the future and undoes half-finished work on failure
+            scheduled_time = _create_snipe_batcher.submit(job_ref, job_data, schedule_fn, cleanup_fn).result()
+            logger.info(
+                "[create_snipe] Successfully scheduled %sjob %s for %s",
+                "discovery " if discovery_mode else "",
+                job_id,
+                scheduled_time.isoformat(),
+            )
         except ValueError as e:
-            # Scheduler validation failed (e.g., date mismatch) - delete the Firestore doc
+            # Scheduler validation failed (e.g., date mismatch); the batcher already deleted the doc
             logger.error(f"[create_snipe] Scheduler validation failed: {e}")
-            job_ref.delete()
-            return error_response(str(e), 400)
+            return json_response(*error_response(str(e), 400))
 
-        return success_response(
+        return json_response(success_response(
             JobCreatedData(
                 jobId=job_id,
                 targetTimeIso=job_data["targetTimeIso"],
             )
-        ), 200
+        ))
 
     except Exception as e:
         logger.error(f"[create_snipe] Unexpected error: {e}")
-        return error_response(str(e), 500)
+        return json_response(*error_response(str(e), 500))
 
 
 @on_request(cors=CorsOptions(cors_origins="*", cors_methods=["POST"]))
@@ -417,20 +589,20 @@ def update_snipe(req: Request):
         job_id = data.get("jobId")
         
         if not job_id:
-            return {"success": False, "error": "Missing jobId"}, 400
+            return json_response(*error_response("Missing jobId", 400))
         
         # Load existing job
         job_ref = get_db().collection("reservationJobs").document(job_id)
         job_snap = job_ref.get()
         
         if not job_snap.exists:
-            return {"success": False, "error": "Job not found"}, 404
+            return json_response(*error_response("Job not found", 404))
         
         existing_job = job_snap.to_dict()
         
         # Only allow updates to pending jobs
         if existing_job.get("status") != "pending":
-            return error_response("Can only update pending jobs", 400)
+            return json_response(*error_response("Can only update pending jobs", 400))
         
         # Build update dict with only provided fields
         updates = {}
@@ -490,54 +662,71 @@ def update_snipe(req: Request):
         if "dropMinute" in data:
             updates["dropMinute"] = drop_minute
         
-        # Recalculate target time if drop date/time/timezone changed
-        if "dropDate" in data or "dropHour" in data or "dropMinute" in data or "timezone" in data:
-            drop_year, drop_month, drop_day = map(int, drop_date_str.split("-"))
-            target_dt = dt.datetime(
-                drop_year, drop_month, drop_day, drop_hour, drop_minute,
-                tzinfo=tz_info
-            )
-            
-            # Validate that the new target time is in the future
-            now_in_tz = dt.datetime.now(tz_info)
-            if target_dt <= now_in_tz:
-                return {
-                    "success": False,
-                    "error": f"Drop time must be in the future. Got {target_dt.isoformat()}, current time is {now_in_tz.isoformat()}"
-                }, 400
-            
-            updates["targetTimeIso"] = target_dt.isoformat()
-        
-        # Update lastUpdate timestamp
-        updates["lastUpdate"] = firestore.SERVER_TIMESTAMP
-
         # Reschedule if drop/time/window or discovery mode changed
-        schedule_changed = (
+        drop_changed = (
             "dropDate" in data or "dropHour" in data or "dropMinute" in data
             or "timezone" in data
+        )
+        schedule_changed = (
+            drop_changed
             or "discoveryMode" in data
             or "windowBeforeMinutes" in data
             or "windowAfterMinutes" in data
         )
-        if schedule_changed:
-            is_discovery = data.get("discoveryMode", existing_job.get("discoveryMode", False))
-            _delete_scheduler_job(job_id, is_discovery=is_discovery)
 
-            drop_year, drop_month, drop_day = map(int, drop_date_str.split("-"))
+        # Build the target datetime once; it feeds both targetTimeIso and the scheduler job
+        target_dt = None
+        if schedule_changed:
+            drop_date = dt.date.fromisoformat(drop_date_str)
             target_dt = dt.datetime(
-                drop_year, drop_month, drop_day, drop_hour, drop_minute,
+                drop_date.year, drop_date.month, drop_date.day, drop_hour, drop_minute,
                 tzinfo=tz_info
             )
-            window_before = int(
-                data.get("windowBeforeMinutes", existing_job.get("windowBeforeMinutes", DISCOVERY_WINDOW_BEFORE_MINUTES))
+
+        # Recalculate target time if drop date/time/timezone changed
+        if drop_changed:
+            # Validate that the new target time is in the future
+            now_in_tz = dt.datetime.now(tz_info)
+            if target_dt <= now_in_tz:
+                return json_response(*error_response(
+                    f"Drop time must be in the future. Got {target_dt.isoformat()}, "
+                    f"current time is {now_in_tz.isoformat()}",
+                    400,
+                ))
+            
+            updates["targetTime"] = target_dt
+            updates["targetTimeIso"] = target_dt.isoformat()
+        
+        # Update lastUpdate timestamp (client-side; avoids a server transform)
+        updates["lastUpdate"] = dt.datetime.now(dt.timezone.utc)
+
+        if schedule_changed:
+            was_discovery = bool(existing_job.get("discoveryMode", False))
+            is_discovery = bool(data.get("discoveryMode", was_discovery))
+            existing_window_before = existing_job.get("windowBeforeMinutes", DISCOVERY_WINDOW_BEFORE_MINUTES)
+            window_before = int(data.get("windowBeforeMinutes", existing_window_before))
+
+            # Only touch Cloud Scheduler when the effective run time actually moves
+            schedule_changed = (
+                target_dt.isoformat() != existing_job.get("targetTimeIso")
+                or is_discovery != was_discovery
+                or (is_discovery and window_before != existing_window_before)
             )
+            if not schedule_changed:
+                logger.info("[update_snipe] Schedule unchanged for job %s, skipping reschedule", job_id)
+
+        if schedule_changed:
+            _delete_scheduler_job(job_id, is_discovery=was_discovery)
+
             try:
                 if is_discovery:
                     scheduled_time = _create_discovery_scheduler_job(
-                        job_id, target_dt, timezone, window_before
+                        job_id, target_dt, timezone, window_before, user_id=existing_job.get("userId")
                     )
                 else:
-                    scheduled_time = _create_scheduler_job(job_id, target_dt, timezone)
+                    scheduled_time = _create_scheduler_job(
+                        job_id, target_dt, timezone, user_id=existing_job.get("userId")
+                    )
                 logger.info(
                     "[update_snipe] Successfully rescheduled job %s for %s",
                     job_id,
@@ -545,7 +734,7 @@ def update_snipe(req: Request):
                 )
             except ValueError as e:
                 logger.error("[update_snipe] Scheduler validation failed: %s", e)
-                return error_response(str(e), 400)
+                return json_response(*error_response(str(e), 400))
         
         # Update Firestore document (only after scheduler job is successfully created)
         job_ref.update(updates)
@@ -554,16 +743,16 @@ def update_snipe(req: Request):
         updated_snap = job_ref.get()
         updated_job = updated_snap.to_dict()
         
-        return success_response(
+        return json_response(success_response(
             JobUpdatedData(
                 jobId=job_id,
                 targetTimeIso=updated_job.get("targetTimeIso"),
             )
-        ), 200
+        ))
         
     except Exception as e:
         logger.error(f"[update_snipe] Error: {e}")
-        return error_response(str(e), 500)
+        return json_response(*error_response(str(e), 500))
 
 
 @on_request(cors=CorsOptions(cors_origins="*", cors_methods=["POST"]))
@@ -585,20 +774,20 @@ def cancel_snipe(req: Request):
         job_id = data.get("jobId")
         
         if not job_id:
-            return error_response("Missing jobId", 400)
+            return json_response(*error_response("Missing jobId", 400))
         
         # Load existing job
         job_ref = get_db().collection("reservationJobs").document(job_id)
         job_snap = job_ref.get()
         
         if not job_snap.exists:
-            return error_response("Job not found", 404)
+            return json_response(*error_response("Job not found", 404))
         
         existing_job = job_snap.to_dict()
         
         # Only allow cancellation of pending jobs
         if existing_job.get("status") != "pending":
-            return error_response("Can only cancel pending jobs", 400)
+            return json_response(*error_response("Can only cancel pending jobs", 400))
 
         # Delete Cloud Scheduler job (discovery vs precise)
         _delete_scheduler_job(job_id, is_discovery=existing_job.get("discoveryMode", False))
@@ -606,11 +795,11 @@ def cancel_snipe(req: Request):
         # Update Firestore document status
         job_ref.update({
             "status": "cancelled",
-            "lastUpdate": firestore.SERVER_TIMESTAMP,
+            "lastUpdate": dt.datetime.now(dt.timezone.utc),
         })
         
-        return success_response(JobCancelledData(jobId=job_id)), 200
+        return json_response(success_response(JobCancelledData(jobId=job_id)))
         
     except Exception as e:
         logger.error(f"[cancel_snipe] Error: {e}")
-        return error_response(str(e), 500)
+        return json_response(*error_response(str(e), 500))
@@ -3,6 +3,7 @@ Search-related Cloud Functions for Resy Bot
 Handles restaurant search by name and by map bounding box
 """
 
+import functools
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -25,12 +26,68 @@ from .utils import (
     get_cached_search_results,
     save_search_results_to_cache,
     get_venue_availability,
+    ProgressBatcher,
+    run_single_flight,
     update_search_progress
 )
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Concurrent availability lookups per page; pacing comes from the shared Resy limiter
+AVAILABILITY_MAX_WORKERS = 10
+
+
+def _fetch_resy_page(client, body_template, page_num):
+    """Fetch one Resy search page, returning (hits, total)."""
+    body = body_template.model_copy(update={"page": page_num})
+    response = client.search_venues_advanced(body)
+    hits = response.search.get("hits", []) if response.search else []
+    total = response.meta.total if response.meta else 0
+    return hits, total
+
+
+# Background workers for next-page prefetch; the response never waits on these
+_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-prefetch")
+
+
+def _prefetch_next_page(cache_key, fetch_resy_page, filters, target_count):
+    """
+    Top up the cached search_map results for cache_key towards target_count.
+
+    Runs after the response has been sent, when the instance may be CPU
+    throttled, so it fetches at most one Resy page from the cursor stored
+    with the cached entry. It is not registered under the single-flight key:
+    a follow-up page request never waits on it and resumes from the cursor
+    itself if the prefetch has not landed yet.
+    """
+    cached = get_cached_search_results(cache_key)
+    if not cached or not cached.get('has_more') or not cached.get('cursor'):
+        return
+    results, total, cursor = cached['results'], cached['total'], cached['cursor']
+    if len(results) >= target_count:
+        return
+
+    try:
+        resume_cursor = {'page': cursor['page'], 'seen_ids': set(cursor['seen_ids'])}
+        new_results, new_total, more = fetch_until_enough_results(
+            fetch_resy_page,
+            target_count - len(results),
+            filters,
+            max_fetches=1,
+            cursor=resume_cursor,
+        )
+        # A page request may have extended the entry meanwhile; keep the longer one
+        current = get_cached_search_results(cache_key)
+        if current and len(current['results']) > len(results):
+            return
+        save_search_results_to_cache(
+            cache_key, results + new_results, new_total or total, has_more=more, cursor=resume_cursor
+        )
+        logger.debug("[MAP SEARCH] Prefetched one page towards %s for key %.8s...", target_count, cache_key)
+    except Exception as e:
+        logger.warning("[MAP SEARCH] Prefetch failed for key %.8s...: %s", cache_key, e)
+
 
 # TODO: Right now /search doesn't use job progress at all
 @on_request(cors=CorsOptions(cors_origins="*", cors_methods=["GET"]), timeout_sec=120, memory=MemoryOption.GB_1)
@@ -58,11 +115,14 @@ def search(req: Request):
         # Parse filters using helper function
         filters = parse_search_filters(req.args)
 
-        print(
-            f"[SEARCH] Raw params - query: '{query}', available_only: {filters['available_only']}, "
-            f"offset: {filters['offset']}, perPage: {filters['per_page']}"
+        logger.debug(
+            "[SEARCH] Raw params - query: '%s', available_only: %s, offset: %s, perPage: %s",
+            query, filters['available_only'], filters['offset'], filters['per_page'],
+        )
+        logger.debug(
+            "[SEARCH] Parsed filters - cuisines: %s, priceRanges: %s",
+            filters['cuisines'], filters['price_ranges'],
         )
-        print(f"[SEARCH] Parsed filters - cuisines: {filters['cuisines']}, priceRanges: {filters['price_ranges']}")
 
         # At least one filter must be provided
         if not query and not filters['cuisines'] and not filters['price_ranges']:
@@ -84,9 +144,9 @@ def search(req: Request):
             'lng': city_config['center']['lng'],
             'radius': city_config['radius']
         }
-        print(
-            f"[SEARCH] Using {city_config['name']} geo center: lat={geo_center['lat']}, "
-            f"lng={geo_center['lng']}, radius={geo_center['radius']}m"
+        logger.debug(
+            "[SEARCH] Using %s geo center: lat=%s, lng=%s, radius=%sm",
+            city_config['name'], geo_center['lat'], geo_center['lng'], geo_center['radius'],
         )
 
         # Build geo config for payload
@@ -96,14 +156,9 @@ def search(req: Request):
             "radius": geo_center['radius']
         }
 
-        # Create fetch function using resy_client
-        def fetch_resy_page(page_num):
-            payload = build_search_payload(query, filters, geo_config, page=page_num)
-            body = VenueSearchRequestBody(**payload)
-            response = client.search_venues_advanced(body)
-            hits = response.search.get("hits", []) if response.search else []
-            total = response.meta.total if response.meta else 0
-            return hits, total
+        # Create fetch function using resy_client; only the page number varies per call
+        body_template = VenueSearchRequestBody(**build_search_payload(query, filters, geo_config))
+        fetch_resy_page = functools.partial(_fetch_resy_page, client, body_template)
 
         # Fetch enough results to satisfy offset + perPage
         target_count = filters['offset'] + filters['per_page']
@@ -114,18 +169,16 @@ def search(req: Request):
             max_fetches=10
         )
 
-        print("[SEARCH] Sample result imageUrl:")
-        if all_results:
-            print(all_results[0]['imageUrl'])
+        if all_results and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SEARCH] Sample result imageUrl: %s", all_results[0]['imageUrl'])
 
         # Slice results based on offset
         results = all_results[filters['offset']:filters['offset'] + filters['per_page']]
 
-        print(
-            f"[SEARCH] Fetched {len(all_results)} total filtered results, "
-            f"returning {len(results)} for offset {filters['offset']}"
+        logger.info(
+            "[SEARCH] Fetched %d total filtered results, returning %d for offset %s (Resy total: %s)",
+            len(all_results), len(results), filters['offset'], total_resy_results,
         )
-        print(f"[SEARCH] Resy total (unfiltered): {total_resy_results}")
 
         # Calculate next offset
         next_offset = (
@@ -177,16 +230,20 @@ def search_map(req: Request):
     """
     start_time = time.time()
     job_id = None
+    progress = ProgressBatcher(None)
 
     try:
         user_id = req.args.get('userId')
         job_id = req.args.get('jobId')
+        # Page-level progress writes are throttled; started/done/error go out immediately
+        progress = ProgressBatcher(job_id, update_search_progress)
 
-        print(f"[MAP SEARCH] Received request with args: {req.args.to_dict()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[MAP SEARCH] Received request with args: %s", req.args.to_dict())
 
         # Initialize job progress if jobId provided
         if job_id:
-            update_search_progress(job_id, {
+            progress.update({
                 "status": "started",
                 "stage": "initializing",
                 "createdAt": gc_firestore.SERVER_TIMESTAMP,
@@ -205,13 +262,16 @@ def search_map(req: Request):
         # Parse filters using helper function
         filters = parse_search_filters(req.args)
 
-        print(f"[MAP SEARCH] Bounding box: SW({sw_lat}, {sw_lng}) to NE({ne_lat}, {ne_lng})")
-        print(
-            f"[MAP SEARCH] Params - query: '{query}', available_only: {filters['available_only']}, "
-            f"not_released_only: {filters.get('not_released_only', False)}, "
-            f"offset: {filters['offset']}, perPage: {filters['per_page']}"
+        logger.debug("[MAP SEARCH] Bounding box: SW(%s, %s) to NE(%s, %s)", sw_lat, sw_lng, ne_lat, ne_lng)
+        logger.debug(
+            "[MAP SEARCH] Params - query: '%s', available_only: %s, not_released_only: %s, offset: %s, perPage: %s",
+            query, filters['available_only'], filters.get('not_released_only', False),
+            filters['offset'], filters['per_page'],
+        )
+        logger.debug(
+            "[MAP SEARCH] Parsed filters - cuisines: %s, priceRanges: %s",
+            filters['cuisines'], filters['price_ranges'],
         )
-        print(f"[MAP SEARCH] Parsed filters - cuisines: {filters['cuisines']}, priceRanges: {filters['price_ranges']}")
 
         # Load credentials and build Resy client
         config = load_credentials(user_id)
@@ -237,16 +297,16 @@ def search_map(req: Request):
         )
 
         if should_fetch_availability:
-            print(
-                f"[MAP SEARCH] Will fetch availability for date: {filters['available_day']}, "
-                f"party size: {filters['available_party_size']}"
+            logger.debug(
+                "[MAP SEARCH] Will fetch availability for date: %s, party size: %s",
+                filters['available_day'], filters['available_party_size'],
             )
 
         if paginate_over_filtered:
-            print(
-                f"[MAP SEARCH] Paginating over availability-filtered results "
-                f"(available_only={filters.get('available_only')}, "
-                f"not_released_only={filters.get('not_released_only')})"
+            logger.debug(
+                "[MAP SEARCH] Paginating over availability-filtered results "
+                "(available_only=%s, not_released_only=%s)",
+                filters.get('available_only'), filters.get('not_released_only'),
             )
 
         # Generate cache key
@@ -261,34 +321,43 @@ def search_map(req: Request):
         all_results = []
         total_resy_results = 0
         has_more = False
+        cursor = None
 
         if cached_data:
             cached_count = len(cached_data['results'])
             required_count = filters['offset'] + filters['per_page']
 
-            if cached_count >= required_count:
-                # Cache has enough results for this page
+            if cached_count >= required_count or not cached_data.get('has_more'):
+                # Cache has enough results for this page (or Resy has nothing more to give)
                 all_results = cached_data['results']
                 total_resy_results = cached_data['total']
-                has_more = False  # Cached results are complete
+                has_more = cached_data.get('has_more', False)
                 need_fetch = False
-                print(f"[MAP SEARCH] Using cached results ({len(all_results)} results, need {required_count})")
+                logger.info("[MAP SEARCH] Using cached results (%d results, need %d)", len(all_results), required_count)
+            elif cached_data.get('cursor'):
+                # Resume from the last fetched Resy page instead of starting over at page 1
+                all_results = cached_data['results']
+                total_resy_results = cached_data['total']
+                cached_cursor = cached_data['cursor']
+                cursor = {'page': cached_cursor['page'], 'seen_ids': set(cached_cursor['seen_ids'])}
+                logger.info(
+                    "[MAP SEARCH] Cache insufficient (%d cached, need %d), resuming at Resy page %s",
+                    cached_count, required_count, cursor['page'],
+                )
             else:
                 # Cache doesn't have enough, need to fetch more
-                print(f"[MAP SEARCH] Cache insufficient ({cached_count} cached, need {required_count}), fetching more")
+                logger.info(
+                    "[MAP SEARCH] Cache insufficient (%d cached, need %d), fetching more",
+                    cached_count, required_count,
+                )
+
+        # Create fetch function using resy_client; only the page number varies per call
+        body_template = VenueSearchRequestBody(**build_search_payload(query, filters, geo_config))
+        fetch_resy_page = functools.partial(_fetch_resy_page, client, body_template)
 
         if need_fetch:
             # Cache miss - fetch from API
-            print("[MAP SEARCH] Cache miss - fetching from Resy API")
-
-            # Create fetch function using resy_client
-            def fetch_resy_page(page_num):
-                payload = build_search_payload(query, filters, geo_config, page=page_num)
-                body = VenueSearchRequestBody(**payload)
-                response = client.search_venues_advanced(body)
-                hits = response.search.get("hits", []) if response.search else []
-                total = response.meta.total if response.meta else 0
-                return hits, total
+            logger.info("[MAP SEARCH] Cache miss - fetching from Resy API")
 
             # Fetch enough results
             # When paginating over filtered results, we need to fetch with availability
@@ -297,24 +366,49 @@ def search_map(req: Request):
 
             # For availability-filtered pagination, limit max_fetches since each page
             # requires availability API calls (slower). Users can paginate for more.
+            # Plain searches request pages a few at a time in parallel; availability-filtered
+            # ones stay sequential since each page already fans out availability calls, but
+            # prefetch the next page while the current one's availability is checked.
             if paginate_over_filtered:
                 max_fetches = 4
-                print(f"[MAP SEARCH] Fetching with availability filtering (max_fetches={max_fetches})")
+                batch_size = 1
+                logger.debug("[MAP SEARCH] Fetching with availability filtering (max_fetches=%d)", max_fetches)
             else:
                 max_fetches = 10
-
-            all_results, total_resy_results, has_more = fetch_until_enough_results(
-                fetch_resy_page,
-                target_count,
-                filters,
-                max_fetches=max_fetches,
-                config=config,
-                fetch_availability=paginate_over_filtered,  # Fetch availability when filtering by it
-                job_id=job_id
+                batch_size = 3
+
+            if cursor is None:
+                all_results = []
+                cursor = {'page': 1, 'seen_ids': set()}
+
+            def fetch_and_cache():
+                new_results, new_total, more = fetch_until_enough_results(
+                    fetch_resy_page,
+                    target_count - len(all_results),
+                    filters,
+                    max_fetches=max_fetches,
+                    config=config,
+                    fetch_availability=paginate_over_filtered,  # Fetch availability when filtering by it
+                    progress=progress,
+                    batch_size=batch_size,
+                    cursor=cursor,
+                    prefetch=paginate_over_filtered,
+                )
+                merged = all_results + new_results
+                total = new_total or total_resy_results
+
+                # Save to cache
+                save_search_results_to_cache(cache_key, merged, total, has_more=more, cursor=cursor)
+                return merged, total, more
+
+            # Identical concurrent searches on this instance share a single Resy fetch
+            all_results, total_resy_results, has_more = run_single_flight(
+                f"{cache_key}:{target_count}", fetch_and_cache
             )
 
-            # Save to cache
-            save_search_results_to_cache(cache_key, all_results, total_resy_results)
+        # Copy out just the requested window; both pagination modes serve the same slice
+        page_end = filters['offset'] + filters['per_page']
+        results = all_results[filters['offset']:page_end]
 
         # Handle pagination based on whether we're filtering by availability
         if paginate_over_filtered:
@@ -323,10 +417,7 @@ def search_map(req: Request):
             # all_results is already filtered by available_only/not_released_only
             # and each result has availableTimes/availabilityStatus populated
             # ========================================================================
-            print(f"[MAP SEARCH] Paginating over {len(all_results)} availability-filtered results")
-
-            # Simply slice the already-filtered results
-            results = all_results[filters['offset']:filters['offset'] + filters['per_page']]
+            logger.debug("[MAP SEARCH] Paginating over %d availability-filtered results", len(all_results))
 
             # Calculate pagination based on the filtered list
             filtered_total = len(all_results)
@@ -346,9 +437,9 @@ def search_map(req: Request):
             display_total = None
             is_filtered_pagination = True
 
-            print(
-                f"[MAP SEARCH] Returning {len(results)} results for offset {filters['offset']} "
-                f"(filtered_total={filtered_total}, has_more={has_more})"
+            logger.info(
+                "[MAP SEARCH] Returning %d results for offset %s (filtered_total=%d, has_more=%s)",
+                len(results), filters['offset'], filtered_total, has_more,
             )
 
         else:
@@ -358,16 +449,17 @@ def search_map(req: Request):
             # ========================================================================
             is_filtered_pagination = False
 
-            # Slice results based on offset to get current page
-            results = all_results[filters['offset']:filters['offset'] + filters['per_page']]
-
             # Now fetch availability ONLY for the current page results (in parallel)
             if should_fetch_availability and results:
-                print(f"[MAP SEARCH] Fetching availability for {len(results)} restaurants on current page (parallel)")
+                logger.debug(
+                    "[MAP SEARCH] Fetching availability for %d restaurants on current page (parallel)", len(results)
+                )
 
                 # Use ThreadPoolExecutor to fetch availability in parallel
-                # Max 3 concurrent workers to avoid rate limiting (Resy has strict rate limits)
-                with ThreadPoolExecutor(max_workers=3) as executor:
+                # Resy's rate limit is enforced by the shared limiter in get_venue_availability,
+                # so workers only bound concurrency (and stay within the HTTP pool size)
+                # Workers share this request's client instead of building one per venue
+                with ThreadPoolExecutor(max_workers=min(len(results), AVAILABILITY_MAX_WORKERS)) as executor:
                     # Submit all availability fetch tasks
                     future_to_result = {
                         executor.submit(
@@ -375,7 +467,8 @@ def search_map(req: Request):
                             result['id'],
                             filters['available_day'],
                             filters['available_party_size'],
-                            config
+                            config,
+                            client,
                         ): result
                         for result in results
                     }
@@ -392,27 +485,31 @@ def search_map(req: Request):
                             elif availability_data['status']:
                                 result['availabilityStatus'] = availability_data['status']
                         except Exception as e:
-                            print(f"[AVAILABILITY] Error in parallel fetch for venue {result['id']}: {str(e)}")
+                            logger.warning("[AVAILABILITY] Error in parallel fetch for venue %s: %s", result['id'], e)
                             result['availabilityStatus'] = 'Unable to fetch'
 
-            print(
-                f"[MAP SEARCH] Returning {len(results)} results for offset {filters['offset']} "
-                f"(have {len(all_results)} total cached)"
+            logger.info(
+                "[MAP SEARCH] Returning %d results for offset %s (have %d total cached, Resy total: %s)",
+                len(results), filters['offset'], len(all_results), total_resy_results,
             )
-            print(f"[MAP SEARCH] Resy total (unfiltered): {total_resy_results}")
 
             # For normal search: show next if there are more results in cache or API
             next_offset = (
                 filters['offset'] + len(results)
-                if (len(all_results) > filters['offset'] + filters['per_page'] or has_more)
+                if (len(all_results) > page_end or has_more)
                 else None
             )
             display_total = total_resy_results
 
+            # Warm the cache for the next page while the user reads this one
+            next_target = filters['offset'] + 2 * filters['per_page']
+            if has_more and len(all_results) < next_target:
+                _prefetch_executor.submit(_prefetch_next_page, cache_key, fetch_resy_page, filters, next_target)
+
         # Mark job as done
         if job_id:
             duration_ms = int((time.time() - start_time) * 1000)
-            update_search_progress(job_id, {
+            progress.update({
                 "status": "done",
                 "stage": "complete",
                 "filteredCount": len(all_results),
@@ -447,7 +544,7 @@ def search_map(req: Request):
         # Mark job as error
         if job_id:
             duration_ms = int((time.time() - start_time) * 1000)
-            update_search_progress(job_id, {
+            progress.update({
                 "status": "error",
                 "error": str(e),
                 "durationMs": duration_ms,
@@ -5,80 +5,143 @@ Provides decorator to continue traces from frontend requests
 
 import functools
 import logging
+import random
 from typing import Callable, Any
 
+import orjson
 import sentry_sdk
 from firebase_functions.https_fn import Request
 
 logger = logging.getLogger(__name__)
 
 
-def with_sentry_trace(func: Callable) -> Callable:
+def _parse_sentry_trace(header: str | None) -> tuple[str | None, str | None, bool | None]:
+    """Split a sentry-trace header (trace_id-parent_span_id-sampled) into its parts."""
+    if not header:
+        return None, None, None
+    # Example: "566e3688ebcd4638ad8b8f0cdee66e5b-566e3688ebcd4638-1"
+    parts = header.split("-")
+    if len(parts) < 2:
+        return None, None, None
+    sampled = parts[2] == "1" if len(parts) >= 3 else None
+    return parts[0], parts[1], sampled
+
+
+def _local_sample_decision() -> bool | None:
+    """
+    Make the sampling decision for requests that arrive without one.
+
+    Mirrors the SDK's traces_sample_rate roll so unsampled requests can skip the
+    transaction entirely. Returns None to defer to a configured traces_sampler.
+    """
+    client = sentry_sdk.get_client()
+    if not client.is_active():
+        return False
+    if client.options.get("traces_sampler") is not None:
+        return None
+    rate = client.options.get("traces_sample_rate")
+    if not rate:
+        return False
+    return rate >= 1.0 or random.random() < rate
+
+
+def _extract_user_id(req: Request, read_body: bool) -> str | None:
+    """Read userId from the query string, falling back to the JSON body when allowed."""
+    try:
+        user_id = req.args.get("userId")
+        if not user_id and read_body:
+            # cache=True keeps the raw body around for the handler's own get_json().
+            # A byte scan is far cheaper than decoding bodies that have no userId.
+            raw = req.get_data(cache=True)
+            if b'"userId"' in raw:
+                body = orjson.loads(raw)
+                if isinstance(body, dict):
+                    user_id = body.get("userId")
+        return user_id
+    except Exception:
+        return None
+
+
+def with_sentry_trace(func: Callable | None = None, *, read_body: bool = False) -> Callable:
     """
     Decorator to wrap Cloud Functions with Sentry distributed tracing.
     
     Extracts sentry-trace and baggage headers from incoming requests to continue
     the trace from the frontend. Creates a transaction that is a child of the
-    frontend trace.
+    frontend trace. Unsampled requests (per the incoming header, or the local
+    traces_sample_rate when there is none) skip the transaction, but still run
+    in their own scope that continues the incoming trace and carries the user
+    tag, so captured exceptions stay linked to the frontend trace.
+    
+    userId is read from the query string. Endpoints that only receive it in the
+    JSON body opt in with read_body=True.
     
     Usage:
         @on_request(cors=CorsOptions(...))
         @with_sentry_trace
         def my_endpoint(req: Request):
             ...
+
+        @on_request(cors=CorsOptions(...))
+        @with_sentry_trace(read_body=True)
+        def my_post_endpoint(req: Request):
+            ...
     """
+    if func is None:
+        return functools.partial(with_sentry_trace, read_body=read_body)
+
+    # Per-endpoint constants, computed once at decoration time
+    endpoint_name = func.__name__
+    route = f"/{endpoint_name}"
+
     @functools.wraps(func)
     def wrapper(req: Request, *args: Any, **kwargs: Any) -> Any:
-        # Extract trace headers from incoming request
-        sentry_trace_header = req.headers.get("sentry-trace")
+        trace_id, parent_span_id, sampled = _parse_sentry_trace(req.headers.get("sentry-trace"))
+        if sampled is None:
+            sampled = _local_sample_decision()
+
+        if sampled is False:
+            # Unsampled (by the frontend or locally); don't build a transaction nobody will see
+            with sentry_sdk.isolation_scope():
+                incoming = {
+                    "sentry-trace": req.headers.get("sentry-trace"),
+                    "baggage": req.headers.get("baggage"),
+                }
+                if trace_id:
+                    sentry_sdk.continue_trace({key: value for key, value in incoming.items() if value})
+                user_id = _extract_user_id(req, read_body)
+                if user_id:
+                    sentry_sdk.set_tag("userId", user_id)
+                    sentry_sdk.set_user({"id": user_id})
+                try:
+                    return func(req, *args, **kwargs)
+                except Exception as e:
+                    if not isinstance(e, ValueError):
+                        sentry_sdk.capture_exception(e)
+                    raise
+
+        if trace_id:
+            logger.debug(
+                "Continuing trace: trace_id=%s, parent_span_id=%s, sampled=%s",
+                trace_id,
+                parent_span_id,
+                sampled,
+            )
+
         baggage_header = req.headers.get("baggage")
-        
-        # Get endpoint name from function name
-        endpoint_name = func.__name__
-        
-        # Extract userId from query params or body for tagging
-        user_id = None
-        try:
-            user_id = req.args.get("userId")
-            if not user_id:
-                # Try to get from JSON body
-                body = req.get_json(silent=True) or {}
-                user_id = body.get("userId")
-        except Exception:
-            pass
-        
-        # Parse sentry-trace header to continue trace from frontend
-        trace_id = None
-        parent_span_id = None
-        sampled = None
-        
-        if sentry_trace_header:
-            # Parse sentry-trace header format: trace_id-parent_span_id-sampled
-            # Example: "566e3688ebcd4638ad8b8f0cdee66e5b-566e3688ebcd4638-1"
-            parts = sentry_trace_header.split("-")
-            if len(parts) >= 2:
-                trace_id = parts[0]
-                parent_span_id = parts[1]
-                if len(parts) >= 3:
-                    sampled = parts[2] == "1"
-                logger.debug(
-                    "Continuing trace: trace_id=%s, parent_span_id=%s, sampled=%s",
-                    trace_id,
-                    parent_span_id,
-                    sampled,
-                )
+        user_id = _extract_user_id(req, read_body)
         
         # Start a transaction that continues the frontend trace
         with sentry_sdk.start_transaction(
             op="http.server",
-            name=f"{req.method} /{endpoint_name}",
+            name=f"{req.method} {route}",
             trace_id=trace_id,
             parent_span_id=parent_span_id,
             sampled=sampled,
         ) as transaction:
             # Set transaction context
             transaction.set_tag("http.method", req.method)
-            transaction.set_tag("http.route", f"/{endpoint_name}")
+            transaction.set_tag("http.route", route)
             transaction.set_tag("endpoint", endpoint_name)
             
             if user_id:
@@ -94,9 +157,15 @@ def with_sentry_trace(func: Callable) -> Callable:
                 result = func(req, *args, **kwargs)
                 
                 # Set status based on result
+                status_code = None
                 if isinstance(result, tuple) and len(result) == 2:
                     # Response tuple: (data, status_code)
                     status_code = result[1]
+                elif hasattr(result, "status_code"):
+                    # Pre-serialized Response object
+                    status_code = result.status_code
+
+                if status_code is not None:
                     transaction.set_tag("http.status_code", status_code)
                     if status_code >= 400:
                         transaction.set_status("internal_error" if status_code >= 500 else "invalid_argument")
@@ -3,18 +3,22 @@ Sniper Cloud Function for Resy Bot
 Handles the actual reservation sniping at precise drop times
 """
 
+import functools
+import random
+import threading
 import time
 import datetime as dt
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 from firebase_functions.https_fn import on_request, Request
 from firebase_functions.options import CorsOptions, MemoryOption
-from firebase_admin import firestore
 from google.cloud import firestore as gc_firestore
 
 from .sentry_utils import with_sentry_trace
-from .resy_client.models import ResyConfig, ReservationRequest
+from .resy_client.models import FindRequestBody, ResyConfig, ReservationRequest
 from .resy_client.manager import ResyManager
 from .resy_client.model_builders import build_find_request_body
 from .resy_client.errors import RateLimitError, ResyAuthError
@@ -28,7 +32,7 @@ from .constants import (
     DISCOVERY_OBSERVATIONS_CAP,
     DISCOVERY_RATE_LIMIT_BACKOFF_MULTIPLIER,
 )
-from .utils import load_credentials, gemini_client
+from .utils import get_firestore_client, invalidate_credentials, load_credentials, gemini_client
 from .response_schemas import (
     success_response,
     error_response,
@@ -39,15 +43,54 @@ from .response_schemas import (
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-_db = None  # private global
+
+# Seconds before the drop to open the Resy connection (late enough that keep-alive holds)
+WARM_UP_LEAD_SECONDS = 2.0
+WARM_UP_LEAD_NS = int(WARM_UP_LEAD_SECONDS * 1e9)
+# (connect, read) timeout for the warm-up request; it must finish well inside the lead
+WARM_UP_TIMEOUT = (1, 1)
+# Final stretch before a precise wake-up that is busy-waited instead of slept
+SPIN_WAIT_SECONDS = 0.005
+SPIN_WAIT_NS = int(SPIN_WAIT_SECONDS * 1e9)
+# Jittered pause between booking retries after non-rate-limit errors
+RETRY_BACKOFF_MIN_SECONDS = 0.02
+RETRY_BACKOFF_MAX_SECONDS = 0.05
+# Bounds on the executionLogs written to the job document
+EXECUTION_LOGS_MAX_ENTRIES = 20
+EXECUTION_LOGS_HEAD_ENTRIES = 5
+EXECUTION_LOG_MESSAGE_MAX_CHARS = 500
 
 
 def get_db():
-    """Lazily get Firestore client so we don't require ADC at import time."""
-    global _db
-    if _db is None:
-        _db = firestore.client()
-    return _db
+    """
+    Shared Firestore client: the same instance (and gRPC channel) the search and
+    progress helpers use, still built lazily so we don't require ADC at import time.
+    """
+    return get_firestore_client()
+
+
+@functools.lru_cache(maxsize=64)
+def _build_resy_config(
+    api_key: str,
+    token: str,
+    payment_method_id: Optional[int],
+    email: Optional[str],
+    password: Optional[str],
+) -> ResyConfig:
+    """
+    Build (and memoize) the ResyConfig for one set of credentials so warm
+    instances skip pydantic validation for repeat users. A rotated token is
+    a new key, so stale configs are never reused.
+    """
+    # Explicitly set retry_on_taken_slot to True for now
+    return ResyConfig(
+        api_key=api_key,
+        token=token,
+        payment_method_id=payment_method_id,
+        email=email,
+        password=password,
+        retry_on_taken_slot=True,
+    )
 
 
 def _build_reservation_request_from_dict(data: dict, user_id: str = None) -> tuple[ReservationRequest, ResyManager]:
@@ -57,8 +100,13 @@ def _build_reservation_request_from_dict(data: dict, user_id: str = None) -> tup
     """
     # Load credentials (from Firestore if userId provided, else from credentials.json)
     credentials = load_credentials(user_id)
-    # Explicitly set retry_on_taken_slot to True for now
-    config = ResyConfig(**credentials, retry_on_taken_slot=True)
+    config = _build_resy_config(
+        credentials.get("api_key"),
+        credentials.get("token"),
+        credentials.get("payment_method_id"),
+        credentials.get("email"),
+        credentials.get("password"),
+    )
 
     reservation_data = {
         "party_size": int(data["partySize"]),
@@ -93,13 +141,13 @@ def _get_adaptive_interval(now: dt.datetime, expected_drop_time: dt.datetime) ->
     return DISCOVERY_POLL_LATE_SECONDS
 
 
-def _check_slots_for_job(job_data: dict, user_id: str = None) -> tuple[int, Optional[Exception]]:
+def _check_slots_for_job(
+    find_body: FindRequestBody, manager: ResyManager
+) -> tuple[int, Optional[Exception]]:
     """
     Call Resy /4/find for the job's venue/date/party_size. Returns (slot_count, error).
     """
     try:
-        reservation_request, manager = _build_reservation_request_from_dict(job_data, user_id)
-        find_body = build_find_request_body(reservation_request)
         slots = manager.api_access.find_booking_slots(find_body)
         return (len(slots), None)
     except Exception as e:
@@ -156,13 +204,61 @@ def _write_drop_time_to_venue(
     )
 
 
-def _make_reservation_for_job(job_data: dict, user_id: str = None, use_parallel: bool = True) -> str:
+def _record_drop_discovery(
+    job_ref,
+    venue_id: str,
+    job_id: str,
+    expected_drop_time: dt.datetime,
+    actual_drop_time: dt.datetime,
+    poll_log: list,
+    execution_logs: list,
+) -> None:
+    """Write the discovered drop time to the venue and the job's progress so far."""
+    _write_drop_time_to_venue(venue_id, job_id, expected_drop_time, actual_drop_time)
+    job_ref.update({
+        "discoveredDropTime": actual_drop_time.isoformat(),
+        "pollLog": poll_log,
+        "executionLogs": _serialize_execution_logs(execution_logs),
+        "lastUpdate": gc_firestore.SERVER_TIMESTAMP,
+    })
+
+
+def _start_warm_up(manager: ResyManager) -> threading.Event:
+    """Warm the manager's Resy connection on a background thread; the event is set when done."""
+    warmed = threading.Event()
+
+    def warm_up():
+        try:
+            manager.api_access.client.warm_up(timeout=WARM_UP_TIMEOUT)
+        finally:
+            warmed.set()
+
+    threading.Thread(target=warm_up, name="resy-warm-up", daemon=True).start()
+    return warmed
+
+
+def _sleep_until(deadline_ns: int) -> None:
     """
-    Execute the reservation attempt using job_data stored in Firestore.
+    Block until time.perf_counter_ns() reaches deadline_ns.
+
+    time.sleep can overshoot by a few ms, so sleep coarsely until SPIN_WAIT_SECONDS
+    before the deadline and spin for the rest. The spin burns at most that much CPU.
+    """
+    coarse_ns = deadline_ns - time.perf_counter_ns() - SPIN_WAIT_NS
+    if coarse_ns > 0:
+        time.sleep(coarse_ns / 1e9)
+    while time.perf_counter_ns() < deadline_ns:
+        pass
+
+
+def _make_reservation(
+    reservation_request: ReservationRequest, manager: ResyManager, use_parallel: bool = True
+) -> str:
+    """
+    Execute one reservation attempt with a prebuilt request and manager.
     Returns the resy_token (or raises on error).
     """
-    logger.info("[snipe] Starting reservation for job %s at %s", job_data.get("jobId"), dt.datetime.now().isoformat())
-    reservation_request, manager = _build_reservation_request_from_dict(job_data, user_id)
+    logger.info("[snipe] Starting reservation attempt")
     if use_parallel:
         logger.info("[snipe] Using parallel booking strategy")
         return manager.make_reservation_parallel_with_retries(reservation_request, n_slots=3)
@@ -173,7 +269,9 @@ def _load_job(req: Request) -> tuple[
     Optional[str], object, Optional[dict], Optional[str], Optional[dt.datetime], object
 ]:
     """
-    Parse request body, load job from Firestore, validate targetTimeIso.
+    Parse request body, load job from Firestore, resolve the target time.
+    The job doc stays the source of truth: edits and cancellations land there after
+    the scheduler payload is fixed, and this read happens a minute before the drop.
     Returns (job_id, job_ref, job_data, user_id, target_dt, error_response).
     error_response is None on success; if it is set, return it immediately.
     """
@@ -183,28 +281,44 @@ def _load_job(req: Request) -> tuple[
         return None, None, None, None, None, error_response("Missing jobId", 400)
 
     job_ref = get_db().collection("reservationJobs").document(job_id)
-    snap = job_ref.get()
+    # Scheduler payloads carry userId, so the credential read can overlap the job read;
+    # load_credentials caches the result for _build_reservation_request_from_dict
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        prefetch = executor.submit(load_credentials, body["userId"]) if body.get("userId") else None
+        snap = job_ref.get()
+        if prefetch is not None and prefetch.exception() is not None:
+            # Surfaced (or not) by the regular load once the job doc is validated
+            logger.info("[_load_job] Credential prefetch failed: %s", prefetch.exception())
     if not snap.exists:
         return None, None, None, None, None, error_response("Job not found", 404)
 
     job_data = snap.to_dict()
     user_id = job_data.get("userId")
-    target_iso = job_data.get("targetTimeIso")
-    if not target_iso:
-        return None, None, None, None, None, error_response("Job missing targetTimeIso", 400)
+    target_dt = job_data.get("targetTime")
+    if target_dt is not None:
+        # Native Timestamps come back in UTC; restore the job's wall-clock zone
+        target_dt = target_dt.astimezone(ZoneInfo(job_data.get("timezone", "America/New_York")))
+    else:
+        # Jobs created before targetTime was stored only carry the ISO string
+        target_iso = job_data.get("targetTimeIso")
+        if not target_iso:
+            return None, None, None, None, None, error_response("Job missing targetTime", 400)
+        target_dt = dt.datetime.fromisoformat(target_iso)
 
-    return job_id, job_ref, job_data, user_id, dt.datetime.fromisoformat(target_iso), None
+    return job_id, job_ref, job_data, user_id, target_dt, None
 
 
 def _execute_booking_with_deadline(
-    job_data: dict,
-    user_id: Optional[str],
+    reservation_request: ReservationRequest,
+    manager: ResyManager,
     execution_logs: list,
     deadline_seconds: int = 30,
 ) -> tuple[bool, Optional[str], Optional[str], bool]:
     """
     Attempt booking within a time deadline, handling rate limits and transient errors.
-    Mutates execution_logs in place.
+    The request and manager are built once by the caller and reused across retries.
+    Appends (epoch, status, message, elapsed_seconds | None) tuples to execution_logs;
+    _serialize_execution_logs turns them into Firestore dicts at write time.
     Returns (success, resy_token, last_error, auth_expired).
     """
     success = False
@@ -215,13 +329,9 @@ def _execute_booking_with_deadline(
 
     while time.time() - start < deadline_seconds:
         try:
-            resy_token = _make_reservation_for_job(job_data, user_id)
+            resy_token = _make_reservation(reservation_request, manager)
             success = True
-            execution_logs.append({
-                "timestamp": dt.datetime.now().isoformat(),
-                "status": "success",
-                "message": "Reservation successful",
-            })
+            execution_logs.append((time.time(), "success", "Reservation successful", None))
             break
         except ResyAuthError:
             last_error = "Resy session expired. Please reconnect your Resy account."
@@ -230,13 +340,16 @@ def _execute_booking_with_deadline(
             rate_limit_count += 1
             last_error = str(rate_err)
             elapsed = time.time() - start
-            wait_time = min(2 * (2 ** (rate_limit_count - 1)), 8)
-            execution_logs.append({
-                "timestamp": dt.datetime.now().isoformat(),
-                "status": "rate_limited",
-                "message": f"Rate limited - waiting {wait_time:.1f}s",
-                "elapsed_seconds": round(elapsed, 2),
-            })
+            # Prefer the server's Retry-After; otherwise back off from 0.5s up to 4s
+            if rate_err.retry_after is not None:
+                wait_time = rate_err.retry_after
+            else:
+                wait_time = min(0.5 * (2 ** (rate_limit_count - 1)), 4)
+            # Jitter so concurrent snipes for the same user don't retry in lockstep
+            wait_time += random.uniform(0, RETRY_BACKOFF_MAX_SECONDS)
+            # Never sleep past the point where a retry could still fit in the window
+            wait_time = min(wait_time, max(0.0, deadline_seconds - elapsed - 0.1))
+            execution_logs.append((time.time(), "rate_limited", f"Rate limited - waiting {wait_time:.1f}s", elapsed))
             if elapsed + wait_time < deadline_seconds:
                 time.sleep(wait_time)
             else:
@@ -244,18 +357,58 @@ def _execute_booking_with_deadline(
         except Exception as inner_e:
             last_error = str(inner_e)
             elapsed = time.time() - start
-            execution_logs.append({
-                "timestamp": dt.datetime.now().isoformat(),
-                "status": "error",
-                "message": str(inner_e),
-                "elapsed_seconds": round(elapsed, 2),
-            })
+            execution_logs.append((time.time(), "error", last_error, elapsed))
             if elapsed < deadline_seconds:
-                time.sleep(0.5)
+                time.sleep(random.uniform(RETRY_BACKOFF_MIN_SECONDS, RETRY_BACKOFF_MAX_SECONDS))
 
     return success, resy_token, last_error, False
 
 
+def _serialize_execution_logs(execution_logs: list) -> list:
+    """
+    Expand the booking loop's compact log tuples into the dicts stored in Firestore.
+    Timestamp formatting happens here, once per write, instead of once per retry.
+    Entries that are already dicts pass through unchanged.
+
+    Long runs keep the first and last entries around an "omitted" marker, and
+    messages are truncated, so the job document stays small.
+    """
+    omitted_marker = None
+    if len(execution_logs) > EXECUTION_LOGS_MAX_ENTRIES:
+        tail = EXECUTION_LOGS_MAX_ENTRIES - EXECUTION_LOGS_HEAD_ENTRIES
+        omitted = len(execution_logs) - EXECUTION_LOGS_MAX_ENTRIES
+        first_omitted = _execution_log_entry(execution_logs[EXECUTION_LOGS_HEAD_ENTRIES])
+        omitted_marker = {
+            "timestamp": first_omitted.get("timestamp"),
+            "status": "omitted",
+            "message": f"{omitted} entries omitted",
+        }
+        execution_logs = execution_logs[:EXECUTION_LOGS_HEAD_ENTRIES] + execution_logs[-tail:]
+
+    entries = [_execution_log_entry(log) for log in execution_logs]
+    if omitted_marker:
+        entries.insert(EXECUTION_LOGS_HEAD_ENTRIES, omitted_marker)
+    return entries
+
+
+def _execution_log_entry(log) -> dict:
+    """Convert one execution log tuple (or dict) to its stored form."""
+    if not isinstance(log, tuple):
+        message = log.get("message")
+        if isinstance(message, str) and len(message) > EXECUTION_LOG_MESSAGE_MAX_CHARS:
+            return {**log, "message": message[:EXECUTION_LOG_MESSAGE_MAX_CHARS]}
+        return log
+    timestamp, status, message, elapsed = log
+    entry = {
+        "timestamp": dt.datetime.fromtimestamp(timestamp).isoformat(),
+        "status": status,
+        "message": message[:EXECUTION_LOG_MESSAGE_MAX_CHARS],
+    }
+    if elapsed is not None:
+        entry["elapsed_seconds"] = round(elapsed, 2)
+    return entry
+
+
 def _finalize_job(
     job_ref,
     job_id: str,
@@ -273,7 +426,7 @@ def _finalize_job(
         "lastUpdate": gc_firestore.SERVER_TIMESTAMP,
         "resyToken": resy_token if success else None,
         "errorMessage": last_error if not success else None,
-        "executionLogs": execution_logs,
+        "executionLogs": _serialize_execution_logs(execution_logs),
     }
     if extra_fields:
         update.update(extra_fields)
@@ -281,13 +434,16 @@ def _finalize_job(
     return success_response(SnipeResultData(status=status, jobId=job_id, resyToken=resy_token))
 
 
-def _handle_auth_expiry(job_ref, last_error: str, execution_logs: list):
+def _handle_auth_expiry(job_ref, user_id: Optional[str], last_error: str, execution_logs: list):
     """Mark job failed due to session expiry and return HTTP 401."""
+    # The cached token is what just failed; make the next load re-read Firestore
+    if user_id:
+        invalidate_credentials(user_id)
     job_ref.update({
         "status": "failed",
         "lastUpdate": gc_firestore.SERVER_TIMESTAMP,
         "errorMessage": last_error,
-        "executionLogs": execution_logs,
+        "executionLogs": _serialize_execution_logs(execution_logs),
     })
     return error_response(last_error, 401)
 
@@ -325,7 +481,7 @@ def _handle_snipe_exception(req: Request, e: Exception, context: str):
 def run_snipe(req: Request):
     """
     Sniper function called by Cloud Scheduler.
-    Body: { "jobId": "<firestore-doc-id>" }
+    Body: { "jobId": "<firestore-doc-id>", "userId": "<owner uid>" }
     Sleeps until targetTimeIso then attempts booking for up to 30 seconds.
     """
     if req.method == "OPTIONS":
@@ -338,19 +494,31 @@ def run_snipe(req: Request):
         if err is not None:
             return err
 
+        # Load credentials and build the client while we still have time to spare
+        reservation_request, manager = _build_reservation_request_from_dict(job_data, user_id)
+
+        # Anchor the wall-clock target to the monotonic clock once; from here on all
+        # waiting is integer ns on perf_counter, immune to wall-clock (NTP) steps
         now = dt.datetime.now(tz=target_dt.tzinfo)
-        # Cloud Scheduler triggers ~1 min early; sleep until 0.1s before target
+        anchor_ns = time.perf_counter_ns()
+        # Cloud Scheduler triggers ~1 min early; wake 0.1s before target
         delta_seconds = (target_dt - now).total_seconds() - 0.1
+        wake_at_ns = anchor_ns + int(delta_seconds * 1e9)
         logger.info("[run_snipe] Target: %s, sleeping %.2fs", target_dt.isoformat(), max(0, delta_seconds))
-        if delta_seconds > 0:
-            time.sleep(delta_seconds)
+        _sleep_until(wake_at_ns - WARM_UP_LEAD_NS)
+        # Open the connection shortly before the drop so it's still alive when we book.
+        # It runs in the background so a slow handshake can never delay the wake-up.
+        warmed = _start_warm_up(manager)
+        _sleep_until(wake_at_ns)
+        if not warmed.is_set():
+            logger.warning("[run_snipe] Connection warm-up still pending at drop time")
 
         execution_logs = []
         success, resy_token, last_error, auth_expired = _execute_booking_with_deadline(
-            job_data, user_id, execution_logs
+            reservation_request, manager, execution_logs
         )
         if auth_expired:
-            return _handle_auth_expiry(job_ref, last_error, execution_logs)
+            return _handle_auth_expiry(job_ref, user_id, last_error, execution_logs)
         return _finalize_job(job_ref, job_id, success, resy_token, last_error, execution_logs)
 
     except Exception as e:
@@ -372,7 +540,7 @@ def run_discovery_snipe(req: Request):
     record the actual drop time on the venue doc when slots appear, then attempt booking.
     Called by Cloud Scheduler at (expected_drop - windowBeforeMinutes).
 
-    Body: { "jobId": "<firestore-doc-id>" }
+    Body: { "jobId": "<firestore-doc-id>", "userId": "<owner uid>" }
     """
     if req.method == "OPTIONS":
         return ("", 204)
@@ -400,12 +568,16 @@ def run_discovery_snipe(req: Request):
             time.sleep(sleep_sec)
             now = dt.datetime.now(tz=tz)
 
+        # One manager serves every poll and the booking attempt that follows
+        reservation_request, manager = _build_reservation_request_from_dict(job_data, user_id)
+        find_body = build_find_request_body(reservation_request)
+
         poll_log = []
         execution_logs = []
         current_interval = DISCOVERY_POLL_EARLY_SECONDS
 
         while now <= window_end:
-            slot_count, poll_err = _check_slots_for_job(job_data, user_id)
+            slot_count, poll_err = _check_slots_for_job(find_body, manager)
             now = dt.datetime.now(tz=tz)
             poll_log.append({"t": now.strftime("%H:%M:%S"), "slots": slot_count})
 
@@ -419,6 +591,7 @@ def run_discovery_snipe(req: Request):
                 if isinstance(poll_err, ResyAuthError):
                     return _handle_auth_expiry(
                         job_ref,
+                        user_id,
                         "Resy session expired during discovery. Please reconnect your Resy account and try again.",
                         execution_logs,
                     )
@@ -432,19 +605,23 @@ def run_discovery_snipe(req: Request):
 
             if slot_count > 0:
                 logger.info("[run_discovery_snipe] Slots detected (%d) at %s", slot_count, now.isoformat())
-                _write_drop_time_to_venue(job_data["venueId"], job_id, target_dt, now)
-                job_ref.update({
-                    "discoveredDropTime": now.isoformat(),
-                    "pollLog": poll_log,
-                    "executionLogs": execution_logs,
-                    "lastUpdate": gc_firestore.SERVER_TIMESTAMP,
-                })
-
-                success, resy_token, last_error, auth_expired = _execute_booking_with_deadline(
-                    job_data, user_id, execution_logs
-                )
+                # Record the discovery in the background so booking starts immediately;
+                # the writer is joined before the final job update is written
+                with ThreadPoolExecutor(max_workers=1) as writer:
+                    recorded = writer.submit(
+                        _record_drop_discovery,
+                        job_ref, job_data["venueId"], job_id, target_dt, now,
+                        list(poll_log), list(execution_logs),
+                    )
+                    success, resy_token, last_error, auth_expired = _execute_booking_with_deadline(
+                        reservation_request, manager, execution_logs
+                    )
+                try:
+                    recorded.result()
+                except Exception as record_err:
+                    logger.warning("[run_discovery_snipe] Failed to record drop discovery: %s", record_err)
                 if auth_expired:
-                    return _handle_auth_expiry(job_ref, last_error, execution_logs)
+                    return _handle_auth_expiry(job_ref, user_id, last_error, execution_logs)
                 return _finalize_job(
                     job_ref, job_id, success, resy_token, last_error, execution_logs,
                     extra_fields={"pollLog": poll_log},
@@ -460,7 +637,7 @@ def run_discovery_snipe(req: Request):
             "lastUpdate": gc_firestore.SERVER_TIMESTAMP,
             "errorMessage": "Discovery window expired; no slots appeared",
             "pollLog": poll_log,
-            "executionLogs": execution_logs,
+            "executionLogs": _serialize_execution_logs(execution_logs),
         })
         return success_response(SnipeResultData(status="failed", jobId=job_id, resyToken=None))
 
@@ -468,6 +645,46 @@ def run_discovery_snipe(req: Request):
         return _handle_snipe_exception(req, e, "Exception during discovery")
 
 
+_SUMMARY_PROMPT_TEMPLATE = """You are analyzing logs from an automated restaurant reservation attempt.
+
+The reservation attempt had a final status of: {status}
+
+{logs_text}
+
+Provide a concise 1-2 sentence summary explaining what happened during this reservation attempt. Focus on why it might have failed. Be clear and user-friendly. Do not mention technical details like "execution logs" or "retry attempts" - just explain what happened in plain language.
+
+GOOD EXAMPLES:
+"The booking was unsuccessful due to rate limiting causing delays."
+"No slots were available for the requested time."
+"BUG: The /find endpoint returned a 500 server error. Maybe the request was malformed?"
+
+BAD EXAMPLES:
+"Retried 30 times with parallel booking, without securing a slot"
+"The booking was unsuccessful"
+
+If the status is "done", simply state that the reservation was successful."""
+
+
+def _format_execution_logs(execution_logs: list, error_message: Optional[str]) -> str:
+    """Render execution logs and the final error as the prompt's log section."""
+    parts = []
+    if execution_logs:
+        parts.append("Execution logs:\n")
+        for log in execution_logs:
+            timestamp = log.get("timestamp", "unknown")
+            log_status = log.get("status", "unknown")
+            message = log.get("message", "")
+            elapsed = log.get("elapsed_seconds")
+            if elapsed:
+                parts.append(f"- [{timestamp}] {log_status}: {message} (after {elapsed}s)\n")
+            else:
+                parts.append(f"- [{timestamp}] {log_status}: {message}\n")
+
+    if error_message:
+        parts.append(f"\nFinal error message: {error_message}\n")
+    return "".join(parts)
+
+
 @on_request(
     cors=CorsOptions(
         cors_origins="*",
@@ -481,9 +698,11 @@ def summarize_snipe_logs(req: Request):
     """
     POST /summarize_snipe_logs
     Uses Gemini AI to summarize execution logs from a reservation attempt.
-    Body: { "jobId": "<firestore-doc-id>" }
+    Body: { "jobId": "<firestore-doc-id>", "force": false }
 
     Returns a 1-2 sentence summary of what happened during the reservation attempt.
+    A summary cached for the job's current status is returned without calling
+    Gemini; pass "force": true to regenerate it.
     """
     # 1) Let preflight succeed without touching JSON
     if req.method == "OPTIONS":
@@ -518,6 +737,12 @@ def summarize_snipe_logs(req: Request):
         error_message = job_data.get("errorMessage")
         status = job_data.get("status", "unknown")
 
+        # Reuse the summary from an earlier call unless the job has moved on since
+        cached_summary = job_data.get("aiSummary")
+        if cached_summary and job_data.get("aiSummaryStatus") == status and not body.get("force"):
+            logger.info("[summarize_snipe_logs] Returning cached summary for job %s", job_id)
+            return success_response(SummaryData(summary=cached_summary))
+
         # If no logs and no error message, return early
         if not execution_logs and not error_message:
             logger.info("[summarize_snipe_logs] No execution logs for job %s", job_id)
@@ -525,41 +750,10 @@ def summarize_snipe_logs(req: Request):
                 SummaryData(summary="No execution logs available for this reservation attempt.")
             )
 
-        # Build prompt for Gemini
-        logs_text = ""
-        if execution_logs:
-            logs_text = "Execution logs:\n"
-            for log in execution_logs:
-                timestamp = log.get("timestamp", "unknown")
-                log_status = log.get("status", "unknown")
-                message = log.get("message", "")
-                elapsed = log.get("elapsed_seconds")
-                if elapsed:
-                    logs_text += f"- [{timestamp}] {log_status}: {message} (after {elapsed}s)\n"
-                else:
-                    logs_text += f"- [{timestamp}] {log_status}: {message}\n"
-
-        if error_message:
-            logs_text += f"\nFinal error message: {error_message}\n"
-
-        prompt = f"""You are analyzing logs from an automated restaurant reservation attempt.
-
-The reservation attempt had a final status of: {status}
-
-{logs_text}
-
-Provide a concise 1-2 sentence summary explaining what happened during this reservation attempt. Focus on why it might have failed. Be clear and user-friendly. Do not mention technical details like "execution logs" or "retry attempts" - just explain what happened in plain language.
-
-GOOD EXAMPLES:
-"The booking was unsuccessful due to rate limiting causing delays."
-"No slots were available for the requested time."
-"BUG: The /find endpoint returned a 500 server error. Maybe the request was malformed?"
-
-BAD EXAMPLES:
-"Retried 30 times with parallel booking, without securing a slot"
-"The booking was unsuccessful"
-
-If the status is "done", simply state that the reservation was successful."""
+        prompt = _SUMMARY_PROMPT_TEMPLATE.format(
+            status=status,
+            logs_text=_format_execution_logs(execution_logs, error_message),
+        )
 
         # Call Gemini
         response = gemini_client.models.generate_content(
@@ -572,7 +766,7 @@ If the status is "done", simply state that the reservation was successful."""
 
         # Optionally cache the summary in Firestore
         try:
-            job_ref.update({"aiSummary": summary})
+            job_ref.update({"aiSummary": summary, "aiSummaryStatus": status})
         except Exception as update_error:
             logger.warning("[summarize_snipe_logs] Failed to cache summary: %s", update_error)
 
@@ -9,11 +9,15 @@ This module provides reusable fixtures for:
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-# Mock and MagicMock not used in this file
+import functools
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+from unittest.mock import patch
 
 import pytest
 
+from api.utils import clear_availability_cache
+
 
 # =============================================================================
 # Venue Factory
@@ -82,17 +86,41 @@ class VenueFactory:
         price_range_id: Optional[int] = None,
         **kwargs
     ) -> List[Dict[str, Any]]:
-        """Create a batch of venues."""
-        venues = []
-        for _i in range(count):
-            venue_kwargs = kwargs.copy()
-            if cuisine:
-                venue_kwargs["cuisine"] = cuisine
-            if price_range_id:
-                venue_kwargs["price_range_id"] = price_range_id
-            venues.append(VenueFactory.create(**venue_kwargs))
+        """Create a batch of venues.
+
+        Only the first venue is built from scratch; the rest are shallow clones
+        of it that share the cuisine/geo/image sub-objects and get a new id.
+        """
+        if count <= 0:
+            return []
+        venue_kwargs = kwargs.copy()
+        if cuisine:
+            venue_kwargs["cuisine"] = cuisine
+        if price_range_id:
+            venue_kwargs["price_range_id"] = price_range_id
+
+        prototype = VenueFactory.create(**venue_kwargs)
+        fixed_id = kwargs.get("venue_id")
+        fixed_name = kwargs.get("name")
+        venues = [prototype]
+        for _i in range(count - 1):
+            venue_id = fixed_id if fixed_id is not None else VenueFactory._next_id()
+            source = prototype["_source"].copy()
+            source["id"] = {"resy": venue_id}
+            source["name"] = fixed_name if fixed_name is not None else f"Restaurant {venue_id}"
+            venues.append({"_source": source})
         return venues
 
+    @staticmethod
+    def cached_batch(count: int) -> List[Dict[str, Any]]:
+        """Default venues with ids 1..count, built once per session.
+
+        Returns fresh top-level dicts (so tests may add keys such as
+        availableTimes) that share the cached, read-only _source payloads.
+        Does not advance the id counter.
+        """
+        return [dict(venue) for venue in _template_batch(count)]
+
     @staticmethod
     def with_cuisine(cuisine: str, count: int = 1) -> List[Dict[str, Any]]:
         """Create venues with specific cuisine."""
@@ -103,6 +131,22 @@ class VenueFactory:
         """Create venues with specific price range."""
         return VenueFactory.create_batch(count, price_range_id=price_range_id)
 
+    @staticmethod
+    def with_cuisine_counts(specs: List[tuple]) -> List[Dict[str, Any]]:
+        """Create venues for (cuisine, count) pairs, in order, as one list."""
+        venues = []
+        for cuisine, count in specs:
+            venues.extend(VenueFactory.create_batch(count, cuisine=cuisine))
+        return venues
+
+    @staticmethod
+    def with_price_range_counts(specs: List[tuple]) -> List[Dict[str, Any]]:
+        """Create venues for (price_range_id, count) pairs, in order, as one list."""
+        venues = []
+        for price_range_id, count in specs:
+            venues.extend(VenueFactory.create_batch(count, price_range_id=price_range_id))
+        return venues
+
     @staticmethod
     def mixed_cuisines(cuisines: List[str], count_per: int = 1) -> List[Dict[str, Any]]:
         """Create venues with mixed cuisines."""
@@ -120,44 +164,62 @@ class VenueFactory:
         return venues
 
 
+@functools.lru_cache(maxsize=None)
+def _template_batch(count: int) -> tuple:
+    """Session-wide template for VenueFactory.cached_batch."""
+    return tuple(VenueFactory.create(venue_id=venue_id) for venue_id in range(1, count + 1))
+
+
 # =============================================================================
 # Availability Factory
 # =============================================================================
 
+# Canned payloads are built once and shared across the session, so they are
+# frozen: read-only mappings with tuple time lists
+_AVAILABLE = MappingProxyType(
+    {"times": ("6:00 PM", "7:00 PM", "8:00 PM", "9:00 PM"), "status": None}
+)
+_NOT_RELEASED = MappingProxyType({"times": (), "status": "Not released yet"})
+_SOLD_OUT = MappingProxyType({"times": (), "status": "Sold out"})
+_CLOSED = MappingProxyType({"times": (), "status": "Closed"})
+_UNABLE_TO_FETCH = MappingProxyType({"times": (), "status": "Unable to fetch"})
+_RESY_UNAVAILABLE = MappingProxyType({"times": (), "status": "Resy temporarily unavailable"})
+
+
 class AvailabilityFactory:
     """Factory for creating availability status responses."""
 
     @staticmethod
-    def available(times: Optional[List[str]] = None) -> Dict[str, Any]:
+    def available(times: Optional[List[str]] = None) -> Mapping[str, Any]:
         """Create availability response with available times."""
         if times is None:
-            times = ["6:00 PM", "7:00 PM", "8:00 PM", "9:00 PM"]
-        return {"times": times, "status": None}
+            return _AVAILABLE
+        return MappingProxyType({"times": tuple(times), "status": None})
 
     @staticmethod
-    def not_released() -> Dict[str, Any]:
+    def not_released() -> Mapping[str, Any]:
         """Create availability response for 'Not released yet'."""
-        return {"times": [], "status": "Not released yet"}
+        return _NOT_RELEASED
 
     @staticmethod
-    def sold_out() -> Dict[str, Any]:
+    def sold_out() -> Mapping[str, Any]:
         """Create availability response for 'Sold out'."""
-        return {"times": [], "status": "Sold out"}
+        return _SOLD_OUT
 
     @staticmethod
-    def closed() -> Dict[str, Any]:
+    def closed() -> Mapping[str, Any]:
         """Create availability response for 'Closed'."""
-        return {"times": [], "status": "Closed"}
+        return _CLOSED
 
     @staticmethod
-    def unable_to_fetch() -> Dict[str, Any]:
+    def unable_to_fetch() -> Mapping[str, Any]:
         """Create availability response for 'Unable to fetch'."""
-        return {"times": [], "status": "Unable to fetch"}
+        return _UNABLE_TO_FETCH
 
     @staticmethod
-    def resy_unavailable() -> Dict[str, Any]:
+    def resy_unavailable() -> Mapping[str, Any]:
         """Create availability response for 'Resy temporarily unavailable'."""
-        return {"times": [], "status": "Resy temporarily unavailable"}
+        return _RESY_UNAVAILABLE
 
 
 # =============================================================================
@@ -177,13 +239,34 @@ def reset_venue_counter():
     VenueFactory.reset_counter()
 
 
+@pytest.fixture(autouse=True)
+def unpaced_resy_limiters(monkeypatch):
+    """Skip the process-wide Resy rate limiters.
+
+    Their token buckets are shared across tests, so real pacing would make
+    mocked fetches sleep and leak timing between tests. TestTokenBucket
+    exercises the pacing itself on its own bucket.
+    """
+    monkeypatch.setattr('api.utils._availability_limiter.acquire', lambda: None)
+    monkeypatch.setattr('api.utils._search_limiter.acquire', lambda: None)
+
+
+@pytest.fixture(autouse=True)
+def empty_availability_cache():
+    """Start every test with an empty in-process availability cache.
+
+    Keeps availability call counts independent of which tests ran earlier.
+    """
+    clear_availability_cache()
+
+
 # =============================================================================
 # Mock Config Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
-    """Mock Resy config dict."""
+    """Mock Resy config dict (session-scoped; tests must not mutate it)."""
     return {
         "api_key": "test_api_key",
         "token": "test_token",
@@ -252,10 +335,10 @@ def price_filter():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def available_only_filter():
-    """Filter for available_only with date and party size."""
-    return {
+    """Filter for available_only with date and party size (read-only, shared)."""
+    return MappingProxyType({
         "cuisines": [],
         "price_ranges": [],
         "available_only": True,
@@ -265,13 +348,13 @@ def available_only_filter():
         "desired_time": "",
         "offset": 0,
         "per_page": 20,
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def not_released_only_filter():
-    """Filter for not_released_only with date and party size."""
-    return {
+    """Filter for not_released_only with date and party size (read-only, shared)."""
+    return MappingProxyType({
         "cuisines": [],
         "price_ranges": [],
         "available_only": False,
@@ -281,49 +364,74 @@ def not_released_only_filter():
         "desired_time": "",
         "offset": 0,
         "per_page": 20,
-    }
+    })
 
 
 # =============================================================================
-# Mock Search Function Fixtures
+# Mock Availability Fixtures
 # =============================================================================
 
+@pytest.fixture(scope="module")
+def _availability_patch():
+    """Patch both availability lookups once per test module.
+
+    get_venue_availability_fast (the not_released_only path) shares the same
+    mock, so no test falls through to the real Resy calendar endpoint.
+    """
+    with patch('api.utils.get_venue_availability') as availability_mock, \
+            patch('api.utils.get_venue_availability_fast', new=availability_mock):
+        yield availability_mock
+
+
 @pytest.fixture
-def mock_search_func():
-    """Create a mock search function that can be configured per test."""
-    def _create_mock(pages_data: List[tuple]) -> callable:
-        """
-        Create a mock search function.
+def mock_availability(_availability_patch):
+    """Module-wide availability mock (full and fast lookups), reset before each test.
 
-        Args:
-            pages_data: List of (hits, total) tuples, one per page
-        """
-        def search_func(page: int):
-            if page <= len(pages_data):
-                hits, total = pages_data[page - 1]
-                return hits, total
-            return [], 0
+    Set return_value / side_effect directly instead of opening a patch per test.
+    """
+    _availability_patch.reset_mock(return_value=True, side_effect=True)
+    return _availability_patch
+
+
+# =============================================================================
+# Mock Search Function Fixtures
+# =============================================================================
 
-        return search_func
+class PagedSearch:
+    """Mock search function serving canned (hits, total) pages, 1-indexed."""
 
-    return _create_mock
+    __slots__ = ("pages",)
+
+    def __init__(self, pages_data: List[tuple]):
+        self.pages = pages_data
+
+    def __call__(self, page: int):
+        if 1 <= page <= len(self.pages):
+            return self.pages[page - 1]
+        return [], 0
+
+
+@pytest.fixture(scope="session")
+def mock_search_func():
+    """Build a mock search function from a list of (hits, total) tuples, one per page."""
+    return PagedSearch
 
 
 # =============================================================================
 # Geo Config Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def geo_config_nyc():
-    """NYC bounding box geo config."""
+    """NYC bounding box geo config (session-scoped; tests must not mutate it)."""
     return {
         "bounding_box": [40.7, -74.02, 40.8, -73.93]
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def geo_config_radius():
-    """Radius-based geo config."""
+    """Radius-based geo config (session-scoped; tests must not mutate it)."""
     return {
         "latitude": 40.7589,
         "longitude": -73.9851,
@@ -3,106 +3,96 @@ Tests for availability-based filtering (available_only and not_released_only).
 
 These tests verify that venues are correctly filtered based on their availability status.
 """
-from unittest.mock import patch
+import pytest
 
 from api.tests.conftest import VenueFactory, AvailabilityFactory
 from api.utils import filter_and_format_venues
 
+# Under pytest-xdist (--dist=loadgroup) keep this module on one worker so the
+# module-scoped availability patch and session fixtures are built once
+pytestmark = pytest.mark.xdist_group("availability_filtering")
+
 
 class TestAvailableOnlyFilter:
     """Tests for available_only filter."""
 
-    def test_available_only_passes_venues_with_times(self, available_only_filter, mock_config):
+    def test_available_only_passes_venues_with_times(
+        self, available_only_filter, mock_config, mock_availability
+    ):
         """Venues with available times should pass available_only filter."""
         hits = VenueFactory.create_batch(3)
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.available()
-
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, available_only_filter, config=mock_config, fetch_availability=True
-            )
-
-            assert len(results) == 3
-            assert all('availableTimes' in r for r in results)
-            assert all(len(r['availableTimes']) > 0 for r in results)
-            assert filtered_count['availability'] == 0
-
-    def test_available_only_filters_sold_out(self, available_only_filter, mock_config):
-        """Sold out venues should be filtered out."""
-        hits = VenueFactory.create_batch(5)
-
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.sold_out()
-
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, available_only_filter, config=mock_config, fetch_availability=True
-            )
-
-            assert len(results) == 0
-            assert filtered_count['availability'] == 5
+        mock_availability.return_value = AvailabilityFactory.available()
 
-    def test_available_only_filters_closed(self, available_only_filter, mock_config):
-        """Closed venues should be filtered out."""
-        hits = VenueFactory.create_batch(3)
-
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.closed()
-
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, available_only_filter, config=mock_config, fetch_availability=True
-            )
-
-            assert len(results) == 0
-            assert filtered_count['availability'] == 3
-
-    def test_available_only_filters_not_released(self, available_only_filter, mock_config):
-        """Not released venues should be filtered out."""
-        hits = VenueFactory.create_batch(4)
+        results, filtered_count, _seen_ids = filter_and_format_venues(
+            hits, available_only_filter, config=mock_config, fetch_availability=True
+        )
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.not_released()
+        assert len(results) == 3
+        assert all(r.get('availableTimes') for r in results)
+        assert filtered_count['availability'] == 0
 
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, available_only_filter, config=mock_config, fetch_availability=True
-            )
+    def test_available_only_stops_at_limit(
+        self, available_only_filter, mock_config, mock_availability
+    ):
+        """Once limit venues pass, the rest of the page is left unchecked and unseen."""
+        hits = VenueFactory.create_batch(20)
 
-            assert len(results) == 0
-            assert filtered_count['availability'] == 4
+        mock_availability.return_value = AvailabilityFactory.available()
 
-    def test_available_only_filters_unable_to_fetch(self, available_only_filter, mock_config):
-        """Venues with 'Unable to fetch' status should be filtered out."""
-        hits = VenueFactory.create_batch(2)
+        results, filtered_count, seen_ids = filter_and_format_venues(
+            hits, available_only_filter, config=mock_config, fetch_availability=True, limit=3
+        )
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.unable_to_fetch()
+        assert [r['id'] for r in results] == [1, 2, 3]
+        assert filtered_count['unchecked'] == 17
+        assert seen_ids == {1, 2, 3}
+
+    @pytest.mark.parametrize(
+        "status_factory,batch_size",
+        [
+            (AvailabilityFactory.sold_out, 5),
+            (AvailabilityFactory.closed, 3),
+            (AvailabilityFactory.not_released, 4),
+            (AvailabilityFactory.unable_to_fetch, 2),
+        ],
+        ids=["sold_out", "closed", "not_released", "unable_to_fetch"],
+    )
+    def test_available_only_filters_unavailable(
+        self, available_only_filter, mock_config, mock_availability, status_factory, batch_size
+    ):
+        """Sold out, closed, not released and unfetchable venues should be filtered out."""
+        hits = VenueFactory.create_batch(batch_size)
+
+        mock_availability.return_value = status_factory()
 
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, available_only_filter, config=mock_config, fetch_availability=True
-            )
+        results, filtered_count, _seen_ids = filter_and_format_venues(
+            hits, available_only_filter, config=mock_config, fetch_availability=True
+        )
 
-            assert len(results) == 0
-            assert filtered_count['availability'] == 2
+        assert len(results) == 0
+        assert filtered_count['availability'] == batch_size
 
-    def test_available_only_mixed_statuses(self, available_only_filter, mock_config):
+    def test_available_only_mixed_statuses(self, available_only_filter, mock_config, mock_availability):
         """Test mix of available and unavailable venues."""
         hits = VenueFactory.create_batch(10)
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            def availability_side_effect(venue_id, _day, _party_size, _config):
-                # First 3 are available, rest are sold out
-                if venue_id <= hits[2]['_source']['id']['resy']:
-                    return AvailabilityFactory.available()
-                return AvailabilityFactory.sold_out()
+        # First 3 are available, rest are sold out
+        available_ids = frozenset(hit['_source']['id']['resy'] for hit in hits[:3])
 
-            mock_availability.side_effect = availability_side_effect
+        def availability_side_effect(venue_id, _day, _party_size, _config):
+            if venue_id in available_ids:
+                return AvailabilityFactory.available()
+            return AvailabilityFactory.sold_out()
+
+        mock_availability.side_effect = availability_side_effect
 
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, available_only_filter, config=mock_config, fetch_availability=True
-            )
+        results, filtered_count, _seen_ids = filter_and_format_venues(
+            hits, available_only_filter, config=mock_config, fetch_availability=True
+        )
 
-            assert len(results) == 3
-            assert filtered_count['availability'] == 7
+        assert len(results) == 3
+        assert filtered_count['availability'] == 7
 
     def test_available_only_without_fetch_availability(self, available_only_filter, mock_config):
         """available_only filter should not work without fetch_availability=True."""
@@ -121,97 +111,68 @@ class TestAvailableOnlyFilter:
 class TestNotReleasedOnlyFilter:
     """Tests for not_released_only filter."""
 
-    def test_not_released_only_passes_not_released(self, not_released_only_filter, mock_config):
+    def test_not_released_only_passes_not_released(
+        self, not_released_only_filter, mock_config, mock_availability
+    ):
         """Venues with 'Not released yet' status should pass."""
         hits = VenueFactory.create_batch(3)
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.not_released()
-
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, not_released_only_filter, config=mock_config, fetch_availability=True
-            )
-
-            assert len(results) == 3
-            assert all('availabilityStatus' in r for r in results)
-            assert all(r['availabilityStatus'] == 'Not released yet' for r in results)
-            assert filtered_count.get('not_released', 0) == 0
-
-    def test_not_released_only_filters_available(self, not_released_only_filter, mock_config):
-        """Available venues should be filtered out."""
-        hits = VenueFactory.create_batch(5)
-
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.available()
-
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, not_released_only_filter, config=mock_config, fetch_availability=True
-            )
-
-            assert len(results) == 0
-            assert filtered_count.get('not_released', 0) == 5
-
-    def test_not_released_only_filters_sold_out(self, not_released_only_filter, mock_config):
-        """Sold out venues should be filtered out."""
-        hits = VenueFactory.create_batch(4)
-
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.sold_out()
-
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, not_released_only_filter, config=mock_config, fetch_availability=True
-            )
-
-            assert len(results) == 0
-            assert filtered_count.get('not_released', 0) == 4
-
-    def test_not_released_only_filters_closed(self, not_released_only_filter, mock_config):
-        """Closed venues should be filtered out."""
-        hits = VenueFactory.create_batch(3)
-
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.closed()
-
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, not_released_only_filter, config=mock_config, fetch_availability=True
-            )
+        mock_availability.return_value = AvailabilityFactory.not_released()
 
-            assert len(results) == 0
-            assert filtered_count.get('not_released', 0) == 3
+        results, filtered_count, _seen_ids = filter_and_format_venues(
+            hits, not_released_only_filter, config=mock_config, fetch_availability=True
+        )
 
-    def test_not_released_only_filters_unable_to_fetch(self, not_released_only_filter, mock_config):
-        """Venues with 'Unable to fetch' should be filtered out."""
-        hits = VenueFactory.create_batch(2)
+        assert len(results) == 3
+        assert all(r.get('availabilityStatus') == 'Not released yet' for r in results)
+        assert filtered_count.get('not_released', 0) == 0
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            mock_availability.return_value = AvailabilityFactory.unable_to_fetch()
+    @pytest.mark.parametrize(
+        "status_factory,batch_size",
+        [
+            (AvailabilityFactory.available, 5),
+            (AvailabilityFactory.sold_out, 4),
+            (AvailabilityFactory.closed, 3),
+            (AvailabilityFactory.unable_to_fetch, 2),
+        ],
+        ids=["available", "sold_out", "closed", "unable_to_fetch"],
+    )
+    def test_not_released_only_filters_other_statuses(
+        self, not_released_only_filter, mock_config, mock_availability, status_factory, batch_size
+    ):
+        """Available, sold out, closed and unfetchable venues should be filtered out."""
+        hits = VenueFactory.create_batch(batch_size)
+
+        mock_availability.return_value = status_factory()
 
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, not_released_only_filter, config=mock_config, fetch_availability=True
-            )
+        results, filtered_count, _seen_ids = filter_and_format_venues(
+            hits, not_released_only_filter, config=mock_config, fetch_availability=True
+        )
 
-            assert len(results) == 0
-            assert filtered_count.get('not_released', 0) == 2
+        assert len(results) == 0
+        assert filtered_count.get('not_released', 0) == batch_size
+        assert mock_availability.call_count == batch_size
 
-    def test_not_released_only_mixed_statuses(self, not_released_only_filter, mock_config):
+    def test_not_released_only_mixed_statuses(self, not_released_only_filter, mock_config, mock_availability):
         """Test mix of not-released and other statuses."""
         hits = VenueFactory.create_batch(10)
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            def availability_side_effect(venue_id, _day, _party_size, _config):
-                # First 2 are not released, rest are available
-                if venue_id <= hits[1]['_source']['id']['resy']:
-                    return AvailabilityFactory.not_released()
-                return AvailabilityFactory.available()
+        # First 2 are not released, rest are available
+        not_released_ids = frozenset(hit['_source']['id']['resy'] for hit in hits[:2])
+
+        def availability_side_effect(venue_id, _day, _party_size, _config):
+            if venue_id in not_released_ids:
+                return AvailabilityFactory.not_released()
+            return AvailabilityFactory.available()
 
-            mock_availability.side_effect = availability_side_effect
+        mock_availability.side_effect = availability_side_effect
 
-            results, filtered_count, _seen_ids = filter_and_format_venues(
-                hits, not_released_only_filter, config=mock_config, fetch_availability=True
-            )
+        results, filtered_count, _seen_ids = filter_and_format_venues(
+            hits, not_released_only_filter, config=mock_config, fetch_availability=True
+        )
 
-            assert len(results) == 2
-            assert filtered_count.get('not_released', 0) == 8
+        assert len(results) == 2
+        assert filtered_count.get('not_released', 0) == 8
 
     def test_not_released_only_without_fetch_availability(self, not_released_only_filter, mock_config):
         """not_released_only filter should not work without fetch_availability=True."""
@@ -240,145 +201,112 @@ class TestAvailabilityStatusTable:
     | Unable to fetch | FAIL | FAIL |
     """
 
-    def test_availability_status_table(self, mock_config):
-        """Test all combinations from the status table."""
-        statuses = [
-            ('available', AvailabilityFactory.available(), True, False),
-            ('sold_out', AvailabilityFactory.sold_out(), False, False),
-            ('closed', AvailabilityFactory.closed(), False, False),
-            ('not_released', AvailabilityFactory.not_released(), False, True),
-            ('unable_to_fetch', AvailabilityFactory.unable_to_fetch(), False, False),
-        ]
-
-        for status_name, availability_data, should_pass_available, should_pass_not_released in statuses:
-            # Test available_only filter
-            available_filter = {
-                'cuisines': [],
-                'price_ranges': [],
-                'available_only': True,
-                'not_released_only': False,
-                'available_day': '2026-02-14',
-                'available_party_size': 2,
-                'desired_time': '',
-                'offset': 0,
-                'per_page': 20,
-            }
-
-            hits = VenueFactory.create_batch(1)
-
-            with patch('api.utils.get_venue_availability') as mock_availability:
-                mock_availability.return_value = availability_data
-
-                results, _filtered_count, _ = filter_and_format_venues(
-                    hits, available_filter, config=mock_config, fetch_availability=True
-                )
-
-                if should_pass_available:
-                    assert len(results) == 1, f"{status_name} should pass available_only filter"
-                else:
-                    assert len(results) == 0, f"{status_name} should fail available_only filter"
-
-            # Test not_released_only filter
-            not_released_filter = {
-                'cuisines': [],
-                'price_ranges': [],
-                'available_only': False,
-                'not_released_only': True,
-                'available_day': '2026-02-14',
-                'available_party_size': 2,
-                'desired_time': '',
-                'offset': 0,
-                'per_page': 20,
-            }
-
-            with patch('api.utils.get_venue_availability') as mock_availability:
-                mock_availability.return_value = availability_data
-
-                results, _filtered_count, _ = filter_and_format_venues(
-                    hits, not_released_filter, config=mock_config, fetch_availability=True
-                )
-
-                if should_pass_not_released:
-                    assert len(results) == 1, f"{status_name} should pass not_released_only filter"
-                else:
-                    assert len(results) == 0, f"{status_name} should fail not_released_only filter"
+    @pytest.mark.parametrize(
+        "status_name,availability_factory,should_pass",
+        [
+            ('available', AvailabilityFactory.available, True),
+            ('sold_out', AvailabilityFactory.sold_out, False),
+            ('closed', AvailabilityFactory.closed, False),
+            ('not_released', AvailabilityFactory.not_released, False),
+            ('unable_to_fetch', AvailabilityFactory.unable_to_fetch, False),
+        ],
+    )
+    def test_available_only_status(
+        self, available_only_filter, mock_config, mock_availability,
+        status_name, availability_factory, should_pass,
+    ):
+        """available_only column of the status table."""
+        hits = VenueFactory.create_batch(1)
+
+        mock_availability.return_value = availability_factory()
+
+        results, _filtered_count, _ = filter_and_format_venues(
+            hits, available_only_filter, config=mock_config, fetch_availability=True
+        )
+
+        expected = 1 if should_pass else 0
+        assert len(results) == expected, f"{status_name} available_only: expected {expected} result(s)"
+
+    @pytest.mark.parametrize(
+        "status_name,availability_factory,should_pass",
+        [
+            ('available', AvailabilityFactory.available, False),
+            ('sold_out', AvailabilityFactory.sold_out, False),
+            ('closed', AvailabilityFactory.closed, False),
+            ('not_released', AvailabilityFactory.not_released, True),
+            ('unable_to_fetch', AvailabilityFactory.unable_to_fetch, False),
+        ],
+    )
+    def test_not_released_only_status(
+        self, not_released_only_filter, mock_config, mock_availability,
+        status_name, availability_factory, should_pass,
+    ):
+        """not_released_only column of the status table."""
+        hits = VenueFactory.create_batch(1)
+
+        mock_availability.return_value = availability_factory()
+
+        results, _filtered_count, _ = filter_and_format_venues(
+            hits, not_released_only_filter, config=mock_config, fetch_availability=True
+        )
+
+        expected = 1 if should_pass else 0
+        assert len(results) == expected, f"{status_name} not_released_only: expected {expected} result(s)"
 
 
 class TestAvailabilityWithOtherFilters:
     """Test availability filters combined with cuisine/price filters."""
 
-    def test_available_only_with_cuisine_filter(self, mock_config):
+    def test_available_only_with_cuisine_filter(self, available_only_filter, mock_config, mock_availability):
         """Combine available_only with cuisine filter."""
-        filters = {
-            'cuisines': ['Italian'],
-            'price_ranges': [],
-            'available_only': True,
-            'not_released_only': False,
-            'available_day': '2026-02-14',
-            'available_party_size': 2,
-            'desired_time': '',
-            'offset': 0,
-            'per_page': 20,
-        }
+        filters = {**available_only_filter, 'cuisines': ['Italian']}
 
         # Create mix of Italian and Japanese venues
-        hits = (
-            VenueFactory.with_cuisine("Italian", 3) +
-            VenueFactory.with_cuisine("Japanese", 2)
-        )
+        hits = VenueFactory.with_cuisine_counts([("Italian", 3), ("Japanese", 2)])
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            def availability_side_effect(venue_id, _day, _party_size, _config):
-                # First 2 Italian venues are available, rest are sold out
-                if venue_id <= hits[1]['_source']['id']['resy']:
-                    return AvailabilityFactory.available()
-                return AvailabilityFactory.sold_out()
+        # First 2 Italian venues are available, rest are sold out
+        available_ids = frozenset(hit['_source']['id']['resy'] for hit in hits[:2])
 
-            mock_availability.side_effect = availability_side_effect
+        def availability_side_effect(venue_id, _day, _party_size, _config):
+            if venue_id in available_ids:
+                return AvailabilityFactory.available()
+            return AvailabilityFactory.sold_out()
 
-            results, _filtered_count, _seen_ids = filter_and_format_venues(
-                hits, filters, config=mock_config, fetch_availability=True
-            )
+        mock_availability.side_effect = availability_side_effect
 
-            # Should only have 2 Italian venues that are available
-            assert len(results) == 2
-            assert all(r['type'] == 'Italian' for r in results)
-            assert all('availableTimes' in r for r in results)
+        results, _filtered_count, _seen_ids = filter_and_format_venues(
+            hits, filters, config=mock_config, fetch_availability=True
+        )
+
+        # Should only have 2 Italian venues that are available
+        assert len(results) == 2
+        assert all(r['type'] == 'Italian' and 'availableTimes' in r for r in results)
 
-    def test_not_released_only_with_price_filter(self, mock_config):
+    def test_not_released_only_with_price_filter(
+        self, not_released_only_filter, mock_config, mock_availability
+    ):
         """Combine not_released_only with price filter."""
-        filters = {
-            'cuisines': [],
-            'price_ranges': [4],
-            'available_only': False,
-            'not_released_only': True,
-            'available_day': '2026-02-14',
-            'available_party_size': 2,
-            'desired_time': '',
-            'offset': 0,
-            'per_page': 20,
-        }
+        filters = {**not_released_only_filter, 'price_ranges': [4]}
 
         # Create mix of price ranges
-        hits = (
-            VenueFactory.with_price_range(4, 3) +
-            VenueFactory.with_price_range(2, 2)
-        )
+        hits = VenueFactory.with_price_range_counts([(4, 3), (2, 2)])
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
-            def availability_side_effect(venue_id, _day, _party_size, _config):
-                # First 2 price-4 venues are not released, rest are available
-                if venue_id <= hits[1]['_source']['id']['resy']:
-                    return AvailabilityFactory.not_released()
-                return AvailabilityFactory.available()
+        # First 2 price-4 venues are not released, rest are available
+        not_released_ids = frozenset(hit['_source']['id']['resy'] for hit in hits[:2])
 
-            mock_availability.side_effect = availability_side_effect
+        def availability_side_effect(venue_id, _day, _party_size, _config):
+            if venue_id in not_released_ids:
+                return AvailabilityFactory.not_released()
+            return AvailabilityFactory.available()
 
-            results, _filtered_count, _seen_ids = filter_and_format_venues(
-                hits, filters, config=mock_config, fetch_availability=True
-            )
+        mock_availability.side_effect = availability_side_effect
 
-            # Should only have 2 price-4 venues that are not released
-            assert len(results) == 2
-            assert all(r['price_range'] == 4 for r in results)
-            assert all(r['availabilityStatus'] == 'Not released yet' for r in results)
+        results, _filtered_count, _seen_ids = filter_and_format_venues(
+            hits, filters, config=mock_config, fetch_availability=True
+        )
+
+        # Should only have 2 price-4 venues that are not released
+        assert len(results) == 2
+        assert all(
+            r['price_range'] == 4 and r['availabilityStatus'] == 'Not released yet' for r in results
+        )
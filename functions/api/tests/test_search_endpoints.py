@@ -7,359 +7,236 @@ These tests verify the full API flow including:
 - Filtering and pagination
 - Response formatting
 """
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
+import pytest
 from flask import Flask
-from firebase_functions.https_fn import Request
 
 from api.tests.conftest import VenueFactory
 
 # Import the actual function implementations
 import api.search as search_module
 
+# One app serves every test; endpoints only need its request context
+_APP = Flask(__name__)
 
-class TestSearchEndpoint:
-    """Tests for /search endpoint."""
+# Credentials and client handed to the endpoints by the stubbed loaders (read-only)
+_CREDS = {'api_key': 'test', 'token': 'test'}
+_CLIENT = Mock()
 
-    def create_mock_request(self, **kwargs):
-        """Create a mock Request object with query parameters."""
-        request = Mock(spec=Request)
-        request.args = Mock()
-        request.args.get = Mock(side_effect=lambda key, default='': kwargs.get(key, default))
-        request.args.to_dict = Mock(return_value=kwargs)
-        request.headers = Mock()
-        request.headers.get = Mock(return_value=None)
-        request.method = "GET"
-        return request
+# Query params shared by every /search_map request: user plus the NYC bounding box
+_BBOX = {'userId': 'test_user', 'swLat': '40.7', 'swLng': '-74.02', 'neLat': '40.8', 'neLng': '-73.93'}
 
-    def call_endpoint(self, endpoint_func, request):
-        """Call an endpoint function and extract the response."""
-        app = Flask(__name__)
-        with app.test_request_context():
-            result = endpoint_func(request)
-            # The decorator wraps the response, extract it
-            if hasattr(result, 'get_json'):
-                response = result.get_json()
-                status_code = result.status_code
-            else:
-                response, status_code = result
-            return response, status_code
-
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.build_search_payload')
-    def test_search_basic(self, _mock_build_payload, mock_fetch, mock_build_client, mock_credentials):
-        """Basic search without filters."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
-
-        # Mock fetch_until_enough_results to return test data
-        mock_venues = VenueFactory.create_batch(5)
-        # Convert to format expected by the endpoint (already formatted by filter_and_format_venues)
-        formatted_venues = []
-        for venue in mock_venues:
-            venue_data = venue.get('_source') or venue
-            formatted_venues.append({
-                'id': (
-                    venue_data.get('id', {}).get('resy')
-                    if isinstance(venue_data.get('id'), dict)
-                    else venue_data.get('id')
-                ),
-                'name': venue_data.get('name', ''),
-                'type': venue_data.get('cuisine', [None])[0] if venue_data.get('cuisine') else '',
-                'price_range': venue_data.get('price_range_id', 0),
-                'locality': venue_data.get('locality', 'N/A'),
-                'region': venue_data.get('region', 'N/A'),
-                'neighborhood': venue_data.get('neighborhood', ''),
-                'latitude': venue_data.get('_geoloc', {}).get('lat'),
-                'longitude': venue_data.get('_geoloc', {}).get('lng'),
-                'imageUrl': venue_data.get('images', [None])[0] if venue_data.get('images') else None,
-            })
-
-        mock_fetch.return_value = (formatted_venues, 100, False)
 
-        request = self.create_mock_request(
-            userId='test_user',
-            query='Italian',
-        )
+class _StubArgs:
+    """Query-string stand-in exposing the two methods the endpoints call."""
 
-        response, status_code = self.call_endpoint(search_module.search, request)
+    __slots__ = ('_values',)
 
-        assert status_code == 200
-        assert response['success'] is True
-        assert len(response['data']) == 5
-        assert 'pagination' in response
-
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.build_search_payload')
-    def test_search_with_cuisines(self, _mock_build_payload, mock_fetch, mock_build_client, mock_credentials):
-        """Search with cuisine filter."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
-
-        mock_venues = VenueFactory.with_cuisine("Italian", 3)
-        mock_fetch.return_value = (mock_venues, 50, False)
+    def __init__(self, values):
+        self._values = values
 
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+    def get(self, key, default=''):
+        return self._values.get(key, default)
 
-        mock_venues = VenueFactory.with_cuisine("Italian", 3)
-        formatted_venues = []
-        for venue in mock_venues:
-            venue_data = venue.get('_source') or venue
-            formatted_venues.append({
-                'id': (
-                    venue_data.get('id', {}).get('resy')
-                    if isinstance(venue_data.get('id'), dict)
-                    else venue_data.get('id')
-                ),
-                'name': venue_data.get('name', ''),
-                'type': venue_data.get('cuisine', [None])[0] if venue_data.get('cuisine') else '',
-                'price_range': venue_data.get('price_range_id', 0),
-                'locality': venue_data.get('locality', 'N/A'),
-                'region': venue_data.get('region', 'N/A'),
-                'neighborhood': venue_data.get('neighborhood', ''),
-                'latitude': venue_data.get('_geoloc', {}).get('lat'),
-                'longitude': venue_data.get('_geoloc', {}).get('lng'),
-                'imageUrl': venue_data.get('images', [None])[0] if venue_data.get('images') else None,
-            })
-        mock_fetch.return_value = (formatted_venues, 50, False)
+    def to_dict(self):
+        return self._values
 
-        request = self.create_mock_request(
-            userId='test_user',
-            cuisines='Italian,Japanese',
-        )
 
-        response, status_code = self.call_endpoint(search_module.search, request)
+class _StubRequest:
+    """Minimal GET request carrying only the attributes the endpoints read."""
 
-        assert status_code == 200
-        assert response['success'] is True
-        assert len(response['data']) == 3
-
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.build_search_payload')
-    def test_search_with_price_ranges(
-        self, _mock_build_payload, mock_fetch, mock_build_client, mock_credentials
-    ):
-        """Search with price range filter."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+    __slots__ = ('args', 'headers', 'method')
 
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+    def __init__(self, **kwargs):
+        self.args = _StubArgs(kwargs)
+        self.headers = {}
+        self.method = "GET"
 
-        mock_venues = VenueFactory.with_price_range(4, 2)
-        formatted_venues = []
-        for venue in mock_venues:
-            venue_data = venue.get('_source') or venue
-            formatted_venues.append({
-                'id': (
-                    venue_data.get('id', {}).get('resy')
-                    if isinstance(venue_data.get('id'), dict)
-                    else venue_data.get('id')
-                ),
-                'name': venue_data.get('name', ''),
-                'type': venue_data.get('cuisine', [None])[0] if venue_data.get('cuisine') else '',
-                'price_range': venue_data.get('price_range_id', 0),
-                'locality': venue_data.get('locality', 'N/A'),
-                'region': venue_data.get('region', 'N/A'),
-                'neighborhood': venue_data.get('neighborhood', ''),
-                'latitude': venue_data.get('_geoloc', {}).get('lat'),
-                'longitude': venue_data.get('_geoloc', {}).get('lng'),
-                'imageUrl': venue_data.get('images', [None])[0] if venue_data.get('images') else None,
-            })
-        mock_fetch.return_value = (formatted_venues, 30, False)
 
-        request = self.create_mock_request(
-            userId='test_user',
-            priceRanges='2,4',
-        )
+class _CallCounter:
+    """Callable stand-in for collaborators whose only checked behaviour is being called."""
 
-        response, status_code = self.call_endpoint(search_module.search, request)
+    __slots__ = ('calls',)
 
-        assert status_code == 200
-        assert response['success'] is True
-        assert len(response['data']) == 2
+    def __init__(self):
+        self.calls = 0
 
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    def test_search_no_filters_error(self, mock_build_client, mock_credentials):
-        """Search without any filters should return error."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+    def __call__(self, *_args, **_kwargs):
+        self.calls += 1
 
-        request = self.create_mock_request(
-            userId='test_user',
-        )
 
-        response, status_code = self.call_endpoint(search_module.search, request)
+def _format_venue(venue):
+    """Format a VenueFactory hit the way filter_and_format_venues would."""
+    source = venue['_source']
+    images = source['images']
+    return {
+        'id': source['id']['resy'],
+        'name': source['name'],
+        'type': source['cuisine'][0],
+        'price_range': source['price_range_id'],
+        'locality': source['locality'],
+        'region': source['region'],
+        'neighborhood': source['neighborhood'],
+        'latitude': source['_geoloc']['lat'],
+        'longitude': source['_geoloc']['lng'],
+        'imageUrl': images[0] if images else None,
+    }
 
-        assert status_code == 400
-        assert response['success'] is False
-        assert 'error' in response
 
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.build_search_payload')
-    def test_search_pagination(self, _mock_build_payload, mock_fetch, mock_build_client, mock_credentials):
-        """Search with pagination (offset and perPage)."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+def _format_venues(venues):
+    """Format a batch of VenueFactory hits."""
+    return [_format_venue(venue) for venue in venues]
 
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
 
-        mock_venues = VenueFactory.create_batch(20)
-        formatted_venues = []
-        for venue in mock_venues:
-            venue_data = venue.get('_source') or venue
-            formatted_venues.append({
-                'id': (
-                    venue_data.get('id', {}).get('resy')
-                    if isinstance(venue_data.get('id'), dict)
-                    else venue_data.get('id')
-                ),
-                'name': venue_data.get('name', ''),
-                'type': venue_data.get('cuisine', [None])[0] if venue_data.get('cuisine') else '',
-                'price_range': venue_data.get('price_range_id', 0),
-                'locality': venue_data.get('locality', 'N/A'),
-                'region': venue_data.get('region', 'N/A'),
-                'neighborhood': venue_data.get('neighborhood', ''),
-                'latitude': venue_data.get('_geoloc', {}).get('lat'),
-                'longitude': venue_data.get('_geoloc', {}).get('lng'),
-                'imageUrl': venue_data.get('images', [None])[0] if venue_data.get('images') else None,
-            })
-        mock_fetch.return_value = (formatted_venues, 100, True)
+# Pre-formatted search cache contents: exactly one default page (perPage=20), which
+# covers a first-page request so a cache hit needs no fetch
+_CACHED_RESULTS = _format_venues(VenueFactory.cached_batch(20))
+
+
+class _EndpointTestBase:
+    """Request/response helpers shared by the endpoint test classes."""
 
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _request_context(cls):
+        """One pushed request context per test class; endpoints only need it for responses."""
+        with _APP.test_request_context():
+            yield
+
+    @pytest.fixture(autouse=True)
+    def _stub_resy_access(self, monkeypatch):
+        """Swap in canned credentials and client; no test asserts on these calls."""
+        monkeypatch.setattr(search_module, 'load_credentials', lambda _user_id: _CREDS)
+        monkeypatch.setattr(search_module, 'build_resy_client', lambda _config: _CLIENT)
+
+    def create_mock_request(self, **kwargs):
+        """Create a stub GET request with query parameters."""
+        return _StubRequest(**kwargs)
+
+    def call_endpoint(self, endpoint_func, request):
+        """Call an endpoint function and extract the response."""
+        result = endpoint_func(request)
+        # The decorator wraps the response, extract it
+        if hasattr(result, 'get_json'):
+            response = result.get_json()
+            status_code = result.status_code
+        elif isinstance(result, dict):
+            # success_response returns a bare body, which Flask serves as a 200
+            response, status_code = result, 200
+        else:
+            response, status_code = result
+        return response, status_code
+
+
+class TestSearchEndpoint(_EndpointTestBase):
+    """Tests for /search endpoint."""
+
+    @pytest.mark.parametrize(
+        "query_args,make_venues,total,has_more,expected_len,expected_offset",
+        [
+            ({'query': 'Italian'}, lambda: VenueFactory.cached_batch(5), 100, False, 5, 0),
+            (
+                {'cuisines': 'Italian,Japanese'},
+                lambda: VenueFactory.with_cuisine("Italian", 3), 50, False, 3, 0,
+            ),
+            ({'priceRanges': '2,4'}, lambda: VenueFactory.with_price_range(4, 2), 30, False, 2, 0),
+            # Second page of a result set that has more pages behind it
+            (
+                {'query': 'Restaurant', 'offset': '20', 'perPage': '20'},
+                lambda: VenueFactory.cached_batch(20), 100, True, 0, 20,
+            ),
+        ],
+        ids=["basic", "cuisines", "price_ranges", "pagination"],
+    )
+    @patch.multiple(
+        search_module,
+        fetch_until_enough_results=DEFAULT,
+        build_search_payload=DEFAULT,
+    )
+    def test_search(
+        self, query_args, make_venues, total, has_more, expected_len, expected_offset, **mocks
+    ):
+        """Search with a query, cuisine, price range, or paging parameters."""
+        # fetch_until_enough_results returns venues already formatted by filter_and_format_venues
+        formatted_venues = _format_venues(make_venues())
+        mocks['fetch_until_enough_results'].return_value = (formatted_venues, total, has_more)
+
+        request = self.create_mock_request(userId='test_user', **query_args)
+
+        response, status_code = self.call_endpoint(search_module.search, request)
+
+        assert status_code == 200
+        assert response['success'] is True
+        assert len(response['data']['results']) == expected_len
+        assert response['data']['pagination']['offset'] == expected_offset
+        assert response['data']['pagination']['hasMore'] is has_more
+
+    def test_search_no_filters_error(self):
+        """Search without any filters should return error."""
         request = self.create_mock_request(
             userId='test_user',
-            query='Restaurant',
-            offset='20',
-            perPage='20',
         )
 
         response, status_code = self.call_endpoint(search_module.search, request)
 
-        assert status_code == 200
-        assert response['success'] is True
-        assert response['pagination']['offset'] == 20
-        assert response['pagination']['hasMore'] is True
+        assert status_code == 400
+        assert response['success'] is False
+        assert 'error' in response
 
 
-class TestSearchMapEndpoint:
+class TestSearchMapEndpoint(_EndpointTestBase):
     """Tests for /search_map endpoint."""
 
-    def create_mock_request(self, **kwargs):
-        """Create a mock Request object with query parameters."""
-        request = Mock(spec=Request)
-        request.args = Mock()
-        request.args.get = Mock(side_effect=lambda key, default='': kwargs.get(key, default))
-        request.args.to_dict = Mock(return_value=kwargs)
-        request.headers = Mock()
-        request.headers.get = Mock(return_value=None)
-        request.method = "GET"
-        return request
-
-    def call_endpoint(self, endpoint_func, request):
-        """Call an endpoint function and extract the response."""
-        app = Flask(__name__)
-        with app.test_request_context():
-            result = endpoint_func(request)
-            # The decorator wraps the response, extract it
-            if hasattr(result, 'get_json'):
-                response = result.get_json()
-                status_code = result.status_code
-            else:
-                response, status_code = result
-            return response, status_code
-
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.get_search_cache_key')
-    @patch('api.search.get_cached_search_results')
-    @patch('api.search.save_search_results_to_cache')
-    def test_search_map_basic(
-        self, _mock_save_cache, mock_get_cache, mock_cache_key,
-        mock_fetch, mock_build_client, mock_credentials
-    ):
+    @patch.multiple(
+        search_module,
+        fetch_until_enough_results=DEFAULT,
+        get_search_cache_key=DEFAULT,
+        get_cached_search_results=DEFAULT,
+        save_search_results_to_cache=DEFAULT,
+    )
+    def test_search_map_basic(self, **mocks):
         """Basic map search without filters."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+        mock_fetch = mocks['fetch_until_enough_results']
+        mock_cache_key = mocks['get_search_cache_key']
+        mock_get_cache = mocks['get_cached_search_results']
         mock_get_cache.return_value = None  # Cache miss
         mock_cache_key.return_value = 'test_cache_key'
 
-        mock_venues = VenueFactory.create_batch(10)
+        mock_venues = VenueFactory.cached_batch(10)
         mock_fetch.return_value = (mock_venues, 50, False)
 
-        request = self.create_mock_request(
-            userId='test_user',
-            swLat='40.7',
-            swLng='-74.02',
-            neLat='40.8',
-            neLng='-73.93',
-        )
+        request = self.create_mock_request(**_BBOX)
 
         response, status_code = self.call_endpoint(search_module.search_map, request)
 
         assert status_code == 200
         assert response['success'] is True
-        assert len(response['data']) == 10
-        assert 'pagination' in response
-
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.get_search_cache_key')
-    @patch('api.search.get_cached_search_results')
-    def test_search_map_uses_cache(
-        self, mock_get_cache, mock_cache_key,
-        mock_fetch, mock_build_client, mock_credentials
-    ):
+        assert len(response['data']['results']) == 10
+        assert 'pagination' in response['data']
+
+    @patch.multiple(
+        search_module,
+        get_search_cache_key=DEFAULT,
+        get_cached_search_results=DEFAULT,
+    )
+    def test_search_map_uses_cache(self, monkeypatch, **mocks):
         """Map search should use cached results when available."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+        fetch_counter = _CallCounter()
+        monkeypatch.setattr(search_module, 'fetch_until_enough_results', fetch_counter)
+        mock_cache_key = mocks['get_search_cache_key']
+        mock_get_cache = mocks['get_cached_search_results']
         mock_cache_key.return_value = 'test_cache_key'
 
         # Return cached data - enough for the requested page (offset=0, perPage=20)
-        cached_venues = VenueFactory.create_batch(25)  # More than needed
-        formatted_cached = []
-        for venue in cached_venues:
-            venue_data = venue.get('_source') or venue
-            formatted_cached.append({
-                'id': (
-                    venue_data.get('id', {}).get('resy')
-                    if isinstance(venue_data.get('id'), dict)
-                    else venue_data.get('id')
-                ),
-                'name': venue_data.get('name', ''),
-                'type': venue_data.get('cuisine', [None])[0] if venue_data.get('cuisine') else '',
-                'price_range': venue_data.get('price_range_id', 0),
-                'locality': venue_data.get('locality', 'N/A'),
-                'region': venue_data.get('region', 'N/A'),
-                'neighborhood': venue_data.get('neighborhood', ''),
-                'latitude': venue_data.get('_geoloc', {}).get('lat'),
-                'longitude': venue_data.get('_geoloc', {}).get('lng'),
-                'imageUrl': venue_data.get('images', [None])[0] if venue_data.get('images') else None,
-            })
         mock_get_cache.return_value = {
-            'results': formatted_cached,
+            'results': _CACHED_RESULTS,
             'total': 50,
             'timestamp': 1000.0
         }
 
         request = self.create_mock_request(
-            userId='test_user',
-            swLat='40.7',
-            swLng='-74.02',
-            neLat='40.8',
-            neLng='-73.93',
+            **_BBOX,
             offset='0',
             perPage='20',
         )
@@ -368,29 +245,26 @@ class TestSearchMapEndpoint:
 
         assert status_code == 200
         assert response['success'] is True
-        assert len(response['data']) == 20  # perPage=20
+        assert len(response['data']['results']) == 20  # perPage=20
         # Verify fetch_until_enough_results was not called (cache was sufficient)
-        assert mock_fetch.call_count == 0
-        # Should not call fetch_until_enough_results when cache hit
-        mock_fetch.assert_not_called()
-
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.get_search_cache_key')
-    @patch('api.search.get_cached_search_results')
-    @patch('api.search.save_search_results_to_cache')
-    def test_search_map_available_only(
-        self, _mock_save_cache, mock_get_cache, mock_cache_key,
-        mock_fetch, mock_build_client, mock_credentials
-    ):
+        assert fetch_counter.calls == 0
+
+    @patch.multiple(
+        search_module,
+        fetch_until_enough_results=DEFAULT,
+        get_search_cache_key=DEFAULT,
+        get_cached_search_results=DEFAULT,
+        save_search_results_to_cache=DEFAULT,
+    )
+    def test_search_map_available_only(self, **mocks):
         """Map search with available_only filter."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+        mock_fetch = mocks['fetch_until_enough_results']
+        mock_cache_key = mocks['get_search_cache_key']
+        mock_get_cache = mocks['get_cached_search_results']
         mock_get_cache.return_value = None
         mock_cache_key.return_value = 'test_cache_key'
 
-        mock_venues = VenueFactory.create_batch(5)
+        mock_venues = VenueFactory.cached_batch(5)
         # Add availableTimes to mock venues
         for venue in mock_venues:
             venue['availableTimes'] = ['6:00 PM', '7:00 PM']
@@ -398,11 +272,7 @@ class TestSearchMapEndpoint:
         mock_fetch.return_value = (mock_venues, 20, False)
 
         request = self.create_mock_request(
-            userId='test_user',
-            swLat='40.7',
-            swLng='-74.02',
-            neLat='40.8',
-            neLng='-73.93',
+            **_BBOX,
             available_only='true',
             available_day='2026-02-14',
             available_party_size='2',
@@ -412,28 +282,27 @@ class TestSearchMapEndpoint:
 
         assert status_code == 200
         assert response['success'] is True
-        assert len(response['data']) == 5
+        assert len(response['data']['results']) == 5
         # Verify fetch_until_enough_results was called with fetch_availability=True
         call_args = mock_fetch.call_args
         assert call_args[1]['fetch_availability'] is True
 
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.get_search_cache_key')
-    @patch('api.search.get_cached_search_results')
-    @patch('api.search.save_search_results_to_cache')
-    def test_search_map_not_released_only(
-        self, _mock_save_cache, mock_get_cache, mock_cache_key,
-        mock_fetch, mock_build_client, mock_credentials
-    ):
+    @patch.multiple(
+        search_module,
+        fetch_until_enough_results=DEFAULT,
+        get_search_cache_key=DEFAULT,
+        get_cached_search_results=DEFAULT,
+        save_search_results_to_cache=DEFAULT,
+    )
+    def test_search_map_not_released_only(self, **mocks):
         """Map search with not_released_only filter."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+        mock_fetch = mocks['fetch_until_enough_results']
+        mock_cache_key = mocks['get_search_cache_key']
+        mock_get_cache = mocks['get_cached_search_results']
         mock_get_cache.return_value = None
         mock_cache_key.return_value = 'test_cache_key'
 
-        mock_venues = VenueFactory.create_batch(3)
+        mock_venues = VenueFactory.cached_batch(3)
         # Add availabilityStatus to mock venues
         for venue in mock_venues:
             venue['availabilityStatus'] = 'Not released yet'
@@ -441,11 +310,7 @@ class TestSearchMapEndpoint:
         mock_fetch.return_value = (mock_venues, 15, False)
 
         request = self.create_mock_request(
-            userId='test_user',
-            swLat='40.7',
-            swLng='-74.02',
-            neLat='40.8',
-            neLng='-73.93',
+            **_BBOX,
             not_released_only='true',
             available_day='2026-02-14',
             available_party_size='2',
@@ -455,39 +320,34 @@ class TestSearchMapEndpoint:
 
         assert status_code == 200
         assert response['success'] is True
-        assert len(response['data']) == 3
+        assert len(response['data']['results']) == 3
         # Verify fetch_until_enough_results was called with fetch_availability=True
         call_args = mock_fetch.call_args
         assert call_args[1]['fetch_availability'] is True
 
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.get_search_cache_key')
-    @patch('api.search.get_cached_search_results')
-    def test_search_map_pagination_over_filtered(
-        self, mock_get_cache, mock_cache_key,
-        mock_fetch, mock_build_client, mock_credentials
-    ):
+    @patch.multiple(
+        search_module,
+        fetch_until_enough_results=DEFAULT,
+        get_search_cache_key=DEFAULT,
+        get_cached_search_results=DEFAULT,
+    )
+    def test_search_map_pagination_over_filtered(self, **mocks):
         """Map search pagination when filtering by availability."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+        mock_fetch = mocks['fetch_until_enough_results']
+        mock_cache_key = mocks['get_search_cache_key']
+        mock_get_cache = mocks['get_cached_search_results']
         mock_get_cache.return_value = None
         mock_cache_key.return_value = 'test_cache_key'
 
         # First 20 filtered results
-        all_filtered = VenueFactory.create_batch(20)
+        all_filtered = VenueFactory.cached_batch(20)
         for venue in all_filtered:
             venue['availableTimes'] = ['6:00 PM']
 
         mock_fetch.return_value = (all_filtered, 100, False)
 
         request = self.create_mock_request(
-            userId='test_user',
-            swLat='40.7',
-            swLng='-74.02',
-            neLat='40.8',
-            neLng='-73.93',
+            **_BBOX,
             available_only='true',
             available_day='2026-02-14',
             available_party_size='2',
@@ -499,66 +359,56 @@ class TestSearchMapEndpoint:
 
         assert status_code == 200
         assert response['success'] is True
-        assert len(response['data']) == 20
+        assert len(response['data']['results']) == 20
         # When paginating over availability-filtered results, total is omitted; use foundSoFar
-        assert response['pagination'].get('isFiltered') is True
-        assert response['pagination']['foundSoFar'] == 20
-
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    @patch('api.search.fetch_until_enough_results')
-    @patch('api.search.get_search_cache_key')
-    @patch('api.search.get_cached_search_results')
-    @patch('api.search.update_search_progress')
-    def test_search_map_with_job_id(
-        self, mock_progress, mock_get_cache, mock_cache_key,
-        mock_fetch, mock_build_client, mock_credentials
-    ):
+        assert response['data']['pagination'].get('isFiltered') is True
+        assert response['data']['pagination']['foundSoFar'] == 20
+
+    @patch.multiple(
+        search_module,
+        fetch_until_enough_results=DEFAULT,
+        get_search_cache_key=DEFAULT,
+        get_cached_search_results=DEFAULT,
+    )
+    def test_search_map_with_job_id(self, monkeypatch, **mocks):
         """Map search with job ID for progress tracking."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+        progress_counter = _CallCounter()
+        monkeypatch.setattr(search_module, 'update_search_progress', progress_counter)
+        mock_fetch = mocks['fetch_until_enough_results']
+        mock_cache_key = mocks['get_search_cache_key']
+        mock_get_cache = mocks['get_cached_search_results']
         mock_get_cache.return_value = None
         mock_cache_key.return_value = 'test_cache_key'
 
-        mock_venues = VenueFactory.create_batch(10)
+        mock_venues = VenueFactory.cached_batch(10)
         mock_fetch.return_value = (mock_venues, 50, False)
 
         request = self.create_mock_request(
-            userId='test_user',
+            **_BBOX,
             jobId='test_job_123',
-            swLat='40.7',
-            swLng='-74.02',
-            neLat='40.8',
-            neLng='-73.93',
         )
 
         _response, status_code = self.call_endpoint(search_module.search_map, request)
 
         assert status_code == 200
         # Verify progress updates were called
-        assert mock_progress.call_count > 0
+        assert progress_counter.calls > 0
 
-    @patch('api.search.load_credentials')
-    @patch('api.search.build_resy_client')
-    def test_search_map_error_handling(self, mock_build_client, mock_credentials):
+    @patch.multiple(
+        search_module,
+        fetch_until_enough_results=DEFAULT,
+    )
+    def test_search_map_error_handling(self, **mocks):
         """Map search should handle errors gracefully."""
-        mock_credentials.return_value = {'api_key': 'test', 'token': 'test'}
-        mock_build_client.return_value = Mock()
+        mock_fetch = mocks['fetch_until_enough_results']
 
         # Simulate error in fetch_until_enough_results
-        with patch('api.search.fetch_until_enough_results') as mock_fetch:
-            mock_fetch.side_effect = Exception("API Error")
-
-            request = self.create_mock_request(
-                userId='test_user',
-                swLat='40.7',
-                swLng='-74.02',
-                neLat='40.8',
-                neLng='-73.93',
-            )
-
-            response, status_code = self.call_endpoint(search_module.search_map, request)
-
-            assert status_code == 500
-            assert response['success'] is False
-            assert 'error' in response
+        mock_fetch.side_effect = Exception("API Error")
+
+        request = self.create_mock_request(**_BBOX)
+
+        response, status_code = self.call_endpoint(search_module.search_map, request)
+
+        assert status_code == 500
+        assert response['success'] is False
+        assert 'error' in response
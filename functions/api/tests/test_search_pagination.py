@@ -5,6 +5,7 @@ This is the core algorithm that fetches pages until we have enough filtered resu
 These tests are especially important for availability filtering scenarios where
 only a small percentage of venues pass the filter.
 """
+import threading
 from unittest.mock import patch
 
 from api.tests.conftest import VenueFactory, AvailabilityFactory
@@ -34,16 +35,12 @@ class TestPaginationBasic:
         # It doesn't check the next page unless we need more results
         assert has_more is True
 
-    def test_need_multiple_pages(self, empty_filters):
+    def test_need_multiple_pages(self, empty_filters, mock_search_func):
         """Need to fetch multiple pages to get enough results."""
         # 5 venues per page pass filters, need 20 total
-        def search_func(page):
-            if page <= 4:
-                # Each page has 20 venues, but only 5 pass filters
-                all_hits = VenueFactory.create_batch(20)
-                # Return all hits (filtering happens in filter_and_format_venues)
-                return all_hits, 80
-            return [], 80
+        # Each page has 20 venues, but only 5 pass filters
+        # (filtering happens in filter_and_format_venues)
+        search_func = mock_search_func([(VenueFactory.cached_batch(20), 80)] * 4)
 
         # Mock filter_and_format_venues to return only 5 per page
         with patch('api.utils.filter_and_format_venues') as mock_filter:
@@ -61,13 +58,10 @@ class TestPaginationBasic:
             assert len(results) == 20
             assert mock_filter.call_count == 4  # Called 4 times
 
-    def test_max_fetches_exceeded(self, empty_filters):
+    def test_max_fetches_exceeded(self, empty_filters, mock_search_func):
         """Stop fetching when max_fetches is reached."""
         # Only 1 venue per page passes, max_fetches=10, need 20
-        def search_func(page):
-            if page <= 10:
-                return VenueFactory.create_batch(20), 200
-            return [], 200
+        search_func = mock_search_func([(VenueFactory.cached_batch(20), 200)] * 10)
 
         with patch('api.utils.filter_and_format_venues') as mock_filter:
             def filter_side_effect(hits, _filters, seen_ids, **_kwargs):
@@ -77,14 +71,11 @@ class TestPaginationBasic:
 
             mock_filter.side_effect = filter_side_effect
 
-            results, _total, _has_more = fetch_until_enough_results(
-                search_func, target_count=20, filters=empty_filters, max_fetches=10
-            )
-
             results, _total, has_more = fetch_until_enough_results(
                 search_func, target_count=20, filters=empty_filters, max_fetches=10
             )
             assert len(results) == 10  # Only 10 pages fetched
+            assert mock_filter.call_count == 10
             assert has_more is True  # More results available but max_fetches reached
 
     def test_empty_results_early(self, empty_filters):
@@ -128,6 +119,132 @@ class TestPaginationBasic:
         assert 100 in unique_ids
         assert 200 in unique_ids
 
+    def test_batched_fetch_matches_sequential(self, empty_filters):
+        """Parallel page batches return the same results and stop at the same page."""
+        pages = {page: VenueFactory.create_batch(20) for page in range(1, 6)}
+
+        def search_func(page):
+            return pages.get(page, []), 100
+
+        with patch('api.utils.filter_and_format_venues') as mock_filter:
+            def filter_side_effect(hits, _filters, seen_ids, **_kwargs):
+                return hits[:3], {}, seen_ids
+
+            mock_filter.side_effect = filter_side_effect
+
+            sequential = fetch_until_enough_results(
+                search_func, target_count=10, filters=empty_filters, max_fetches=10
+            )
+            batched = fetch_until_enough_results(
+                search_func, target_count=10, filters=empty_filters, max_fetches=10, batch_size=3
+            )
+
+        assert batched == sequential
+        assert len(batched[0]) == 12
+        # Both runs stop after page 4
+        assert mock_filter.call_count == 8
+
+    def test_batch_size_follows_pass_rate(self, empty_filters):
+        """After the first batch, only the pages the pass rate says are needed are fetched."""
+        fetched_pages = []
+
+        def search_func(page):
+            fetched_pages.append(page)
+            return VenueFactory.create_batch(20), 200
+
+        with patch('api.utils.filter_and_format_venues') as mock_filter:
+            def filter_side_effect(hits, _filters, seen_ids, **_kwargs):
+                return hits[:2], {}, seen_ids
+
+            mock_filter.side_effect = filter_side_effect
+
+            results, _total, _has_more = fetch_until_enough_results(
+                search_func, target_count=10, filters=empty_filters, max_fetches=10, batch_size=4
+            )
+
+        assert len(results) == 10
+        # Pages 1-4 yield 8 results; at 2 per page one more page is enough
+        assert sorted(fetched_pages) == [1, 2, 3, 4, 5]
+
+    def test_prefetch_matches_sequential(self, empty_filters):
+        """Prefetching the next page returns the same results with one speculative fetch."""
+        pages = {page: VenueFactory.create_batch(20) for page in range(1, 11)}
+        fetched_pages = []
+
+        def search_func(page):
+            fetched_pages.append(page)
+            return pages.get(page, []), 200
+
+        with patch('api.utils.filter_and_format_venues') as mock_filter:
+            def filter_side_effect(hits, _filters, seen_ids, **_kwargs):
+                return hits[:5], {}, seen_ids
+
+            mock_filter.side_effect = filter_side_effect
+
+            sequential = fetch_until_enough_results(
+                search_func, target_count=20, filters=empty_filters, max_fetches=10
+            )
+            fetched_pages.clear()
+            prefetched = fetch_until_enough_results(
+                search_func, target_count=20, filters=empty_filters, max_fetches=10, prefetch=True
+            )
+
+        assert prefetched == sequential
+        # Page 5 is prefetched while page 4 is filtered, but the fetch returns without
+        # waiting on it, so it may or may not have run yet; nothing past it is requested
+        assert set(fetched_pages) - {5} == {1, 2, 3, 4}
+        assert mock_filter.call_count == 8
+
+    def test_prefetch_with_large_pages(self, empty_filters):
+        """With 50-hit pages (bounding-box searches) the next page is requested before filtering."""
+        pages = {page: VenueFactory.cached_batch(50) for page in range(1, 4)}
+        next_page_requested = {page: threading.Event() for page in range(1, 5)}
+        fetched_pages = []
+        overlapped = []
+
+        def search_func(page):
+            fetched_pages.append(page)
+            next_page_requested[page].set()
+            return pages.get(page, []), 150
+
+        with patch('api.utils.filter_and_format_venues') as mock_filter:
+            def filter_side_effect(hits, _filters, seen_ids, **_kwargs):
+                page = mock_filter.call_count
+                overlapped.append(next_page_requested[page + 1].wait(timeout=5))
+                return hits[:5], {}, seen_ids
+
+            mock_filter.side_effect = filter_side_effect
+
+            results, _total, _has_more = fetch_until_enough_results(
+                search_func, target_count=10, filters=empty_filters, max_fetches=10, prefetch=True
+            )
+
+        assert len(results) == 10
+        assert overlapped == [True, True]
+        assert sorted(fetched_pages) == [1, 2, 3]
+
+    def test_cursor_resumes_after_last_page(self, empty_filters):
+        """A second call with the returned cursor continues from the next Resy page."""
+        fetched_pages = []
+
+        def search_func(page):
+            fetched_pages.append(page)
+            return VenueFactory.create_batch(20), 100
+
+        cursor = {'page': 1, 'seen_ids': set()}
+        first, _total, _has_more = fetch_until_enough_results(
+            search_func, target_count=20, filters=empty_filters, max_fetches=10, cursor=cursor
+        )
+        assert len(first) == 20
+        assert cursor['page'] == 2
+
+        second, _total, _has_more = fetch_until_enough_results(
+            search_func, target_count=20, filters=empty_filters, max_fetches=10, cursor=cursor
+        )
+        assert len(second) == 20
+        assert fetched_pages == [1, 2]
+        assert cursor['page'] == 3
+
 
 class TestPaginationWithAvailabilityFiltering:
     """Pagination with availability-based filtering (critical scenario)."""
@@ -168,8 +285,9 @@ class TestPaginationWithAvailabilityFiltering:
                 return page_data[page - 1]
             return [], 80
 
-        # Mock get_venue_availability to return appropriate status
-        with patch('api.utils.get_venue_availability') as mock_availability:
+        # Mock both availability lookups (not_released_only uses the fast one)
+        with patch('api.utils.get_venue_availability') as mock_availability, \
+                patch('api.utils.get_venue_availability_fast', new=mock_availability):
             def availability_side_effect(venue_id, _day, _party_size, _config):
                 # Not-released venues are those with ID % 1000 < 10 (first few on each page)
                 # Each page has base_id = page * 1000
@@ -205,7 +323,7 @@ class TestPaginationWithAvailabilityFiltering:
             # Should have fetched 4 pages
             assert mock_availability.call_count >= 20  # At least 20 availability calls
 
-    def test_available_only_filter_sparse_results(self, available_only_filter, mock_config):
+    def test_available_only_filter_sparse_results(self, available_only_filter, mock_config, mock_search_func):
         """
         Test available_only filter when results are sparse.
 
@@ -224,10 +342,9 @@ class TestPaginationWithAvailabilityFiltering:
                 venues.append(VenueFactory.create(venue_id=base_id + 100 + i))
             return venues
 
-        def search_func(page):
-            if page <= 10:
-                return create_page_with_availability(page, 2, 18), 200
-            return [], 200
+        search_func = mock_search_func(
+            [(create_page_with_availability(page, 2, 18), 200) for page in range(1, 11)]
+        )
 
         with patch('api.utils.get_venue_availability') as mock_availability:
             def availability_side_effect(venue_id, _day, _party_size, _config):
@@ -256,18 +373,17 @@ class TestPaginationWithAvailabilityFiltering:
             assert all('availableTimes' in r for r in results)
             assert all(len(r['availableTimes']) > 0 for r in results)
 
-    def test_extremely_sparse_results(self, not_released_only_filter, mock_config):
+    def test_extremely_sparse_results(self, not_released_only_filter, mock_config, mock_search_func):
         """
         Edge case: Only 1 venue per page passes filter.
         max_fetches=10 -> only get 10 results max.
         Should return 10 results with has_more=True.
         """
-        def search_func(page):
-            if page <= 10:
-                return VenueFactory.create_batch(20), 200
-            return [], 200
+        # Pages are built in order, so page N holds venue ids 20N-19..20N
+        search_func = mock_search_func([(VenueFactory.create_batch(20), 200) for _ in range(10)])
 
-        with patch('api.utils.get_venue_availability') as mock_availability:
+        with patch('api.utils.get_venue_availability') as mock_availability, \
+                patch('api.utils.get_venue_availability_fast', new=mock_availability):
             # Make only the first venue on each page "Not released yet"
             def availability_side_effect(venue_id, _day, _party_size, _config):
                 # Venue IDs are sequential, so first venue on each page (1, 21, 41, etc.) is not released
@@ -297,14 +413,11 @@ class TestPaginationWithAvailabilityFiltering:
             # has_more would be True but we can't check it without re-fetching
             assert has_more  # Suppress unused variable warning
 
-    def test_filter_decimates_results(self, available_only_filter, mock_config):
+    def test_filter_decimates_results(self, available_only_filter, mock_config, mock_search_func):
         """
         Test when filter removes most results (only 2/100 venues pass).
         """
-        def search_func(page):
-            if page <= 5:
-                return VenueFactory.create_batch(20), 100
-            return [], 100
+        search_func = mock_search_func([(VenueFactory.create_batch(20), 100) for _ in range(5)])
 
         with patch('api.utils.get_venue_availability') as mock_availability:
             call_count = [0]
@@ -6,17 +6,25 @@ Tests cover:
 - filter_and_format_venues: Venue filtering and formatting logic
 - get_search_cache_key: Cache key generation
 """
+import threading
 import time
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from api.tests.conftest import VenueFactory
 from api.utils import (
     SEARCH_CACHE,
+    SEARCH_CACHE_MAX_ENTRIES,
     SEARCH_CACHE_TTL,
+    ProgressBatcher,
+    TokenBucket,
+    get_venue_availability,
     parse_search_filters,
     filter_and_format_venues,
     get_search_cache_key,
     get_cached_search_results,
+    invalidate_credentials,
+    load_credentials,
+    run_single_flight,
     save_search_results_to_cache,
 )
 
@@ -310,7 +318,7 @@ class TestGetSearchCacheKey:
 
         # Same params should generate same key
         assert key1 == key2
-        assert len(key1) == 32  # MD5 hash length
+        assert len(key1) == 32  # 128-bit hex digest
 
     def test_cache_key_includes_availability_when_filtering(self, geo_config_nyc):
         """Cache key should include availability params when include_availability=True."""
@@ -417,3 +425,144 @@ class TestCacheOperations:
 
         assert cached is None
         assert cache_key not in SEARCH_CACHE
+
+    def test_cache_is_bounded(self):
+        """Oldest entries are evicted once the cache is full."""
+        SEARCH_CACHE.clear()
+
+        for i in range(SEARCH_CACHE_MAX_ENTRIES + 1):
+            save_search_results_to_cache(f"bounded_key_{i}", [], 0)
+
+        assert len(SEARCH_CACHE) == SEARCH_CACHE_MAX_ENTRIES
+        assert get_cached_search_results("bounded_key_0") is None
+        assert get_cached_search_results(f"bounded_key_{SEARCH_CACHE_MAX_ENTRIES}") is not None
+
+
+class TestRunSingleFlight:
+    """Tests for in-process request coalescing."""
+
+    def test_concurrent_callers_share_one_call(self):
+        """Callers that arrive while a key is in flight reuse its result."""
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch():
+            calls.append(1)
+            release.wait(timeout=5)
+            return ['result']
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(run_single_flight('same_key', slow_fetch)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == [['result']] * 5
+
+    def test_key_released_after_completion(self):
+        """A later call for the same key runs fn again."""
+        assert run_single_flight('done_key', lambda: 1) == 1
+        assert run_single_flight('done_key', lambda: 2) == 2
+
+
+class TestProgressBatcher:
+    """Tests for throttled search progress writes."""
+
+    def test_intermediate_updates_merge_into_terminal_write(self):
+        """Page updates inside the flush interval are merged into the next write."""
+        write = Mock()
+        progress = ProgressBatcher('job_1', write, flush_interval=60)
+
+        progress.update({'status': 'started'})
+        progress.update({'pagesFetched': 1})
+        progress.update({'pagesFetched': 2, 'lastLog': 'page 2'})
+        progress.update({'status': 'done'})
+
+        assert write.call_count == 2
+        write.assert_called_with('job_1', {'pagesFetched': 2, 'lastLog': 'page 2', 'status': 'done'})
+
+    def test_no_job_id_is_noop(self):
+        """Without a job ID nothing is written."""
+        write = Mock()
+        progress = ProgressBatcher(None, write)
+
+        progress.update({'status': 'started'})
+        progress.flush()
+
+        write.assert_not_called()
+
+
+class TestTokenBucket:
+    """Tests for the shared Resy call limiter."""
+
+    def test_burst_then_waits_for_refill(self):
+        """Calls within capacity pass straight through; the next one sleeps for a token."""
+        bucket = TokenBucket(rate=1, capacity=2)
+
+        with patch('api.utils.time_module.sleep') as sleep:
+            bucket.acquire()
+            bucket.acquire()
+            sleep.assert_not_called()
+
+            bucket.acquire()
+
+        sleep.assert_called_once()
+        assert 0.9 < sleep.call_args[0][0] <= 1.0
+
+
+class TestCredentialsCache:
+    """Tests for the in-process per-user credentials cache."""
+
+    def test_reuses_credentials_until_invalidated(self):
+        """Repeat loads skip Firestore; invalidation forces a fresh read."""
+        doc = Mock(exists=True)
+        doc.to_dict.return_value = {'apiKey': 'key', 'token': 'tok'}
+
+        with patch('api.utils.firestore') as firestore_mock:
+            get = firestore_mock.client.return_value.collection.return_value.document.return_value.get
+            get.return_value = doc
+            invalidate_credentials('cache_user')
+
+            first = load_credentials('cache_user')
+            first['token'] = 'mutated'
+            second = load_credentials('cache_user')
+            assert get.call_count == 1
+            assert second['token'] == 'tok'
+
+            invalidate_credentials('cache_user')
+            load_credentials('cache_user')
+            assert get.call_count == 2
+
+
+class TestAvailabilityCache:
+    """Tests for the in-process venue availability cache."""
+
+    def test_repeat_lookup_skips_resy(self):
+        """A second lookup for the same venue, day and party size is served from cache."""
+        with patch('api.utils._fetch_venue_availability') as fetch:
+            fetch.return_value = {'times': ['6:00 PM'], 'status': None}
+
+            first = get_venue_availability(1, '2026-01-01', 2, {})
+            first['times'].append('mutated')
+            second = get_venue_availability(1, '2026-01-01', '2', {})
+            get_venue_availability(1, '2026-01-01', 4, {})
+
+        assert fetch.call_count == 2
+        assert second == {'times': ['6:00 PM'], 'status': None}
+
+    def test_failed_lookup_not_cached(self):
+        """Errors are retried on the next lookup instead of being served from cache."""
+        with patch('api.utils._fetch_venue_availability') as fetch:
+            fetch.return_value = {'times': [], 'status': 'Unable to fetch'}
+
+            get_venue_availability(1, '2026-01-01', 2, {})
+            get_venue_availability(1, '2026-01-01', 2, {})
+
+        assert fetch.call_count == 2
@@ -3,16 +3,20 @@ Shared utility functions for Resy Bot Cloud Functions
 Includes credential loading, search caching, and Resy API helpers
 """
 
-import json
 import logging
 import os
+import threading
 import time as time_module
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from hashlib import md5
+from functools import lru_cache
+from hashlib import blake2b
 from time import time
 
+import orjson
 import sentry_sdk
+from cachetools import TTLCache
 from firebase_admin import firestore
 from google import genai
 
@@ -24,12 +28,12 @@ from .resy_client.models import CalendarRequestParams, FindRequestBody, ResyConf
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Firestore client for progress updates (lazily initialized)
+# Process-wide Firestore client (lazily initialized)
 _firestore_client = None
 
 
-def _get_firestore_client():
-    """Lazily get Firestore client"""
+def get_firestore_client():
+    """Lazily get the Firestore client shared across modules"""
     global _firestore_client
     if _firestore_client is None:
         _firestore_client = firestore.client()
@@ -50,21 +54,92 @@ def update_search_progress(job_id: str | None, data: dict) -> None:
 
     print(f"[PROGRESS] Updating job {job_id} with data: {data}")
     try:
-        db = _get_firestore_client()
+        db = get_firestore_client()
         db.collection("searchJobs").document(job_id).set(data, merge=True)
     except Exception as e:
         # Don't let progress updates break the main search flow
         print(f"[PROGRESS] Error updating job {job_id}: {str(e)}")
 
 
+# Minimum spacing between progress writes for one search job
+PROGRESS_FLUSH_INTERVAL_SECONDS = 0.25
+# Statuses that end a job and are always written immediately
+PROGRESS_TERMINAL_STATUSES = frozenset({"done", "error"})
+
+
+class ProgressBatcher:
+    """
+    Buffer progress updates for one search job and write them in merged batches.
+
+    Updates are merged into a pending dict and flushed at most once per
+    PROGRESS_FLUSH_INTERVAL_SECONDS, except the first update and terminal
+    statuses, which are written immediately along with anything still pending.
+    """
+
+    def __init__(self, job_id: str | None, write=update_search_progress,
+                 flush_interval: float = PROGRESS_FLUSH_INTERVAL_SECONDS):
+        self.job_id = job_id
+        self.write = write
+        self.flush_interval = flush_interval
+        self.pending = {}
+        self.last_flush_ts = None
+        self._lock = threading.Lock()
+
+    def update(self, data: dict) -> None:
+        """Merge data into the pending update, flushing if it is due."""
+        if not self.job_id:
+            return
+        with self._lock:
+            self.pending.update(data)
+            due = (
+                self.last_flush_ts is None
+                or data.get("status") in PROGRESS_TERMINAL_STATUSES
+                or time() - self.last_flush_ts >= self.flush_interval
+            )
+            if not due:
+                return
+            to_write = self._take_pending()
+        self.write(self.job_id, to_write)
+
+    def flush(self) -> None:
+        """Write any pending update now."""
+        if not self.job_id:
+            return
+        with self._lock:
+            if not self.pending:
+                return
+            to_write = self._take_pending()
+        self.write(self.job_id, to_write)
+
+    def _take_pending(self) -> dict:
+        to_write, self.pending = self.pending, {}
+        self.last_flush_ts = time()
+        return to_write
+
+
 # Configuration
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
 GOOGLE_MAPS_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY', '')
 
 # Search results cache with TTL (5 minutes)
 # Format: {cache_key: {'results': [...], 'total': int, 'timestamp': float}}
-SEARCH_CACHE = {}
+# Bounded so a warm instance evicts least-recently-used searches instead of
+# holding every expired entry that was never read again.
 SEARCH_CACHE_TTL = 300  # 5 minutes in seconds
+SEARCH_CACHE_MAX_ENTRIES = 256
+SEARCH_CACHE = TTLCache(maxsize=SEARCH_CACHE_MAX_ENTRIES, ttl=SEARCH_CACHE_TTL)
+_search_cache_lock = threading.Lock()
+
+# Per-venue availability cached briefly so duplicate hits and back-to-back searches
+# for the same day and party size skip Resy. Failed lookups are not cached.
+AVAILABILITY_CACHE_TTL = 60  # seconds
+AVAILABILITY_CACHE = TTLCache(maxsize=4096, ttl=AVAILABILITY_CACHE_TTL)
+_availability_cache_lock = threading.Lock()
+_UNCACHED_AVAILABILITY_STATUSES = frozenset({'Unable to fetch', 'Resy temporarily unavailable'})
+
+# Searches currently being fetched, so identical concurrent requests can share one fetch
+_inflight_searches = {}
+_inflight_lock = threading.Lock()
 
 # Initialize Gemini AI client if API key is available
 gemini_client = None
@@ -91,6 +166,19 @@ else:
     CLOUD_FUNCTIONS_BASE = "https://us-central1-resybot-bd2db.cloudfunctions.net"
 
 
+# Per-user Resy credentials cached in-process so warm instances skip the Firestore read.
+# Endpoints that write resyCredentials call invalidate_credentials() for that user.
+CREDENTIALS_CACHE_TTL = 300  # 5 minutes in seconds
+CREDENTIALS_CACHE = TTLCache(maxsize=1024, ttl=CREDENTIALS_CACHE_TTL)
+_credentials_cache_lock = threading.Lock()
+
+
+def invalidate_credentials(user_id):
+    """Drop any cached credentials for user_id so the next load reads Firestore."""
+    with _credentials_cache_lock:
+        CREDENTIALS_CACHE.pop(user_id, None)
+
+
 def load_credentials(userId=None):
     """
     Load Resy credentials from Firestore or environment variables
@@ -106,8 +194,13 @@ def load_credentials(userId=None):
         The Firestore document uses camelCase field names (apiKey, paymentMethodId)
         but this function returns snake_case for backwards compatibility
     """
-    # If userId is provided, load from Firestore
+    # If userId is provided, load from Firestore (or the in-process cache)
     if userId:
+        with _credentials_cache_lock:
+            cached = CREDENTIALS_CACHE.get(userId)
+        if cached is not None:
+            return dict(cached)
+
         try:
             db = firestore.client()
             doc = db.collection('resyCredentials').document(userId).get()
@@ -136,7 +229,9 @@ def load_credentials(userId=None):
             }
 
             logger.info("✓ Loaded Resy credentials from Firestore for user %s", userId)
-            return credentials
+            with _credentials_cache_lock:
+                CREDENTIALS_CACHE[userId] = credentials
+            return dict(credentials)
 
         except Exception as e:
             logger.error("✗ Error loading credentials from Firestore: %s", e)
@@ -191,6 +286,42 @@ def _retry_resy(func, max_attempts=3, base_delay=0.3):
         raise last_error
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every request in the process.
+
+    acquire() blocks until a token is available, so callers can fan out with as
+    many workers as they like while Resy still sees at most `rate` calls per
+    second (after an initial burst of up to `capacity`).
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.last_refill_ts = time_module.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it has accrued if the bucket is empty."""
+        with self._lock:
+            now = time_module.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill_ts) * self.rate)
+            self.last_refill_ts = now
+            # Reserve the token now (possibly going negative) so waiters queue in order
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time_module.sleep(wait)
+
+
+# Per-process pacing for Resy calls, independent of how many worker threads run
+AVAILABILITY_RATE_PER_SECOND = 10
+SEARCH_PAGE_RATE_PER_SECOND = 5
+_availability_limiter = TokenBucket(AVAILABILITY_RATE_PER_SECOND)
+_search_limiter = TokenBucket(SEARCH_PAGE_RATE_PER_SECOND)
+
+
 def get_search_cache_key(query, filters, geo_config, include_availability=False):
     """
     Generate a unique cache key for a search query
@@ -203,7 +334,7 @@ def get_search_cache_key(query, filters, geo_config, include_availability=False)
                              Use True when caching availability-filtered results.
 
     Returns:
-        str: MD5 hash of the search parameters
+        str: blake2b hash of the search parameters
     """
     # Create a stable string representation of the search parameters
     # Exclude offset/perPage since we cache all results
@@ -211,7 +342,7 @@ def get_search_cache_key(query, filters, geo_config, include_availability=False)
         'query': query,
         'cuisines': sorted(filters.get('cuisines', [])),
         'price_ranges': sorted(filters.get('price_ranges', [])),
-        'geo': str(sorted(geo_config.items()))
+        'geo': geo_config,
     }
 
     # When caching availability-filtered results, include availability params in the key
@@ -223,8 +354,10 @@ def get_search_cache_key(query, filters, geo_config, include_availability=False)
         cache_params['available_party_size'] = filters.get('available_party_size', 2)
         cache_params['desired_time'] = filters.get('desired_time', '')
 
-    cache_str = json.dumps(cache_params, sort_keys=True)
-    return md5(cache_str.encode()).hexdigest()
+    # orjson canonicalizes straight to bytes; blake2b is a fast C digest and the
+    # key never leaves this process, so there's no need for anything stronger
+    cache_bytes = orjson.dumps(cache_params, option=orjson.OPT_SORT_KEYS)
+    return blake2b(cache_bytes, digest_size=16).hexdigest()
 
 
 def get_cached_search_results(cache_key):
@@ -237,15 +370,17 @@ def get_cached_search_results(cache_key):
     Returns:
         dict or None: Cached results if valid, None otherwise
     """
-    if cache_key not in SEARCH_CACHE:
+    with _search_cache_lock:
+        cached = SEARCH_CACHE.get(cache_key)
+    if cached is None:
         return None
 
-    cached = SEARCH_CACHE[cache_key]
     age = time() - cached['timestamp']
 
     if age > SEARCH_CACHE_TTL:
         # Cache expired, remove it
-        del SEARCH_CACHE[cache_key]
+        with _search_cache_lock:
+            SEARCH_CACHE.pop(cache_key, None)
         print(f"[CACHE] Cache expired for key {cache_key[:8]}... (age: {age:.1f}s)")
         return None
 
@@ -253,7 +388,45 @@ def get_cached_search_results(cache_key):
     return cached
 
 
-def save_search_results_to_cache(cache_key, results, total):
+def run_single_flight(key, fn):
+    """
+    Run fn once per key across concurrent callers in this instance.
+
+    The first caller for a key runs fn; callers that arrive while it is in
+    flight wait on the same Future and get its result (or exception) instead
+    of repeating the work.
+
+    Args:
+        key: Hashable key identifying identical work (e.g. a search cache key)
+        fn: Zero-arg callable to run
+
+    Returns:
+        fn's return value
+    """
+    with _inflight_lock:
+        future = _inflight_searches.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight_searches[key] = future
+
+    if not is_leader:
+        logger.info("[CACHE] Joining in-flight search for key %s...", str(key)[:8])
+        return future.result()
+
+    try:
+        result = fn()
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight_searches.pop(key, None)
+
+
+def save_search_results_to_cache(cache_key, results, total, has_more=False, cursor=None):
     """
     Save search results to cache
 
@@ -261,15 +434,35 @@ def save_search_results_to_cache(cache_key, results, total):
         cache_key: Cache key string
         results: List of search results
         total: Total count from Resy API
+        has_more: Whether Resy may have more results past the cached ones
+        cursor: Resume point from fetch_until_enough_results, so a later page
+            request only fetches the Resy pages it is missing
     """
-    SEARCH_CACHE[cache_key] = {
-        'results': results,
-        'total': total,
-        'timestamp': time()
-    }
+    with _search_cache_lock:
+        SEARCH_CACHE[cache_key] = {
+            'results': results,
+            'total': total,
+            'has_more': has_more,
+            'cursor': cursor,
+            'timestamp': time()
+        }
     print(f"[CACHE] Saved {len(results)} results to cache (key: {cache_key[:8]}...)")
 
 
+# Query params read by parse_search_filters, with their defaults
+_SEARCH_FILTER_PARAMS = (
+    ('cuisines', ''),
+    ('priceRanges', ''),
+    ('available_only', 'false'),
+    ('not_released_only', 'false'),
+    ('available_day', ''),
+    ('available_party_size', '2'),
+    ('desired_time', ''),
+    ('offset', '0'),
+    ('perPage', '20'),
+)
+
+
 def parse_search_filters(request_args):
     """
     Parse common search filter parameters from request arguments
@@ -277,27 +470,41 @@ def parse_search_filters(request_args):
     Returns:
         dict: Parsed filters including cuisines, price_ranges, availability params, and pagination
     """
-    cuisines_param = request_args.get('cuisines', '').strip()
-    price_ranges_param = request_args.get('priceRanges', '').strip()
+    parsed = _parse_search_filters_cached(
+        tuple(request_args.get(name, default) for name, default in _SEARCH_FILTER_PARAMS)
+    )
+    # Hand back fresh lists so callers can't mutate the cached entry
+    return {**parsed, 'cuisines': list(parsed['cuisines']), 'price_ranges': list(parsed['price_ranges'])}
+
+
+@lru_cache(maxsize=1024)
+def _parse_search_filters_cached(raw_values):
+    """Parse the raw query-string values; memoized since hot searches repeat the same params."""
+    (
+        cuisines_param, price_ranges_param, available_only, not_released_only,
+        available_day, available_party_size, desired_time, offset, per_page,
+    ) = raw_values
+    cuisines_param = cuisines_param.strip()
+    price_ranges_param = price_ranges_param.strip()
 
     # Parse lists
-    cuisines = [c.strip() for c in cuisines_param.split(',') if c.strip()] if cuisines_param else []
+    cuisines = tuple(c.strip() for c in cuisines_param.split(',') if c.strip()) if cuisines_param else ()
     price_ranges = (
-        [int(p.strip()) for p in price_ranges_param.split(',') if p.strip().isdigit()]
+        tuple(int(p.strip()) for p in price_ranges_param.split(',') if p.strip().isdigit())
         if price_ranges_param
-        else []
+        else ()
     )
 
     # Parse availability parameters
-    available_only = request_args.get('available_only', 'false').lower() == 'true'
-    not_released_only = request_args.get('not_released_only', 'false').lower() == 'true'
-    available_day = request_args.get('available_day', '').strip()
-    available_party_size = int(request_args.get('available_party_size', '2'))
-    desired_time = request_args.get('desired_time', '').strip()
+    available_only = available_only.lower() == 'true'
+    not_released_only = not_released_only.lower() == 'true'
+    available_day = available_day.strip()
+    available_party_size = int(available_party_size)
+    desired_time = desired_time.strip()
 
     # Parse pagination - use offset instead of page for better filtering
-    offset = int(request_args.get('offset', '0'))
-    per_page = min(int(request_args.get('perPage', '20')), 50)  # Cap at 50
+    offset = int(offset)
+    per_page = min(int(per_page), 50)  # Cap at 50
 
     return {
         'cuisines': cuisines,
@@ -314,7 +521,8 @@ def parse_search_filters(request_args):
 
 def fetch_until_enough_results(
     search_func, target_count, filters, max_fetches=10,
-    config=None, fetch_availability=False, job_id=None
+    config=None, fetch_availability=False, progress=None, batch_size=1, cursor=None,
+    prefetch=False
 ):
     """
     Keep fetching results until we have enough filtered results
@@ -326,14 +534,29 @@ def fetch_until_enough_results(
         max_fetches: Maximum number of API calls to make
         config: ResyConfig object (optional, needed for availability fetching)
         fetch_availability: Whether to fetch available times for each venue
-        job_id: Optional job ID for Firestore progress updates
+        progress: Optional ProgressBatcher for Firestore progress updates
+        batch_size: Maximum number of Resy pages to request in parallel per round
+            trip. After the first batch, each batch is sized to the number of
+            pages the observed filter pass rate says are still needed (capped at
+            batch_size). Pages are still filtered in order and processing stops
+            at the same point as a sequential fetch, so at most batch_size - 1
+            pages are over-fetched.
+        cursor: Optional resume point, {'page': int, 'seen_ids': set}. Fetching
+            starts at cursor['page'] and dedupes against cursor['seen_ids'];
+            on return the cursor is updated in place to the next page to fetch,
+            so a later call can pick up where this one stopped.
+        prefetch: Request the next batch of pages while the current one is being
+            filtered. Overlaps a fetch round trip with availability checks, at
+            the cost of one speculative batch when the target is met.
 
     Returns:
         tuple: (results list, total_fetched, has_more)
     """
     all_results = []
-    seen_ids = set()
-    resy_page = 1
+    seen_ids = cursor['seen_ids'] if cursor else set()
+    resy_page = cursor['page'] if cursor else 1
+    first_page = resy_page
+    last_page = first_page + max_fetches - 1
     total_resy_results = 0
     hits = []  # Initialize for has_more check
 
@@ -341,68 +564,132 @@ def fetch_until_enough_results(
     if target_count == 0:
         return [], 0, False
 
-    for _ in range(max_fetches):
-        print(f"[FETCH] Fetching Resy page {resy_page} (have {len(all_results)}/{target_count} filtered results)")
+    def paced_search(page):
+        _search_limiter.acquire()
+        return search_func(page)
+
+    def start_batch(start):
+        pages = range(start, min(start + next_batch_size, last_page + 1))
+        return pages, [executor.submit(paced_search, page) for page in pages]
+
+    workers = batch_size * 2 if prefetch else batch_size
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    next_batch_size = batch_size
+    # Pages (and their futures) requested ahead of the current batch
+    prefetched_pages, prefetched_futures = range(0), []
+    done = False
+    truncated = False
+    try:
+        while not done and resy_page <= last_page:
+            if prefetched_futures and prefetched_pages.start == resy_page:
+                batch_pages, futures = prefetched_pages, prefetched_futures
+            elif executor:
+                batch_pages, futures = start_batch(resy_page)
+            else:
+                batch_pages = range(resy_page, resy_page + 1)
+                futures = None
+            prefetched_pages, prefetched_futures = range(0), []
+            print(
+                f"[FETCH] Fetching Resy page(s) {list(batch_pages)} "
+                f"(have {len(all_results)}/{target_count} filtered results)"
+            )
 
-        # Fetch from Resy API
-        hits, resy_total = search_func(resy_page)
+            # Fetch from Resy API (results come back in page order)
+            if futures is not None:
+                batch = [future.result() for future in futures]
+            else:
+                batch = [paced_search(page) for page in batch_pages]
+
+            # Start on the following pages while this batch is filtered; a short or
+            # empty page means Resy has run out, so there is nothing to prefetch
+            full_pages = all(len(page_hits) >= 20 for page_hits, _ in batch)
+            if prefetch and full_pages and batch_pages.stop <= last_page:
+                prefetched_pages, prefetched_futures = start_batch(batch_pages.stop)
+
+            for hits, resy_total in batch:
+                if not hits:
+                    print("[FETCH] No more results from Resy API")
+                    done = True
+                    break
 
-        if not hits:
-            print("[FETCH] No more results from Resy API")
-            break
+                # Filter and format
+                page_results, filtered_count, seen_ids = filter_and_format_venues(
+                    hits, filters, seen_ids, config=config, fetch_availability=fetch_availability,
+                    limit=target_count - len(all_results)
+                )
+                truncated = bool(filtered_count.get('unchecked'))
+                all_results.extend(page_results)
+                total_resy_results = resy_total
 
-        # Filter and format
-        page_results, filtered_count, seen_ids = filter_and_format_venues(
-            hits, filters, seen_ids, config=config, fetch_availability=fetch_availability
-        )
-        all_results.extend(page_results)
-        total_resy_results = resy_total
-
-        log_msg = f"Page {resy_page}: {len(hits)} hits, {len(page_results)} passed filters, {len(all_results)} total"
-        print(f"[FETCH] {log_msg}")
-        print(f"[FETCH] Filtered counts: {filtered_count}")
-
-        # Update Firestore progress
-        if job_id:
-            update_search_progress(job_id, {
-                "status": "running",
-                "stage": "fetching_resy",
-                "pagesFetched": resy_page,
-                "filteredCount": len(all_results),
-                "lastLog": log_msg,
-            })
-
-        # Check if we have enough
-        if len(all_results) >= target_count:
-            break
-
-        # Check if Resy has more results
-        # Note: Resy API sometimes reports incorrect totals, so we try a few pages
-        # even if it says there are fewer results
-        if len(hits) < 20:  # Resy returns 20 per page by default
-            # If we got fewer than 20 hits, try one more page just in case
-            # (Resy API sometimes has incorrect pagination info)
-            if resy_page == 1 and len(hits) > 0:
-                print(
-                    f"[FETCH] Resy returned {len(hits)} hits on page 1, "
-                    f"but trying page 2 in case API pagination is incorrect"
+                log_msg = (
+                    f"Page {resy_page}: {len(hits)} hits, {len(page_results)} passed filters, "
+                    f"{len(all_results)} total"
                 )
+                print(f"[FETCH] {log_msg}")
+                print(f"[FETCH] Filtered counts: {filtered_count}")
+
+                # Update Firestore progress
+                if progress:
+                    progress.update({
+                        "status": "running",
+                        "stage": "fetching_resy",
+                        "pagesFetched": resy_page,
+                        "filteredCount": len(all_results),
+                        "lastLog": log_msg,
+                    })
+
+                # Check if we have enough
+                if len(all_results) >= target_count:
+                    done = True
+                    break
+
+                # Check if Resy has more results
+                # Note: Resy API sometimes reports incorrect totals, so we try a few pages
+                # even if it says there are fewer results
+                if len(hits) < 20:  # Resy returns 20 per page by default
+                    # If we got fewer than 20 hits, try one more page just in case
+                    # (Resy API sometimes has incorrect pagination info)
+                    if resy_page == first_page == 1 and len(hits) > 0:
+                        print(
+                            f"[FETCH] Resy returned {len(hits)} hits on page 1, "
+                            f"but trying page 2 in case API pagination is incorrect"
+                        )
+                        resy_page += 1
+                        continue
+                    else:
+                        print("[FETCH] Resy returned fewer than 20 results, no more available")
+                        done = True
+                        break
+
                 resy_page += 1
-                continue
-            else:
-                print("[FETCH] Resy returned fewer than 20 results, no more available")
-                break
 
-        resy_page += 1
+            # Size the next batch from the pass rate so far, so sparse filters fan
+            # out wider and nearly-satisfied searches don't over-fetch
+            if executor and all_results:
+                pages_done = resy_page - first_page
+                remaining = target_count - len(all_results)
+                pages_needed = -(-remaining * pages_done // len(all_results))
+                next_batch_size = max(1, min(batch_size, pages_needed))
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    if cursor is not None:
+        # Stopping early leaves resy_page on the last processed page; if that page
+        # still has unchecked venues, resume from it so they get checked
+        cursor['page'] = resy_page + 1 if done and not truncated else resy_page
+        cursor['seen_ids'] = seen_ids
 
     # Calculate has_more:
+    # - If the last page was cut short once the target was met, its rest is still unchecked
     # - If we got more results than target, definitely more available
     # - If we got exactly 20 hits on the last page, might be more
     # - If we reached max_fetches without getting enough results, assume more might exist
     has_more = (
+        truncated or
         len(all_results) > target_count or
-        (len(hits) == 20 and resy_page <= max_fetches) or
-        (len(all_results) < target_count and resy_page > max_fetches)
+        (len(hits) == 20 and resy_page <= last_page) or
+        (len(all_results) < target_count and resy_page > last_page)
     )
 
     return all_results, total_resy_results, has_more
@@ -412,6 +699,10 @@ def build_search_payload(query, filters, geo_config, page=1):
     """
     Build Resy API search payload
 
+    Search endpoints build this once per request and vary only the page
+    (via model_copy on the validated request body), so the geo block and
+    filters are never rebuilt per page.
+
     Args:
         query: Search query string
         filters: Dict of parsed filters from parse_search_filters()
@@ -430,7 +721,10 @@ def build_search_payload(query, filters, geo_config, page=1):
     # (Resy API may limit results when availability filters are set)
     # For bounding box searches, also try 50 to see if API respects it better
     base_per_page = filters.get('per_page', 20)
-    if filters.get('available_only') and filters.get('available_day') and filters.get('available_party_size'):
+    has_slot_filter = bool(
+        filters.get('available_only') and filters.get('available_day') and filters.get('available_party_size')
+    )
+    if has_slot_filter:
         # When slot_filter is active, use max(50, user's per_page) to try to get more results
         per_page = max(50, base_per_page)
     elif 'bounding_box' in geo_config:
@@ -455,7 +749,7 @@ def build_search_payload(query, filters, geo_config, page=1):
     }
 
     # Add slot_filter if available_only is enabled
-    if filters.get('available_only') and filters.get('available_day') and filters.get('available_party_size'):
+    if has_slot_filter:
         payload['slot_filter'] = {
             'day': filters['available_day'],
             'party_size': filters['available_party_size']
@@ -464,15 +758,43 @@ def build_search_payload(query, filters, geo_config, page=1):
     return payload
 
 
-def get_venue_availability(venue_id, day, party_size, config):
+def clear_availability_cache():
+    """Drop every cached venue availability result."""
+    with _availability_cache_lock:
+        AVAILABILITY_CACHE.clear()
+
+
+def _cached_availability(key, fetch):
+    """Return the cached availability for key, calling fetch() on a miss.
+
+    Results whose status means the lookup failed are returned but not cached.
+    Callers get their own copy, since formatted venues hold on to 'times'.
+    """
+    with _availability_cache_lock:
+        availability = AVAILABILITY_CACHE.get(key)
+    if availability is None:
+        availability = fetch()
+        if availability['status'] in _UNCACHED_AVAILABILITY_STATUSES:
+            return availability
+        with _availability_cache_lock:
+            AVAILABILITY_CACHE[key] = availability
+    return {'times': list(availability['times']), 'status': availability['status']}
+
+
+def get_venue_availability(venue_id, day, party_size, config, client=None):
     """
     Fetch available time slots for a specific venue via resy_client.
 
+    Results are cached in-process for AVAILABILITY_CACHE_TTL seconds per
+    (venue, day, party size); availability does not depend on whose
+    credentials are in config.
+
     Args:
         venue_id: The venue ID
         day: Date in YYYY-MM-DD format
         party_size: Number of people
         config: ResyConfig object or dict
+        client: Optional prebuilt ResyApiAccess to reuse across a fan-out
 
     Returns:
         Dict with 'times' (list of time strings) and 'status' (reason if no times available)
@@ -481,12 +803,20 @@ def get_venue_availability(venue_id, day, party_size, config):
         Example: {'times': [], 'status': 'Sold out'}
         Example: {'times': [], 'status': 'Not released yet'}
     """
+    return _cached_availability(
+        ('slots', str(venue_id), day, str(party_size)),
+        lambda: _fetch_venue_availability(venue_id, day, party_size, config, client),
+    )
+
+
+def _fetch_venue_availability(venue_id, day, party_size, config, client=None):
+    """Uncached body of get_venue_availability."""
     from .resy_client.errors import ResyApiError, ResyTransientError
 
+    _availability_limiter.acquire()
     try:
-        if isinstance(config, dict):
-            config = ResyConfig(**config)
-        client = build_resy_client(config)
+        if client is None:
+            client = build_resy_client(config)
 
         target_date = datetime.strptime(day, '%Y-%m-%d').date()
         calendar_params = CalendarRequestParams(
@@ -601,7 +931,7 @@ def get_venue_availability(venue_id, day, party_size, config):
         return {'times': [], 'status': 'Unable to fetch'}
 
 
-def filter_and_format_venues(hits, filters, seen_ids=None, config=None, fetch_availability=False):
+def filter_and_format_venues(hits, filters, seen_ids=None, config=None, fetch_availability=False, limit=None):
     """
     Apply client-side filters and format venue results
 
@@ -611,12 +941,13 @@ def filter_and_format_venues(hits, filters, seen_ids=None, config=None, fetch_av
         seen_ids: Set of venue IDs we've already processed (to avoid duplicates)
         config: ResyConfig object (required if fetch_availability is True)
         fetch_availability: Whether to fetch available time slots for each venue
+        limit: Optional number of venues needed. Availability checking stops once
+            this many pass; venues left unchecked are removed from seen_ids and
+            counted in filtered_count['unchecked'].
 
     Returns:
         tuple: (results list, filtered_count dict, seen_ids set)
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    
     results = []
     filtered_count = {'cuisine': 0, 'price': 0, 'duplicate': 0, 'availability': 0}
     if seen_ids is None:
@@ -686,50 +1017,58 @@ def filter_and_format_venues(hits, filters, seen_ids=None, config=None, fetch_av
         # Fetch availability for all candidates in parallel
         # Use 10 workers for better throughput (Resy can handle it for calendar checks)
         max_workers = 10 if not_released_only else 5
-        availability_map = {}
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_venue = {
+        check_availability = get_venue_availability_fast if not_released_only else get_venue_availability
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
                 executor.submit(
-                    get_venue_availability_fast if not_released_only else get_venue_availability,
+                    check_availability,
                     venue_id,
                     filters['available_day'],
                     filters['available_party_size'],
                     config
-                ): venue_id
+                )
                 for venue_id, _ in candidates
-            }
-            
-            for future in as_completed(future_to_venue):
-                venue_id = future_to_venue[future]
+            ]
+
+            # Apply availability data and filter, in page order
+            for index, ((venue_id, result), future) in enumerate(zip(candidates, futures)):
                 try:
-                    availability_map[venue_id] = future.result()
+                    availability_data = future.result()
                 except Exception as e:
                     print(f"[AVAILABILITY] Parallel fetch error for venue {venue_id}: {e}")
-                    availability_map[venue_id] = {'times': [], 'status': 'Unable to fetch'}
-        
-        # Apply availability data and filter
-        for venue_id, result in candidates:
-            availability_data = availability_map.get(venue_id, {'times': [], 'status': 'Unable to fetch'})
-            
-            # Add availability data to result
-            if availability_data['times']:
-                result['availableTimes'] = availability_data['times']
-            elif availability_data['status']:
-                result['availabilityStatus'] = availability_data['status']
-
-            # If available_only filter is enabled, skip venues without available times
-            if available_only and not availability_data['times']:
-                filtered_count['availability'] = filtered_count.get('availability', 0) + 1
-                continue
+                    availability_data = {'times': [], 'status': 'Unable to fetch'}
 
-            # If not_released_only filter is enabled, skip venues that are not "Not released yet"
-            if not_released_only:
-                if availability_data['status'] != 'Not released yet':
-                    filtered_count['not_released'] = filtered_count.get('not_released', 0) + 1
+                # Add availability data to result
+                if availability_data['times']:
+                    result['availableTimes'] = availability_data['times']
+                elif availability_data['status']:
+                    result['availabilityStatus'] = availability_data['status']
+
+                # If available_only filter is enabled, skip venues without available times
+                if available_only and not availability_data['times']:
+                    filtered_count['availability'] = filtered_count.get('availability', 0) + 1
                     continue
 
-            results.append(result)
+                # If not_released_only filter is enabled, skip venues that are not "Not released yet"
+                if not_released_only:
+                    if availability_data['status'] != 'Not released yet':
+                        filtered_count['not_released'] = filtered_count.get('not_released', 0) + 1
+                        continue
+
+                results.append(result)
+
+                # Enough venues passed: skip the checks still queued and leave the
+                # unchecked venues unseen so a resumed fetch picks them up again
+                if limit is not None and len(results) >= limit:
+                    unchecked = candidates[index + 1:]
+                    if unchecked:
+                        filtered_count['unchecked'] = len(unchecked)
+                        seen_ids.difference_update(unchecked_id for unchecked_id, _ in unchecked)
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
     else:
         # No availability check needed, just add all candidates
         results = [result for _, result in candidates]
@@ -741,12 +1080,22 @@ def get_venue_availability_fast(venue_id, day, party_size, config):
     """
     Fast availability check - only uses calendar API via resy_client.
     Does NOT fetch actual time slots. Use for "not_released_only" filtering.
+    Cached like get_venue_availability, under its own keys.
 
     Returns:
         Dict with 'times' (always empty) and 'status' (release/availability status)
     """
+    return _cached_availability(
+        ('calendar', str(venue_id), day, str(party_size)),
+        lambda: _fetch_venue_calendar_status(venue_id, day, party_size, config),
+    )
+
+
+def _fetch_venue_calendar_status(venue_id, day, party_size, config):
+    """Uncached body of get_venue_availability_fast."""
     from .resy_client.errors import ResyApiError, ResyTransientError
 
+    _availability_limiter.acquire()
     try:
         if isinstance(config, dict):
             config = ResyConfig(**config)
@@ -24,7 +24,7 @@ from .resy_client.api_access import build_resy_client
 from .resy_client.errors import ResyApiError
 from .resy_client.models import CalendarRequestParams, FindRequestBody
 from .sentry_utils import with_sentry_trace
-from .utils import GOOGLE_MAPS_API_KEY, _get_firestore_client, load_credentials
+from .utils import GOOGLE_MAPS_API_KEY, get_firestore_client, load_credentials
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -318,7 +318,7 @@ def check_venue_payment_requirement(req: Request):
             resp, code = error_response('Missing venue_id', 400)
             return resp, code
 
-        db = _get_firestore_client()
+        db = get_firestore_client()
         venue_doc = db.collection('venues').document(venue_id).get()
 
         if venue_doc.exists: